@@ -4,9 +4,15 @@ from dataclasses import dataclass
 from decimal import Decimal
 
 from money_dahong.exchange.binance_spot import Kline
+from money_dahong.math_utils import trailing_stop_hit
 from money_dahong.strategies.base import Strategy, StrategyContext
 from money_dahong.types import Signal
 
+_D0 = Decimal("0")
+_D1 = Decimal("1")
+_D100 = Decimal("100")
+_D10000 = Decimal("10000")
+
 
 @dataclass(frozen=True)
 class Trade:
@@ -31,12 +37,13 @@ class BacktestResult:
     end_equity_usdt: Decimal
     return_pct: Decimal
     max_drawdown_pct: Decimal
+    winning_trades: int = 0
 
 
 def _pct(numerator: Decimal, denominator: Decimal) -> Decimal:
     if denominator == 0:
-        return Decimal("0")
-    return (numerator / denominator) * Decimal("100")
+        return _D0
+    return (numerator / denominator) * _D100
 
 
 class Backtester:
@@ -70,32 +77,48 @@ class Backtester:
         self._trailing_stop_enabled = trailing_stop_enabled
         self._trailing_start_profit_pct = trailing_start_profit_pct
         self._trailing_drawdown_pct = trailing_drawdown_pct
+        self._arm_factor = 1 + trailing_start_profit_pct / _D100
+        self._stop_factor = 1 - trailing_drawdown_pct / _D100
         if self._slippage_bps < 0:
             raise ValueError("slippage_bps must be >= 0")
-        if self._slippage_bps >= Decimal("10000"):
+        if self._slippage_bps >= _D10000:
             raise ValueError("slippage_bps must be < 10000")
 
         self._cash = initial_cash_usdt
-        self._qty = Decimal("0")
+        self._qty = _D0
         self._in_position = False
 
         self.trades: list[Trade] = []
+        self._record_trades = True
+        self._trade_count = 0
+        self._win_count = 0
         self._entry_time_ms = 0
-        self._entry_price = Decimal("0")
-        self._entry_qty = Decimal("0")
-        self._entry_total_usdt = Decimal("0")
-        self._peak_price = Decimal("0")
-
-    def run(self, *, klines: list[Kline]) -> BacktestResult:
+        self._entry_price = _D0
+        self._entry_qty = _D0
+        self._entry_total_usdt = _D0
+        self._peak_price = _D0
+        self._arm_price = _D0
+        self._stop_price = _D0
+
+    def run(self, *, klines: list[Kline], record_trades: bool = True) -> BacktestResult:
+        """
+        record_trades=False skips building per-trade `Trade` rows (e.g. grid search, which
+        only needs the counts on `BacktestResult`); `self.trades` stays empty.
+        """
         # Reset state for a fresh run.
+        self._record_trades = record_trades
+        self._trade_count = 0
+        self._win_count = 0
         self._cash = self._initial_cash
-        self._qty = Decimal("0")
+        self._qty = _D0
         self._in_position = False
         self._entry_time_ms = 0
-        self._entry_price = Decimal("0")
-        self._entry_qty = Decimal("0")
-        self._entry_total_usdt = Decimal("0")
-        self._peak_price = Decimal("0")
+        self._entry_price = _D0
+        self._entry_qty = _D0
+        self._entry_total_usdt = _D0
+        self._peak_price = _D0
+        self._arm_price = _D0
+        self._stop_price = _D0
 
         closed = klines[:-1] if len(klines) > 1 else []
         if not closed:
@@ -106,18 +129,21 @@ class Backtester:
                 trades=0,
                 start_equity_usdt=self._initial_cash,
                 end_equity_usdt=self._initial_cash,
-                return_pct=Decimal("0"),
-                max_drawdown_pct=Decimal("0"),
+                return_pct=_D0,
+                max_drawdown_pct=_D0,
             )
 
         self.trades = []
 
         start_equity = self._initial_cash
         peak_equity = start_equity
-        max_drawdown_pct = Decimal("0")
+        max_drawdown_pct = _D0
 
-        window: list[Kline] = []
-        for k in closed:
+        # The strategy only sees full windows, so until the first `lookback_bars` have closed no
+        # position can open and equity stays at the start; those bars just seed the window.
+        warmup = min(max(0, self._lookback_bars - 1), len(closed))
+        window: list[Kline] = closed[:warmup]
+        for k in closed[warmup:]:
             window.append(k)
             if len(window) > self._lookback_bars:
                 window = window[-self._lookback_bars :]
@@ -125,9 +151,9 @@ class Backtester:
             exited_this_bar = False
             if self._in_position and self._trailing_stop_enabled:
                 if self._peak_price <= 0:
-                    self._peak_price = self._entry_price
+                    self._set_peak(self._entry_price)
                 if k.close > self._peak_price:
-                    self._peak_price = k.close
+                    self._set_peak(k.close)
                 if self._should_trailing_stop_exit(price=k.close):
                     self._apply_exit(price=k.close, time_ms=k.close_time_ms, reason="trailing_stop")
                     exited_this_bar = True
@@ -143,32 +169,38 @@ class Backtester:
                     self._apply_signal(signal=signal, price=k.close, time_ms=k.close_time_ms)
 
             equity = self._cash + (self._qty * k.close)
-            if equity > peak_equity:
+            if equity >= peak_equity:
+                # No drawdown at a new high; only bars below the peak pay for the division.
                 peak_equity = equity
-            dd = _pct(peak_equity - equity, peak_equity)
-            if dd > max_drawdown_pct:
-                max_drawdown_pct = dd
+            else:
+                dd = _pct(peak_equity - equity, peak_equity)
+                if dd > max_drawdown_pct:
+                    max_drawdown_pct = dd
 
         end_equity = self._cash + (self._qty * closed[-1].close)
         return BacktestResult(
             symbol=self._symbol,
             interval=self._interval,
             bars=len(closed),
-            trades=len(self.trades),
+            trades=self._trade_count,
             start_equity_usdt=start_equity,
             end_equity_usdt=end_equity,
             return_pct=_pct(end_equity - start_equity, start_equity),
             max_drawdown_pct=max_drawdown_pct,
+            winning_trades=self._win_count,
         )
 
     def _should_trailing_stop_exit(self, *, price: Decimal) -> bool:
-        if self._entry_price <= 0 or self._peak_price <= 0:
-            return False
-        peak_profit_pct = _pct(self._peak_price - self._entry_price, self._entry_price)
-        if peak_profit_pct < self._trailing_start_profit_pct:
-            return False
-        drawdown_pct = _pct(self._peak_price - price, self._peak_price)
-        return drawdown_pct >= self._trailing_drawdown_pct
+        return trailing_stop_hit(
+            arm_price=self._arm_price,
+            stop_price=self._stop_price,
+            peak_price=self._peak_price,
+            price=price,
+        )
+
+    def _set_peak(self, price: Decimal) -> None:
+        self._peak_price = price
+        self._stop_price = price * self._stop_factor
 
     def _apply_signal(self, *, signal: Signal, price: Decimal, time_ms: int) -> None:
         if signal.side == "BUY":
@@ -194,7 +226,8 @@ class Backtester:
             self._entry_price = entry_price
             self._entry_qty = qty
             self._entry_total_usdt = total
-            self._peak_price = entry_price
+            self._arm_price = entry_price * self._arm_factor
+            self._set_peak(entry_price)
             return
 
         if signal.side == "SELL":
@@ -211,12 +244,12 @@ class Backtester:
         if self._position_sizing == "cash_fraction":
             allocation = self._cash * self._cash_fraction
             if allocation <= 0:
-                return Decimal("0"), Decimal("0"), Decimal("0")
+                return _D0, _D0, _D0
             if self._fee_rate < 0:
-                return Decimal("0"), Decimal("0"), Decimal("0")
+                return _D0, _D0, _D0
             # Make total == allocation (i.e., fraction includes fees).
             cost = (
-                allocation / (Decimal("1") + self._fee_rate) if self._fee_rate != 0 else allocation
+                allocation / (_D1 + self._fee_rate) if self._fee_rate != 0 else allocation
             )
             fee = cost * self._fee_rate
             total = cost + fee
@@ -241,38 +274,44 @@ class Backtester:
         exit_total = proceeds - fee
         self._cash += exit_total
 
-        max_runup_pct = (
-            _pct(self._peak_price - self._entry_price, self._entry_price)
-            if self._entry_price > 0 and self._peak_price > 0
-            else Decimal("0")
-        )
         pnl = exit_total - self._entry_total_usdt
-        self.trades.append(
-            Trade(
-                entry_time_ms=self._entry_time_ms,
-                exit_time_ms=time_ms,
-                side="LONG",
-                exit_reason=reason,
-                entry_price=self._entry_price,
-                exit_price=exit_price,
-                quantity=self._entry_qty,
-                pnl_usdt=pnl,
-                max_runup_pct=max_runup_pct,
+        self._trade_count += 1
+        if pnl > 0:
+            self._win_count += 1
+        if self._record_trades:
+            max_runup_pct = (
+                _pct(self._peak_price - self._entry_price, self._entry_price)
+                if self._entry_price > 0 and self._peak_price > 0
+                else _D0
+            )
+            self.trades.append(
+                Trade(
+                    entry_time_ms=self._entry_time_ms,
+                    exit_time_ms=time_ms,
+                    side="LONG",
+                    exit_reason=reason,
+                    entry_price=self._entry_price,
+                    exit_price=exit_price,
+                    quantity=self._entry_qty,
+                    pnl_usdt=pnl,
+                    max_runup_pct=max_runup_pct,
+                )
             )
-        )
 
-        self._qty = Decimal("0")
+        self._qty = _D0
         self._in_position = False
         self._entry_time_ms = 0
-        self._entry_price = Decimal("0")
-        self._entry_qty = Decimal("0")
-        self._entry_total_usdt = Decimal("0")
-        self._peak_price = Decimal("0")
+        self._entry_price = _D0
+        self._entry_qty = _D0
+        self._entry_total_usdt = _D0
+        self._peak_price = _D0
+        self._arm_price = _D0
+        self._stop_price = _D0
 
     def _fill_price(self, *, price: Decimal, side: str) -> Decimal:
         if price <= 0 or self._slippage_bps <= 0:
             return price
-        ratio = self._slippage_bps / Decimal("10000")
+        ratio = self._slippage_bps / _D10000
         if side == "BUY":
-            return price * (Decimal("1") + ratio)
-        return price * (Decimal("1") - ratio)
+            return price * (_D1 + ratio)
+        return price * (_D1 - ratio)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from decimal import Decimal
+from pathlib import Path
+
+from money_dahong.exchange.binance_spot import Kline
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "money-dahong" / "klines"
+
+
+def kline_cache_path(
+    *,
+    cache_dir: Path,
+    symbol: str,
+    interval: str,
+    limit: int,
+    start_time_ms: int | None,
+    end_time_ms: int | None,
+) -> Path:
+    start = "-" if start_time_ms is None else str(start_time_ms)
+    end = "-" if end_time_ms is None else str(end_time_ms)
+    return cache_dir / f"{symbol.upper()}_{interval}_{limit}_{start}_{end}.json"
+
+
+def read_kline_cache(path: Path, *, max_age_seconds: float | None) -> list[Kline] | None:
+    """
+    Returns cached klines, or None when the file is missing, stale or unreadable.
+
+    max_age_seconds=None means the cached window is immutable and never expires.
+    """
+    try:
+        if max_age_seconds is not None and time.time() - path.stat().st_mtime > max_age_seconds:
+            return None
+        rows = json.loads(path.read_bytes())
+        return [
+            Kline(
+                open_time_ms=int(row[0]),
+                open=Decimal(row[1]),
+                high=Decimal(row[2]),
+                low=Decimal(row[3]),
+                close=Decimal(row[4]),
+                volume=Decimal(row[5]),
+                close_time_ms=int(row[6]),
+            )
+            for row in rows
+        ]
+    except (OSError, ValueError, TypeError, IndexError, ArithmeticError):
+        return None
+
+
+def write_kline_cache(path: Path, klines: list[Kline]) -> None:
+    # Same row layout as Binance `/api/v3/klines` so the file is easy to inspect.
+    rows = [
+        [
+            k.open_time_ms,
+            str(k.open),
+            str(k.high),
+            str(k.low),
+            str(k.close),
+            str(k.volume),
+            k.close_time_ms,
+        ]
+        for k in klines
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(rows, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, path)
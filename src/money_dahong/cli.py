@@ -2,39 +2,122 @@ from __future__ import annotations
 
 import asyncio
 import csv
+import importlib
 import logging
+from collections.abc import Coroutine
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from decimal import ROUND_HALF_UP, Decimal
 from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
 
 import typer
 
-from money_dahong.backtest.engine import Backtester, Trade
-from money_dahong.config.ema_cross import load_ema_cross_run_config
-from money_dahong.config.ma_cross import load_ma_cross_backtest_config
-from money_dahong.engine.trader import Trader
-from money_dahong.exchange import BinanceSpotClient
-from money_dahong.exchange.binance_spot import Kline
+from money_dahong.json_utils import dumps_line
 from money_dahong.logging_utils import configure_logging
-from money_dahong.notifications.telegram import TelegramNotifier
-from money_dahong.settings import Settings
-from money_dahong.strategies.ema_cross import EmaCrossParams, EmaCrossStrategy
-from money_dahong.strategies.ma_cross import MaCrossParams, MaCrossStrategy
-
+from money_dahong.types import MaType
+
+if TYPE_CHECKING:
+    from money_dahong.backtest.engine import Trade
+    from money_dahong.config.ma_cross import MaCrossBacktestConfig
+    from money_dahong.engine import Trader
+    from money_dahong.exchange import BinanceSpotClient
+    from money_dahong.exchange.binance_spot import Kline
+    from money_dahong.settings import Settings
+
+try:
+    _uvloop: ModuleType | None = importlib.import_module("uvloop")
+except ImportError:  # optional speedup, installed with the `fast` extra
+    _uvloop = None
+
+# pydantic/httpx-backed modules are imported inside the commands that need them so that
+# `--help` and `config-init` start without paying for them.
 app = typer.Typer(no_args_is_help=True, add_completion=False)
 logger = logging.getLogger("money_dahong")
 
-def _q(value: Decimal, pattern: str) -> Decimal:
-    return value.quantize(Decimal(pattern), rounding=ROUND_HALF_UP)
-
-
+# Large write buffer so big trade/grid exports flush in a few syscalls.
+_CSV_BUFFER_BYTES = 1 << 20
+# Binance caps `/api/v3/klines` at 1000 rows per request; keep concurrent pages low for
+# request-weight limits.
+_KLINES_PAGE_LIMIT = 1000
+_KLINES_PAGE_CONCURRENCY = 4
+# Windows that reach "now" keep changing; cache them only briefly.
+_KLINES_CACHE_TTL_SECONDS = 60.0
+
+# Long-running traders queue Telegram messages and coalesce bursts (e.g. a fill plus an
+# error) so the tick loop never waits on the Telegram round-trip.
+_TRADER_TELEGRAM_BATCH_SECONDS = 0.25
+
+_D0 = Decimal("0")
+_D100 = Decimal("100")
+_Q_CENT = Decimal("0.01")
+
+_BACKTEST_TELEGRAM_TEMPLATE = """\
+回测完成
+{symbol} | {interval} | {ma_label}({fast},{slow})
+区间: {period_start} ~ {period_end}
+K线: {bars} 交易: {trades} 胜率: {win_rate}%
+离场: Trailing {trailing_exits} | 死叉 {cross_exits}
+峰值浮盈: avg {avg_runup}% max {max_runup}%
+收益: {pnl} USDT ({return_pct}%) 期末: {end_equity}
+最大回撤: {max_drawdown}%
+仓位: {position}
+离场保护: {trailing}
+成本: fee {fee_pct}% | slippage {slippage_pct}% ({slippage_bps} bps)
+请求区间: {requested_start} ~ {requested_end}
+交易明细: {trades_csv}
+配置: {config}"""
+
+
+def _q(value: Decimal) -> Decimal:
+    return value.quantize(_Q_CENT, rounding=ROUND_HALF_UP)
+
+
+# Summary figures stay Decimal + ROUND_HALF_UP so they agree with the JSON payload; a float
+# `:.2f` would round half-to-even on binary approximations (e.g. 0.125 -> "0.12").
 def _fmt_pct(value: Decimal) -> str:
-    return f"{_q(value, '0.01')}"
+    return str(_q(value))
 
 
 def _fmt_usdt(value: Decimal) -> str:
-    return f"{_q(value, '0.01')}"
+    return str(_q(value))
+
+
+def _run_async(main: Coroutine[Any, Any, None]) -> None:
+    """
+    Run a command's coroutine on uvloop when installed, the stdlib loop otherwise.
+    """
+    if _uvloop is not None:
+        _uvloop.run(main)
+        return
+    asyncio.run(main)
+
+
+def _binance_client(settings: Settings) -> BinanceSpotClient:
+    """
+    One client (and httpx connection pool) per command; every request in the command reuses
+    it. Usable as `async with _binance_client(settings) as client:`.
+    """
+    from money_dahong.exchange import BinanceSpotClient
+
+    return BinanceSpotClient(
+        api_key=settings.binance_api_key,
+        api_secret=settings.binance_api_secret,
+    )
+
+
+def _emit(payload: dict[str, Any]) -> None:
+    """
+    Print one JSON line (orjson when installed, stdlib json otherwise).
+    """
+    typer.echo(dumps_line(payload))
+
+
+def _win_rate_pct(*, wins: int, trades: int) -> Decimal:
+    if trades <= 0:
+        return _D0
+    return (Decimal(wins) / Decimal(trades)) * _D100
 
 
 def _ms_to_utc(ts_ms: int) -> str:
@@ -52,9 +135,49 @@ class GridResultRow:
     end_equity_usdt: Decimal
 
 
+@dataclass(frozen=True)
+class TradeStats:
+    trades: int
+    wins: int
+    trailing_exits: int
+    cross_exits: int
+    win_rate_pct: Decimal
+    avg_runup_pct: Decimal
+    max_runup_pct: Decimal
+
+
+def _summarize_trades(trades: list[Trade]) -> TradeStats:
+    # Single pass over the trades for every summary statistic.
+    n = wins = trailing_exits = cross_exits = 0
+    runup_sum = _D0
+    runup_max = _D0
+    for t in trades:
+        n += 1
+        if t.pnl_usdt > 0:
+            wins += 1
+        exit_reason = t.exit_reason
+        if exit_reason == "trailing_stop":
+            trailing_exits += 1
+        elif exit_reason == "cross_down":
+            cross_exits += 1
+        runup = t.max_runup_pct
+        runup_sum += runup
+        if runup > runup_max:
+            runup_max = runup
+    return TradeStats(
+        trades=n,
+        wins=wins,
+        trailing_exits=trailing_exits,
+        cross_exits=cross_exits,
+        win_rate_pct=_win_rate_pct(wins=wins, trades=n),
+        avg_runup_pct=runup_sum / Decimal(n) if n else _D0,
+        max_runup_pct=runup_max,
+    )
+
+
 def _write_trades_csv(*, path: Path, trades: list[Trade]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8", newline="") as f:
+    with path.open("w", encoding="utf-8", newline="", buffering=_CSV_BUFFER_BYTES) as f:
         writer = csv.writer(f)
         writer.writerow(
             [
@@ -71,27 +194,27 @@ def _write_trades_csv(*, path: Path, trades: list[Trade]) -> None:
                 "max_runup_pct",
             ]
         )
-        for t in trades:
-            writer.writerow(
-                [
-                    t.entry_time_ms,
-                    _ms_to_utc(t.entry_time_ms),
-                    t.exit_time_ms,
-                    _ms_to_utc(t.exit_time_ms),
-                    t.side,
-                    t.exit_reason,
-                    str(t.entry_price),
-                    str(t.exit_price),
-                    str(t.quantity),
-                    str(t.pnl_usdt),
-                    str(t.max_runup_pct),
-                ]
-            )
+        writer.writerows(
+            [
+                t.entry_time_ms,
+                _ms_to_utc(t.entry_time_ms),
+                t.exit_time_ms,
+                _ms_to_utc(t.exit_time_ms),
+                t.side,
+                t.exit_reason,
+                str(t.entry_price),
+                str(t.exit_price),
+                str(t.quantity),
+                str(t.pnl_usdt),
+                str(t.max_runup_pct),
+            ]
+            for t in trades
+        )
 
 
 def _write_grid_results_csv(*, path: Path, rows: list[GridResultRow]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8", newline="") as f:
+    with path.open("w", encoding="utf-8", newline="", buffering=_CSV_BUFFER_BYTES) as f:
         writer = csv.writer(f)
         writer.writerow(
             [
@@ -105,19 +228,40 @@ def _write_grid_results_csv(*, path: Path, rows: list[GridResultRow]) -> None:
                 "end_equity_usdt",
             ]
         )
-        for i, row in enumerate(rows, start=1):
-            writer.writerow(
-                [
-                    i,
-                    row.fast,
-                    row.slow,
-                    row.trades,
-                    str(row.win_rate_pct),
-                    str(row.return_pct),
-                    str(row.max_drawdown_pct),
-                    str(row.end_equity_usdt),
-                ]
-            )
+        writer.writerows(
+            [
+                i,
+                row.fast,
+                row.slow,
+                row.trades,
+                str(row.win_rate_pct),
+                str(row.return_pct),
+                str(row.max_drawdown_pct),
+                str(row.end_equity_usdt),
+            ]
+            for i, row in enumerate(rows, start=1)
+        )
+
+
+def _parse_symbol_list(*, value: str | None, fallback: str) -> list[str]:
+    if value is None or not value.strip():
+        return [fallback]
+    # Keep order, remove duplicates.
+    symbols = dict.fromkeys(t.strip().upper() for t in value.split(",") if t.strip())
+    if not symbols:
+        raise ValueError("--symbols is empty")
+    return list(symbols)
+
+
+async def _run_traders(runs: list[tuple[Trader, str]], *, interval: str) -> None:
+    if len(runs) == 1:
+        trader, symbol = runs[0]
+        await trader.run(symbol=symbol, interval=interval)
+        return
+    # One symbol failing to start (e.g. unknown on the exchange) stops the others too.
+    async with asyncio.TaskGroup() as tg:
+        for trader, symbol in runs:
+            tg.create_task(trader.run(symbol=symbol, interval=interval))
 
 
 def _parse_period_list(*, value: str | None, option_name: str, fallback: int) -> list[int]:
@@ -194,26 +338,399 @@ async def _load_backtest_klines(
             end_time_ms=end_time_ms,
         )
 
-    collected: list[Kline] = []
-    next_start_ms = start_time_ms
-    while len(collected) < limit:
-        batch_limit = min(1000, limit - len(collected))
+    first = await client.klines(
+        symbol=symbol,
+        interval=interval,
+        limit=min(_KLINES_PAGE_LIMIT, limit),
+        start_time_ms=start_time_ms,
+        end_time_ms=end_time_ms,
+    )
+    if len(first) < min(_KLINES_PAGE_LIMIT, limit) or len(first) >= limit:
+        return first[:limit]
+
+    # Bar spacing observed on the first page lets us derive every later page's start time
+    # up front, so the remaining pages can be fetched concurrently.
+    step_ms = min(
+        (b.open_time_ms - a.open_time_ms for a, b in zip(first, first[1:], strict=False)),
+        default=0,
+    )
+    if step_ms <= 0:
+        return first
+
+    remaining = limit - len(first)
+    pages: list[tuple[int, int]] = []
+    page_start_ms = first[-1].open_time_ms + 1
+    while remaining > 0:
+        if end_time_ms is not None and page_start_ms > end_time_ms:
+            break
+        page_limit = min(_KLINES_PAGE_LIMIT, remaining)
+        pages.append((page_start_ms, page_limit))
+        page_start_ms += _KLINES_PAGE_LIMIT * step_ms
+        remaining -= page_limit
+
+    semaphore = asyncio.Semaphore(_KLINES_PAGE_CONCURRENCY)
+
+    async def _fetch_page(page_start: int, page_limit: int) -> list[Kline]:
+        async with semaphore:
+            return await client.klines(
+                symbol=symbol,
+                interval=interval,
+                limit=page_limit,
+                start_time_ms=page_start,
+                end_time_ms=end_time_ms,
+            )
+
+    batches = await asyncio.gather(*(_fetch_page(start, n) for start, n in pages))
+
+    collected = list(first)
+    seen = {k.open_time_ms for k in first}
+    for batch in batches:
+        for k in batch:
+            if k.open_time_ms in seen:
+                continue
+            seen.add(k.open_time_ms)
+            collected.append(k)
+    collected.sort(key=lambda k: k.open_time_ms)
+
+    # A gap in Binance history shifts later bars past their derived start times, so pages
+    # overlap and the total comes up short. Continue sequentially while history remains.
+    last_page_full = bool(batches) and len(batches[-1]) == pages[-1][1]
+    while last_page_full and len(collected) < limit:
+        page_limit = min(_KLINES_PAGE_LIMIT, limit - len(collected))
         batch = await client.klines(
             symbol=symbol,
             interval=interval,
-            limit=batch_limit,
-            start_time_ms=next_start_ms,
+            limit=page_limit,
+            start_time_ms=collected[-1].open_time_ms + 1,
             end_time_ms=end_time_ms,
         )
-        if not batch:
-            break
         collected.extend(batch)
-        if len(batch) < batch_limit:
-            break
-        next_start_ms = batch[-1].open_time_ms + 1
-        if end_time_ms is not None and next_start_ms > end_time_ms:
-            break
-    return collected
+        last_page_full = len(batch) == page_limit
+    return collected[:limit]
+
+
+async def _load_backtest_klines_cached(
+    *,
+    client: BinanceSpotClient,
+    symbol: str,
+    interval: str,
+    limit: int,
+    start_time_ms: int | None,
+    end_time_ms: int | None,
+    use_cache: bool,
+    cache_dir: Path | None = None,
+) -> list[Kline]:
+    if not use_cache:
+        return await _load_backtest_klines(
+            client=client,
+            symbol=symbol,
+            interval=interval,
+            limit=limit,
+            start_time_ms=start_time_ms,
+            end_time_ms=end_time_ms,
+        )
+
+    from money_dahong.backtest.kline_cache import (
+        DEFAULT_CACHE_DIR,
+        kline_cache_path,
+        read_kline_cache,
+        write_kline_cache,
+    )
+
+    path = kline_cache_path(
+        cache_dir=cache_dir if cache_dir is not None else DEFAULT_CACHE_DIR,
+        symbol=symbol,
+        interval=interval,
+        limit=limit,
+        start_time_ms=start_time_ms,
+        end_time_ms=end_time_ms,
+    )
+    now_ms = int(datetime.now(tz=UTC).timestamp() * 1000)
+    immutable = end_time_ms is not None and end_time_ms < now_ms
+    cached = read_kline_cache(
+        path,
+        max_age_seconds=None if immutable else _KLINES_CACHE_TTL_SECONDS,
+    )
+    if cached is not None:
+        return cached
+
+    klines = await _load_backtest_klines(
+        client=client,
+        symbol=symbol,
+        interval=interval,
+        limit=limit,
+        start_time_ms=start_time_ms,
+        end_time_ms=end_time_ms,
+    )
+    try:
+        write_kline_cache(path, klines)
+    except OSError:
+        logger.warning("kline_cache_write_failed", extra={"symbol": symbol})
+    return klines
+
+
+def _run_backtest_sync(
+    *,
+    cfg: MaCrossBacktestConfig,
+    config: Path,
+    symbol: str,
+    interval: str,
+    klines: list[Kline],
+    requested_start_utc: str | None,
+    requested_end_utc: str | None,
+) -> tuple[dict[str, Any], str]:
+    """
+    Run one MA cross backtest and render its outputs: (JSON payload, Telegram text).
+
+    Pure CPU work (Decimal backtest math, CSV export, text rendering) with no event loop
+    involved, so callers can run it in a worker thread or a process pool.
+    """
+    from money_dahong.backtest.engine import Backtester
+    from money_dahong.strategies.ma_cross import MaCrossParams, MaCrossStrategy
+
+    effective_ma_type = cfg.strategy.ma_type
+    effective_fast = cfg.strategy.fast_period
+    effective_slow = cfg.strategy.slow_period
+    effective_fee_rate = cfg.backtest.fee_rate
+    effective_slippage_bps = cfg.backtest.slippage_bps
+    effective_start_utc = requested_start_utc
+    effective_end_utc = requested_end_utc
+
+    config_trades_csv = cfg.backtest.trades_csv.strip() if cfg.backtest.trades_csv else ""
+    effective_trades_csv = Path(config_trades_csv) if config_trades_csv else None
+
+    position_sizing = cfg.backtest.position_sizing
+    cash_fraction = Decimal(str(cfg.backtest.cash_fraction))
+    order_notional_dec = Decimal(str(cfg.backtest.order_notional_usdt))
+    initial_cash_dec = Decimal(str(cfg.backtest.initial_cash_usdt))
+    fee_rate_dec = Decimal(str(effective_fee_rate))
+    slippage_bps_dec = Decimal(str(effective_slippage_bps))
+    trailing_start_dec = Decimal(str(cfg.risk.trailing_start_profit_pct))
+    trailing_dd_dec = Decimal(str(cfg.risk.trailing_drawdown_pct))
+
+    strategy = MaCrossStrategy(
+        MaCrossParams(
+            fast_period=effective_fast,
+            slow_period=effective_slow,
+            ma_type=effective_ma_type,
+        )
+    )
+
+    backtester = Backtester(
+        symbol=symbol,
+        interval=interval,
+        strategy=strategy,
+        initial_cash_usdt=initial_cash_dec,
+        position_sizing=position_sizing,
+        cash_fraction=cash_fraction,
+        order_notional_usdt=order_notional_dec,
+        fee_rate=fee_rate_dec,
+        slippage_bps=slippage_bps_dec,
+        lookback_bars=strategy.lookback_bars,
+        trailing_stop_enabled=cfg.risk.trailing_stop_enabled,
+        trailing_start_profit_pct=trailing_start_dec,
+        trailing_drawdown_pct=trailing_dd_dec,
+    )
+    result = backtester.run(klines=klines)
+    trades_csv_written = ""
+    if effective_trades_csv is not None:
+        _write_trades_csv(path=effective_trades_csv, trades=backtester.trades)
+        trades_csv_written = str(effective_trades_csv)
+    summary = {
+        "symbol": result.symbol,
+        "interval": result.interval,
+        "strategy_id": strategy.strategy_id,
+        "ma_type": effective_ma_type,
+        "fast": effective_fast,
+        "slow": effective_slow,
+        "requested_start_utc": effective_start_utc or "",
+        "requested_end_utc": effective_end_utc or "",
+        "bars": result.bars,
+        "trades": result.trades,
+        "start_equity_usdt": str(result.start_equity_usdt),
+        "end_equity_usdt": str(result.end_equity_usdt),
+        "return_pct": str(result.return_pct),
+        "max_drawdown_pct": str(result.max_drawdown_pct),
+        "fee_rate": str(effective_fee_rate),
+        "slippage_bps": str(effective_slippage_bps),
+        "position_sizing": position_sizing,
+        "cash_fraction": str(cash_fraction),
+        "order_notional_usdt": str(order_notional_dec),
+        "trailing_stop_enabled": cfg.risk.trailing_stop_enabled,
+        "trailing_start_profit_pct": str(cfg.risk.trailing_start_profit_pct),
+        "trailing_drawdown_pct": str(cfg.risk.trailing_drawdown_pct),
+        "config": str(config),
+        "trades_csv": trades_csv_written,
+    }
+
+    stats = _summarize_trades(backtester.trades)
+    trailing_exits = stats.trailing_exits
+    cross_exits = stats.cross_exits
+    win_rate = stats.win_rate_pct
+    avg_runup = stats.avg_runup_pct
+    max_runup = stats.max_runup_pct
+
+    start_ms = klines[0].close_time_ms if klines else 0
+    end_ms = klines[-2].close_time_ms if len(klines) >= 2 else 0
+    pnl_usdt = result.end_equity_usdt - result.start_equity_usdt
+
+    fee_rate_pct = fee_rate_dec * _D100
+    slippage_pct = slippage_bps_dec / _D100
+
+    position = (
+        f"复利 {_fmt_pct(cash_fraction * _D100)}% 现金"
+        if position_sizing == "cash_fraction"
+        else f"固定名义 {_fmt_usdt(order_notional_dec)} USDT"
+    )
+    trailing = (
+        "关闭"
+        if not cfg.risk.trailing_stop_enabled
+        else (
+            f"Trailing start={_fmt_pct(trailing_start_dec)}% "
+            f"dd={_fmt_pct(trailing_dd_dec)}%"
+        )
+    )
+    telegram_text = _BACKTEST_TELEGRAM_TEMPLATE.format(
+        symbol=result.symbol,
+        interval=result.interval,
+        ma_label=effective_ma_type.upper(),
+        fast=effective_fast,
+        slow=effective_slow,
+        period_start=_ms_to_utc(start_ms),
+        period_end=_ms_to_utc(end_ms),
+        bars=result.bars,
+        trades=result.trades,
+        win_rate=_fmt_pct(win_rate),
+        trailing_exits=trailing_exits,
+        cross_exits=cross_exits,
+        avg_runup=_fmt_pct(avg_runup),
+        max_runup=_fmt_pct(max_runup),
+        pnl=_fmt_usdt(pnl_usdt),
+        return_pct=_fmt_pct(result.return_pct),
+        end_equity=_fmt_usdt(result.end_equity_usdt),
+        max_drawdown=_fmt_pct(result.max_drawdown_pct),
+        position=position,
+        trailing=trailing,
+        fee_pct=_fmt_pct(fee_rate_pct),
+        slippage_pct=_fmt_pct(slippage_pct),
+        slippage_bps=slippage_bps_dec,
+        requested_start=effective_start_utc or "-",
+        requested_end=effective_end_utc or "-",
+        trades_csv=trades_csv_written or "未导出",
+        config=config,
+    )
+    payload = {
+        **summary,
+        "win_rate_pct": str(win_rate),
+        "trailing_exits": str(trailing_exits),
+        "cross_exits": str(cross_exits),
+        "avg_runup_pct": str(avg_runup),
+        "max_runup_pct": str(max_runup),
+    }
+    return payload, telegram_text
+
+
+@dataclass(frozen=True)
+class _GridBacktestSpec:
+    """Everything a grid backtest needs besides its (fast, slow) pair; picklable for workers."""
+
+    symbol: str
+    interval: str
+    ma_type: MaType
+    initial_cash_usdt: Decimal
+    position_sizing: str
+    cash_fraction: Decimal
+    order_notional_usdt: Decimal
+    fee_rate: Decimal
+    slippage_bps: Decimal
+    trailing_stop_enabled: bool
+    trailing_start_profit_pct: Decimal
+    trailing_drawdown_pct: Decimal
+
+
+def _run_grid_pairs_sync(
+    *, spec: _GridBacktestSpec, klines: list[Kline], pairs: list[tuple[int, int]]
+) -> list[GridResultRow]:
+    """
+    Backtest each (fast, slow) pair over `klines`, one result row per pair in order.
+
+    Pure CPU work like `_run_backtest_sync`, so `backtest-grid` can hand slices of the pairs
+    to worker processes.
+    """
+    from money_dahong.backtest.engine import Backtester
+    from money_dahong.strategies.ma_cross import MaCrossParams, MaCrossStrategy
+
+    rows: list[GridResultRow] = []
+    for fast, slow in pairs:
+        strategy = MaCrossStrategy(
+            MaCrossParams(fast_period=fast, slow_period=slow, ma_type=spec.ma_type)
+        )
+        backtester = Backtester(
+            symbol=spec.symbol,
+            interval=spec.interval,
+            strategy=strategy,
+            initial_cash_usdt=spec.initial_cash_usdt,
+            position_sizing=spec.position_sizing,
+            cash_fraction=spec.cash_fraction,
+            order_notional_usdt=spec.order_notional_usdt,
+            fee_rate=spec.fee_rate,
+            slippage_bps=spec.slippage_bps,
+            lookback_bars=strategy.lookback_bars,
+            trailing_stop_enabled=spec.trailing_stop_enabled,
+            trailing_start_profit_pct=spec.trailing_start_profit_pct,
+            trailing_drawdown_pct=spec.trailing_drawdown_pct,
+        )
+        result = backtester.run(klines=klines, record_trades=False)
+        rows.append(
+            GridResultRow(
+                fast=fast,
+                slow=slow,
+                trades=result.trades,
+                win_rate_pct=_win_rate_pct(wins=result.winning_trades, trades=result.trades),
+                return_pct=result.return_pct,
+                max_drawdown_pct=result.max_drawdown_pct,
+                end_equity_usdt=result.end_equity_usdt,
+            )
+        )
+    return rows
+
+
+async def _run_grid_pairs(
+    *,
+    spec: _GridBacktestSpec,
+    klines: list[Kline],
+    pairs: list[tuple[int, int]],
+    workers: int,
+) -> list[GridResultRow]:
+    """
+    Runs the grid in-process, or split into contiguous slices over up to `workers` processes
+    (Decimal backtests hold the GIL, so threads would not help). Rows keep the order of
+    `pairs` either way, so ranking ties break the same.
+    """
+    workers = min(workers, len(pairs))
+    if workers <= 1:
+        return _run_grid_pairs_sync(spec=spec, klines=klines, pairs=pairs)
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    from functools import partial
+
+    size = -(-len(pairs) // workers)
+    slices = [pairs[i : i + size] for i in range(0, len(pairs), size)]
+    loop = asyncio.get_running_loop()
+    # "spawn" so workers don't fork the event loop and its threads.
+    with ProcessPoolExecutor(
+        max_workers=len(slices), mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        parts = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    pool, partial(_run_grid_pairs_sync, spec=spec, klines=klines, pairs=chunk)
+                )
+                for chunk in slices
+            )
+        )
+    return [row for part in parts for row in part]
 
 
 @app.command()
@@ -237,13 +754,15 @@ def config_init(
 
 @app.command()
 def show_config() -> None:
+    from money_dahong.settings import Settings
+
     settings = Settings()
     configure_logging(settings.log_level)
     redacted = settings.model_dump()
     redacted["binance_api_secret"] = "***" if redacted["binance_api_secret"] else ""
     redacted["telegram_bot_token"] = "***" if redacted["telegram_bot_token"] else ""
     logger.info("loaded_config", extra={"symbol": settings.symbol})
-    typer.echo(redacted)
+    _emit(redacted)
 
 
 @app.command()
@@ -251,28 +770,27 @@ def health() -> None:
     """
     Ping Binance and print server time.
     """
+    from money_dahong.settings import Settings
+
     settings = Settings()
     configure_logging(settings.log_level)
 
     async def _run() -> None:
-        client = BinanceSpotClient(
-            api_key=settings.binance_api_key,
-            api_secret=settings.binance_api_secret,
-        )
-        try:
+        async with _binance_client(settings) as client:
             await client.ping()
             server_time = await client.server_time_ms()
-            typer.echo({"ok": True, "server_time_ms": server_time, "symbol": settings.symbol})
-        finally:
-            await client.aclose()
+            _emit({"ok": True, "server_time_ms": server_time, "symbol": settings.symbol})
 
-    asyncio.run(_run())
+    _run_async(_run())
 
 
 @app.command()
 def alerts_test(
     message: str = typer.Option("money-dahong test alert", help="Message to send."),
 ) -> None:
+    from money_dahong.notifications.telegram import TelegramNotifier
+    from money_dahong.settings import Settings
+
     settings = Settings()
     configure_logging(settings.log_level)
 
@@ -283,11 +801,11 @@ def alerts_test(
         )
         try:
             await notifier.send(message)
-            typer.echo({"ok": True, "channel": "telegram", "enabled": notifier.enabled()})
+            _emit({"ok": True, "channel": "telegram", "enabled": notifier.enabled()})
         finally:
             await notifier.aclose()
 
-    asyncio.run(_run())
+    _run_async(_run())
 
 
 @app.command()
@@ -296,10 +814,24 @@ def run(
         Path("configs/ema_cross.toml"),
         help="EMA cross live config file (TOML).",
     ),
+    symbols: str | None = typer.Option(
+        None,
+        help=(
+            "Comma-separated symbols, e.g. ETHUSDT,BTCUSDT; overrides market.symbol. "
+            "All symbols share one client and one account snapshot."
+        ),
+    ),
 ) -> None:
     """
     Run the EMA cross bot using `configs/ema_cross.toml`.
     """
+    from money_dahong.config.ema_cross import load_ema_cross_run_config
+    from money_dahong.engine.rules_cache import DEFAULT_RULES_CACHE_DIR
+    from money_dahong.engine.trader import AccountCache, Trader
+    from money_dahong.notifications.telegram import TelegramNotifier
+    from money_dahong.settings import Settings
+    from money_dahong.strategies.ema_cross import EmaCrossParams, EmaCrossStrategy
+
     settings = Settings()
     configure_logging(settings.log_level)
 
@@ -311,42 +843,54 @@ def run(
     except Exception as e:
         raise typer.BadParameter(f"invalid config: {e}") from e
 
-    symbol = (cfg.market.symbol or settings.symbol).strip()
+    try:
+        symbol_list = _parse_symbol_list(
+            value=symbols,
+            fallback=(cfg.market.symbol or settings.symbol).strip(),
+        )
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="--symbols") from e
     interval = (cfg.market.interval or settings.interval).strip()
 
     async def _run() -> None:
-        client = BinanceSpotClient(
-            api_key=settings.binance_api_key,
-            api_secret=settings.binance_api_secret,
-        )
+        client = _binance_client(settings)
         notifier = TelegramNotifier(
             bot_token=settings.telegram_bot_token,
             chat_id=settings.telegram_chat_id,
+            batch_window_seconds=_TRADER_TELEGRAM_BATCH_SECONDS,
         )
-        strategy = EmaCrossStrategy(
-            EmaCrossParams(
-                fast_period=cfg.strategy.fast_period,
-                slow_period=cfg.strategy.slow_period,
-            )
-        )
+        account_cache = AccountCache(client)
         max_notional = Decimal(str(settings.max_order_notional_usdt))
-        trader = Trader(
-            settings=settings,
-            client=client,
-            strategy=strategy,
-            notifier=notifier,
-            position_sizing="fixed_notional",
-            order_notional_usdt=max_notional,
-            max_order_notional_usdt=max_notional,
-            trailing_stop_enabled=False,
-        )
+        runs = [
+            (
+                Trader(
+                    settings=settings,
+                    client=client,
+                    strategy=EmaCrossStrategy(
+                        EmaCrossParams(
+                            fast_period=cfg.strategy.fast_period,
+                            slow_period=cfg.strategy.slow_period,
+                        )
+                    ),
+                    notifier=notifier,
+                    position_sizing="fixed_notional",
+                    order_notional_usdt=max_notional,
+                    max_order_notional_usdt=max_notional,
+                    trailing_stop_enabled=False,
+                    account_cache=account_cache,
+                    rules_cache_dir=DEFAULT_RULES_CACHE_DIR,
+                ),
+                symbol,
+            )
+            for symbol in symbol_list
+        ]
         try:
-            await trader.run(symbol=symbol, interval=interval)
+            await _run_traders(runs, interval=interval)
         finally:
             await notifier.aclose()
             await client.aclose()
 
-    asyncio.run(_run())
+    _run_async(_run())
 
 
 @app.command()
@@ -355,10 +899,24 @@ def run_ma(
         Path("configs/ma_cross.toml"),
         help="MA cross live config file (TOML).",
     ),
+    symbols: str | None = typer.Option(
+        None,
+        help=(
+            "Comma-separated symbols, e.g. ETHUSDT,BTCUSDT; overrides market.symbol. "
+            "All symbols share one client and one account snapshot."
+        ),
+    ),
 ) -> None:
     """
     Run the MA cross bot (double moving average) using `configs/ma_cross.toml`.
     """
+    from money_dahong.config.ma_cross import load_ma_cross_backtest_config
+    from money_dahong.engine.rules_cache import DEFAULT_RULES_CACHE_DIR
+    from money_dahong.engine.trader import AccountCache, Trader
+    from money_dahong.notifications.telegram import TelegramNotifier
+    from money_dahong.settings import Settings
+    from money_dahong.strategies.ma_cross import MaCrossParams, MaCrossStrategy
+
     settings = Settings()
     configure_logging(settings.log_level)
 
@@ -370,47 +928,58 @@ def run_ma(
     except Exception as e:
         raise typer.BadParameter(f"invalid config: {e}") from e
 
-    symbol = (cfg.market.symbol or settings.symbol).strip()
+    try:
+        symbol_list = _parse_symbol_list(
+            value=symbols,
+            fallback=(cfg.market.symbol or settings.symbol).strip(),
+        )
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="--symbols") from e
     interval = (cfg.market.interval or settings.interval).strip()
 
     async def _run() -> None:
-        client = BinanceSpotClient(
-            api_key=settings.binance_api_key,
-            api_secret=settings.binance_api_secret,
-        )
+        client = _binance_client(settings)
         notifier = TelegramNotifier(
             bot_token=settings.telegram_bot_token,
             chat_id=settings.telegram_chat_id,
+            batch_window_seconds=_TRADER_TELEGRAM_BATCH_SECONDS,
         )
-        strategy = MaCrossStrategy(
-            MaCrossParams(
-                fast_period=cfg.strategy.fast_period,
-                slow_period=cfg.strategy.slow_period,
-                ma_type=cfg.strategy.ma_type,
-            )
-        )
-
+        account_cache = AccountCache(client)
         max_notional = Decimal(str(settings.max_order_notional_usdt))
-        trader = Trader(
-            settings=settings,
-            client=client,
-            strategy=strategy,
-            notifier=notifier,
-            position_sizing=cfg.backtest.position_sizing,
-            cash_fraction=Decimal(str(cfg.backtest.cash_fraction)),
-            order_notional_usdt=Decimal(str(cfg.backtest.order_notional_usdt)),
-            max_order_notional_usdt=max_notional,
-            trailing_stop_enabled=cfg.risk.trailing_stop_enabled,
-            trailing_start_profit_pct=Decimal(str(cfg.risk.trailing_start_profit_pct)),
-            trailing_drawdown_pct=Decimal(str(cfg.risk.trailing_drawdown_pct)),
-        )
+        runs = [
+            (
+                Trader(
+                    settings=settings,
+                    client=client,
+                    strategy=MaCrossStrategy(
+                        MaCrossParams(
+                            fast_period=cfg.strategy.fast_period,
+                            slow_period=cfg.strategy.slow_period,
+                            ma_type=cfg.strategy.ma_type,
+                        )
+                    ),
+                    notifier=notifier,
+                    position_sizing=cfg.backtest.position_sizing,
+                    cash_fraction=Decimal(str(cfg.backtest.cash_fraction)),
+                    order_notional_usdt=Decimal(str(cfg.backtest.order_notional_usdt)),
+                    max_order_notional_usdt=max_notional,
+                    trailing_stop_enabled=cfg.risk.trailing_stop_enabled,
+                    trailing_start_profit_pct=Decimal(str(cfg.risk.trailing_start_profit_pct)),
+                    trailing_drawdown_pct=Decimal(str(cfg.risk.trailing_drawdown_pct)),
+                    account_cache=account_cache,
+                    rules_cache_dir=DEFAULT_RULES_CACHE_DIR,
+                ),
+                symbol,
+            )
+            for symbol in symbol_list
+        ]
         try:
-            await trader.run(symbol=symbol, interval=interval)
+            await _run_traders(runs, interval=interval)
         finally:
             await notifier.aclose()
             await client.aclose()
 
-    asyncio.run(_run())
+    _run_async(_run())
 
 
 @app.command()
@@ -421,7 +990,7 @@ def backtest(
     ),
     fast: int | None = typer.Option(None, help="Override: fast MA period."),
     slow: int | None = typer.Option(None, help="Override: slow MA period."),
-    ma_type: str | None = typer.Option(None, help="Override: sma|ema"),
+    ma_type: MaType | None = typer.Option(None, case_sensitive=False, help="Override: sma|ema"),
     limit: int | None = typer.Option(
         None,
         help="Override: max bars to use in backtest (1-20000).",
@@ -448,6 +1017,11 @@ def backtest(
         None,
         help="Override: write backtest trades to CSV path.",
     ),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse klines cached under ~/.cache/money-dahong (windows ending now: 60s).",
+    ),
     notify_telegram: bool | None = typer.Option(
         None,
         "--notify-telegram/--no-notify-telegram",
@@ -457,6 +1031,13 @@ def backtest(
     """
     Backtest the MA cross strategy on latest Binance klines (REST).
     """
+    from money_dahong.config.ma_cross import (
+        apply_backtest_overrides,
+        load_ma_cross_backtest_config,
+    )
+    from money_dahong.notifications.telegram import TelegramNotifier
+    from money_dahong.settings import Settings
+
     settings = Settings()
     configure_logging(settings.log_level)
 
@@ -468,17 +1049,31 @@ def backtest(
     except Exception as e:
         raise typer.BadParameter(f"invalid config: {e}") from e
 
+    try:
+        cfg = apply_backtest_overrides(
+            cfg,
+            {
+                "market": {"limit": limit, "start_utc": start, "end_utc": end},
+                "strategy": {"ma_type": ma_type, "fast_period": fast, "slow_period": slow},
+                "backtest": {
+                    "initial_cash_usdt": initial_cash_usdt,
+                    "order_notional_usdt": order_notional_usdt,
+                    "fee_rate": fee_rate,
+                    "slippage_bps": slippage_bps,
+                    "trades_csv": str(trades_csv) if trades_csv is not None else None,
+                },
+                "telegram": {"notify": notify_telegram},
+            },
+        )
+    except ValueError as e:
+        raise typer.BadParameter(f"invalid overrides: {e}") from e
+
     symbol = (cfg.market.symbol or settings.symbol).strip()
     interval = (cfg.market.interval or settings.interval).strip()
+    effective_limit = cfg.market.limit
 
-    effective_limit = limit if limit is not None else cfg.market.limit
-    if effective_limit <= 0 or effective_limit > 20000:
-        raise typer.BadParameter("limit must be between 1 and 20000")
-
-    config_start_utc = cfg.market.start_utc.strip() if cfg.market.start_utc else ""
-    config_end_utc = cfg.market.end_utc.strip() if cfg.market.end_utc else ""
-    effective_start_utc = start if start is not None else (config_start_utc or None)
-    effective_end_utc = end if end is not None else (config_end_utc or None)
+    effective_start_utc = (cfg.market.start_utc.strip() if cfg.market.start_utc else "") or None
+    effective_end_utc = (cfg.market.end_utc.strip() if cfg.market.end_utc else "") or None
     try:
         start_time_ms = (
             _parse_utc_to_ms(effective_start_utc) if effective_start_utc is not None else None
@@ -494,215 +1089,43 @@ def backtest(
     if start_time_ms is not None and end_time_ms is not None and start_time_ms >= end_time_ms:
         raise typer.BadParameter("start must be earlier than end")
 
-    effective_ma_type = (ma_type if ma_type is not None else cfg.strategy.ma_type).strip().lower()
-    if effective_ma_type not in ("sma", "ema"):
-        raise typer.BadParameter("ma_type must be 'sma' or 'ema'")
-
-    effective_fast = fast if fast is not None else cfg.strategy.fast_period
-    effective_slow = slow if slow is not None else cfg.strategy.slow_period
-    if effective_fast >= effective_slow:
-        raise typer.BadParameter("fast must be < slow")
-
-    effective_initial_cash = (
-        initial_cash_usdt if initial_cash_usdt is not None else cfg.backtest.initial_cash_usdt
-    )
-    effective_fee_rate = fee_rate if fee_rate is not None else cfg.backtest.fee_rate
-    effective_slippage_bps = (
-        slippage_bps if slippage_bps is not None else cfg.backtest.slippage_bps
-    )
-    if effective_slippage_bps < 0 or effective_slippage_bps >= 10000:
-        raise typer.BadParameter("slippage_bps must be within [0, 10000)")
-
-    config_trades_csv = cfg.backtest.trades_csv.strip() if cfg.backtest.trades_csv else ""
-    effective_trades_csv = (
-        trades_csv
-        if trades_csv is not None
-        else (Path(config_trades_csv) if config_trades_csv else None)
-    )
-
-    effective_notify = (
-        notify_telegram if notify_telegram is not None else cfg.telegram.notify
-    )
-
-    position_sizing = cfg.backtest.position_sizing
-    cash_fraction = Decimal(str(cfg.backtest.cash_fraction))
-    order_notional_value = (
-        order_notional_usdt if order_notional_usdt is not None else cfg.backtest.order_notional_usdt
-    )
-    order_notional_dec = Decimal(str(order_notional_value))
-
-    strategy = MaCrossStrategy(
-        MaCrossParams(
-            fast_period=effective_fast,
-            slow_period=effective_slow,
-            ma_type=effective_ma_type,  # type: ignore[arg-type]
-        )
-    )
-
     async def _run() -> None:
-        client = BinanceSpotClient(
-            api_key=settings.binance_api_key,
-            api_secret=settings.binance_api_secret,
-        )
+        client = _binance_client(settings)
         notifier = TelegramNotifier(
             bot_token=settings.telegram_bot_token,
             chat_id=settings.telegram_chat_id,
         )
         try:
-            klines = await _load_backtest_klines(
+            klines = await _load_backtest_klines_cached(
                 client=client,
                 symbol=symbol,
                 interval=interval,
                 limit=effective_limit,
                 start_time_ms=start_time_ms,
                 end_time_ms=end_time_ms,
+                use_cache=cache,
             )
 
-            backtester = Backtester(
+            # CPU-bound; keep it off the loop that owns the HTTP client and the notifier.
+            payload, telegram_text = await asyncio.to_thread(
+                _run_backtest_sync,
+                cfg=cfg,
+                config=config,
                 symbol=symbol,
                 interval=interval,
-                strategy=strategy,
-                initial_cash_usdt=Decimal(str(effective_initial_cash)),
-                position_sizing=position_sizing,
-                cash_fraction=cash_fraction,
-                order_notional_usdt=order_notional_dec,
-                fee_rate=Decimal(str(effective_fee_rate)),
-                slippage_bps=Decimal(str(effective_slippage_bps)),
-                lookback_bars=strategy.lookback_bars,
-                trailing_stop_enabled=cfg.risk.trailing_stop_enabled,
-                trailing_start_profit_pct=Decimal(str(cfg.risk.trailing_start_profit_pct)),
-                trailing_drawdown_pct=Decimal(str(cfg.risk.trailing_drawdown_pct)),
-            )
-            result = backtester.run(klines=klines)
-            trades_csv_written = ""
-            if effective_trades_csv is not None:
-                _write_trades_csv(path=effective_trades_csv, trades=backtester.trades)
-                trades_csv_written = str(effective_trades_csv)
-            summary = {
-                "symbol": result.symbol,
-                "interval": result.interval,
-                "strategy_id": strategy.strategy_id,
-                "ma_type": effective_ma_type,
-                "fast": effective_fast,
-                "slow": effective_slow,
-                "requested_start_utc": effective_start_utc or "",
-                "requested_end_utc": effective_end_utc or "",
-                "bars": result.bars,
-                "trades": result.trades,
-                "start_equity_usdt": str(result.start_equity_usdt),
-                "end_equity_usdt": str(result.end_equity_usdt),
-                "return_pct": str(result.return_pct),
-                "max_drawdown_pct": str(result.max_drawdown_pct),
-                "fee_rate": str(effective_fee_rate),
-                "slippage_bps": str(effective_slippage_bps),
-                "position_sizing": position_sizing,
-                "cash_fraction": str(cash_fraction),
-                "order_notional_usdt": str(order_notional_dec),
-                "trailing_stop_enabled": cfg.risk.trailing_stop_enabled,
-                "trailing_start_profit_pct": str(cfg.risk.trailing_start_profit_pct),
-                "trailing_drawdown_pct": str(cfg.risk.trailing_drawdown_pct),
-                "config": str(config),
-                "trades_csv": trades_csv_written,
-            }
-
-            wins = sum(1 for t in backtester.trades if t.pnl_usdt > 0)
-            trailing_exits = sum(1 for t in backtester.trades if t.exit_reason == "trailing_stop")
-            cross_exits = sum(1 for t in backtester.trades if t.exit_reason == "cross_down")
-            win_rate = (
-                (Decimal(wins) / Decimal(len(backtester.trades))) * Decimal("100")
-                if backtester.trades
-                else Decimal("0")
-            )
-            if backtester.trades:
-                avg_runup = sum(
-                    (t.max_runup_pct for t in backtester.trades),
-                    Decimal("0"),
-                ) / Decimal(len(backtester.trades))
-                max_runup = max((t.max_runup_pct for t in backtester.trades), default=Decimal("0"))
-            else:
-                avg_runup = Decimal("0")
-                max_runup = Decimal("0")
-
-            start_ms = klines[0].close_time_ms if klines else 0
-            end_ms = klines[-2].close_time_ms if len(klines) >= 2 else 0
-            pnl_usdt = result.end_equity_usdt - result.start_equity_usdt
-
-            fee_rate_pct = Decimal(str(effective_fee_rate)) * Decimal("100")
-            slippage_bps_dec = Decimal(str(effective_slippage_bps))
-            slippage_pct = slippage_bps_dec / Decimal("100")
-
-            header = (
-                f"{result.symbol} | {result.interval} | "
-                f"{effective_ma_type.upper()}({effective_fast},{effective_slow})"
-            )
-            period = f"{_ms_to_utc(start_ms)} ~ {_ms_to_utc(end_ms)}"
-            line_stats = (
-                f"K线: {result.bars} 交易: {result.trades} 胜率: {_fmt_pct(win_rate)}%"
-            )
-            line_exits = f"离场: Trailing {trailing_exits} | 死叉 {cross_exits}"
-            line_runup = f"峰值浮盈: avg {_fmt_pct(avg_runup)}% max {_fmt_pct(max_runup)}%"
-            line_pnl = (
-                f"收益: {_fmt_usdt(pnl_usdt)} USDT ({_fmt_pct(result.return_pct)}%) "
-                f"期末: {_fmt_usdt(result.end_equity_usdt)}"
-            )
-            line_risk = f"最大回撤: {_fmt_pct(result.max_drawdown_pct)}%"
-            line_pos = (
-                f"仓位: 复利 {_fmt_pct(cash_fraction * Decimal('100'))}% 现金"
-                if position_sizing == "cash_fraction"
-                else f"仓位: 固定名义 {_fmt_usdt(order_notional_dec)} USDT"
-            )
-            line_trail = (
-                "离场保护: 关闭"
-                if not cfg.risk.trailing_stop_enabled
-                else (
-                    "离场保护: Trailing "
-                    f"start={_fmt_pct(Decimal(str(cfg.risk.trailing_start_profit_pct)))}% "
-                    f"dd={_fmt_pct(Decimal(str(cfg.risk.trailing_drawdown_pct)))}%"
-                )
+                klines=klines,
+                requested_start_utc=effective_start_utc,
+                requested_end_utc=effective_end_utc,
             )
-            line_cost = (
-                f"成本: fee {_fmt_pct(fee_rate_pct)}% | "
-                f"slippage {_fmt_pct(slippage_pct)}% ({slippage_bps_dec} bps)"
-            )
-            line_window = (
-                f"请求区间: {effective_start_utc or '-'} ~ {effective_end_utc or '-'}"
-            )
-            telegram_text = "\n".join(
-                [
-                    "回测完成",
-                    header,
-                    f"区间: {period}",
-                    line_stats,
-                    line_exits,
-                    line_runup,
-                    line_pnl,
-                    line_risk,
-                    line_pos,
-                    line_trail,
-                    line_cost,
-                    line_window,
-                    f"交易明细: {trades_csv_written or '未导出'}",
-                    f"配置: {str(config)}",
-                ]
-            )
-            if effective_notify:
+            if cfg.telegram.notify:
                 await notifier.send(telegram_text)
 
-            typer.echo(
-                {
-                    **summary,
-                    "win_rate_pct": str(win_rate),
-                    "trailing_exits": str(trailing_exits),
-                    "cross_exits": str(cross_exits),
-                    "avg_runup_pct": str(avg_runup),
-                    "max_runup_pct": str(max_runup),
-                }
-            )
+            _emit(payload)
         finally:
             await notifier.aclose()
             await client.aclose()
 
-    asyncio.run(_run())
+    _run_async(_run())
 
 
 @app.command()
@@ -719,7 +1142,7 @@ def backtest_grid(
         None,
         help="Comma-separated slow periods, e.g. 30,40,60.",
     ),
-    ma_type: str | None = typer.Option(None, help="Override: sma|ema"),
+    ma_type: MaType | None = typer.Option(None, case_sensitive=False, help="Override: sma|ema"),
     limit: int | None = typer.Option(
         None,
         help="Override: max bars to use in backtest (1-20000).",
@@ -747,6 +1170,15 @@ def backtest_grid(
         None,
         help="Optional CSV output path for top results.",
     ),
+    workers: int = typer.Option(
+        1,
+        help="Worker processes to split the parameter pairs across (1 = run in-process).",
+    ),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse klines cached under ~/.cache/money-dahong (windows ending now: 60s).",
+    ),
     notify_telegram: bool | None = typer.Option(
         None,
         "--notify-telegram/--no-notify-telegram",
@@ -756,6 +1188,10 @@ def backtest_grid(
     """
     Grid-search MA parameters (fast/slow) on the same backtest window.
     """
+    from money_dahong.config.ma_cross import load_ma_cross_backtest_config
+    from money_dahong.notifications.telegram import TelegramNotifier
+    from money_dahong.settings import Settings
+
     settings = Settings()
     configure_logging(settings.log_level)
 
@@ -763,6 +1199,8 @@ def backtest_grid(
         raise typer.BadParameter(f"config file not found: {config}")
     if top <= 0:
         raise typer.BadParameter("top must be > 0")
+    if workers <= 0:
+        raise typer.BadParameter("workers must be > 0")
 
     try:
         cfg = load_ma_cross_backtest_config(config)
@@ -795,9 +1233,7 @@ def backtest_grid(
     if start_time_ms is not None and end_time_ms is not None and start_time_ms >= end_time_ms:
         raise typer.BadParameter("start must be earlier than end")
 
-    effective_ma_type = (ma_type if ma_type is not None else cfg.strategy.ma_type).strip().lower()
-    if effective_ma_type not in ("sma", "ema"):
-        raise typer.BadParameter("ma_type must be 'sma' or 'ema'")
+    effective_ma_type = MaType(ma_type if ma_type is not None else cfg.strategy.ma_type)
 
     try:
         fast_list = _parse_period_list(
@@ -835,66 +1271,40 @@ def backtest_grid(
     )
     order_notional_dec = Decimal(str(order_notional_value))
 
+    # The per-pair loop is CPU-bound (Decimal MA/backtest math), so everything that does not
+    # depend on (fast, slow) is resolved once here rather than on every candidate.
+    spec = _GridBacktestSpec(
+        symbol=symbol,
+        interval=interval,
+        ma_type=effective_ma_type,
+        initial_cash_usdt=Decimal(str(effective_initial_cash)),
+        position_sizing=position_sizing,
+        cash_fraction=cash_fraction,
+        order_notional_usdt=order_notional_dec,
+        fee_rate=Decimal(str(effective_fee_rate)),
+        slippage_bps=Decimal(str(effective_slippage_bps)),
+        trailing_stop_enabled=cfg.risk.trailing_stop_enabled,
+        trailing_start_profit_pct=Decimal(str(cfg.risk.trailing_start_profit_pct)),
+        trailing_drawdown_pct=Decimal(str(cfg.risk.trailing_drawdown_pct)),
+    )
+
     async def _run() -> None:
-        client = BinanceSpotClient(
-            api_key=settings.binance_api_key,
-            api_secret=settings.binance_api_secret,
-        )
+        client = _binance_client(settings)
         notifier = TelegramNotifier(
             bot_token=settings.telegram_bot_token,
             chat_id=settings.telegram_chat_id,
         )
         try:
-            klines = await _load_backtest_klines(
+            klines = await _load_backtest_klines_cached(
                 client=client,
                 symbol=symbol,
                 interval=interval,
                 limit=effective_limit,
                 start_time_ms=start_time_ms,
                 end_time_ms=end_time_ms,
+                use_cache=cache,
             )
-            rows: list[GridResultRow] = []
-            for fast, slow in pairs:
-                strategy = MaCrossStrategy(
-                    MaCrossParams(
-                        fast_period=fast,
-                        slow_period=slow,
-                        ma_type=effective_ma_type,  # type: ignore[arg-type]
-                    )
-                )
-                backtester = Backtester(
-                    symbol=symbol,
-                    interval=interval,
-                    strategy=strategy,
-                    initial_cash_usdt=Decimal(str(effective_initial_cash)),
-                    position_sizing=position_sizing,
-                    cash_fraction=cash_fraction,
-                    order_notional_usdt=order_notional_dec,
-                    fee_rate=Decimal(str(effective_fee_rate)),
-                    slippage_bps=Decimal(str(effective_slippage_bps)),
-                    lookback_bars=strategy.lookback_bars,
-                    trailing_stop_enabled=cfg.risk.trailing_stop_enabled,
-                    trailing_start_profit_pct=Decimal(str(cfg.risk.trailing_start_profit_pct)),
-                    trailing_drawdown_pct=Decimal(str(cfg.risk.trailing_drawdown_pct)),
-                )
-                result = backtester.run(klines=klines)
-                wins = sum(1 for t in backtester.trades if t.pnl_usdt > 0)
-                win_rate = (
-                    (Decimal(wins) / Decimal(len(backtester.trades))) * Decimal("100")
-                    if backtester.trades
-                    else Decimal("0")
-                )
-                rows.append(
-                    GridResultRow(
-                        fast=fast,
-                        slow=slow,
-                        trades=result.trades,
-                        win_rate_pct=win_rate,
-                        return_pct=result.return_pct,
-                        max_drawdown_pct=result.max_drawdown_pct,
-                        end_equity_usdt=result.end_equity_usdt,
-                    )
-                )
+            rows = await _run_grid_pairs(spec=spec, klines=klines, pairs=pairs, workers=workers)
 
             ranked = _rank_grid_rows(rows=rows, top=top)
             if results_csv is not None:
@@ -914,7 +1324,7 @@ def backtest_grid(
                 for i, row in enumerate(ranked, start=1)
             ]
 
-            typer.echo(
+            _emit(
                 {
                     "symbol": symbol,
                     "interval": interval,
@@ -949,4 +1359,4 @@ def backtest_grid(
             await notifier.aclose()
             await client.aclose()
 
-    asyncio.run(_run())
+    _run_async(_run())
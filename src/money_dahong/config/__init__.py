@@ -1,9 +1,21 @@
 __all__ = [
     "EmaCrossRunConfig",
     "MaCrossBacktestConfig",
+    "apply_backtest_overrides",
     "load_ema_cross_run_config",
+    "load_ema_cross_run_config_fast",
     "load_ma_cross_backtest_config",
+    "load_ma_cross_backtest_config_fast",
 ]
 
-from money_dahong.config.ema_cross import EmaCrossRunConfig, load_ema_cross_run_config
-from money_dahong.config.ma_cross import MaCrossBacktestConfig, load_ma_cross_backtest_config
+from money_dahong.config.ema_cross import (
+    EmaCrossRunConfig,
+    load_ema_cross_run_config,
+    load_ema_cross_run_config_fast,
+)
+from money_dahong.config.ma_cross import (
+    MaCrossBacktestConfig,
+    apply_backtest_overrides,
+    load_ma_cross_backtest_config,
+    load_ma_cross_backtest_config_fast,
+)
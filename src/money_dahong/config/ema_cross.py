@@ -1,23 +1,30 @@
 from __future__ import annotations
 
+import functools
 import tomllib
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class MarketConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     symbol: Optional[str] = None
     interval: Optional[str] = None
 
 
 class StrategyConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     fast_period: int = Field(default=12, ge=1)
     slow_period: int = Field(default=26, ge=1)
 
 
 class EmaCrossRunConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     market: MarketConfig = Field(default_factory=MarketConfig)
     strategy: StrategyConfig = Field(default_factory=StrategyConfig)
 
@@ -27,7 +34,29 @@ class EmaCrossRunConfig(BaseModel):
 
 
 def load_ema_cross_run_config(path: Path) -> EmaCrossRunConfig:
-    raw = tomllib.loads(path.read_text(encoding="utf-8"))
+    # Repeated loads of an unchanged file share the validated model, which is frozen so no
+    # caller can change what the next load returns.
+    stat = path.stat()
+    return _load_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_cached(path_str: str, mtime_ns: int, size: int) -> EmaCrossRunConfig:
+    with Path(path_str).open("rb") as f:
+        raw = tomllib.load(f)
     cfg = EmaCrossRunConfig.model_validate(raw)
     cfg.validate_logic()
     return cfg
+
+
+def load_ema_cross_run_config_fast(raw: dict[str, Any]) -> EmaCrossRunConfig:
+    """
+    Build a config from already-trusted data (e.g. a previous `model_dump()`), skipping
+    pydantic field validation. Only the cross-field `validate_logic` checks run.
+    """
+    cfg = EmaCrossRunConfig.model_construct(
+        market=MarketConfig.model_construct(**raw.get("market", {})),
+        strategy=StrategyConfig.model_construct(**raw.get("strategy", {})),
+    )
+    cfg.validate_logic()
+    return cfg
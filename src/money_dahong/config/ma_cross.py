@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import functools
 import tomllib
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Annotated, Any, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
+
+from money_dahong.types import MaType
 
 
 class MarketConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     symbol: Optional[str] = None
     interval: Optional[str] = None
     # Max bars to use in backtest (client paginates when needed).
@@ -16,13 +21,21 @@ class MarketConfig(BaseModel):
     end_utc: Optional[str] = None
 
 
+def _normalize_ma_type(value: Any) -> Any:
+    return value.strip().lower() if isinstance(value, str) else value
+
+
 class StrategyConfig(BaseModel):
-    ma_type: Literal["sma", "ema"] = "sma"
+    model_config = ConfigDict(frozen=True)
+
+    ma_type: Annotated[MaType, BeforeValidator(_normalize_ma_type)] = MaType.SMA
     fast_period: int = Field(default=20, ge=1)
     slow_period: int = Field(default=60, ge=1)
 
 
 class BacktestConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     initial_cash_usdt: float = Field(default=1000.0, gt=0)
     position_sizing: Literal["cash_fraction", "fixed_notional"] = "cash_fraction"
     cash_fraction: float = Field(default=0.8, gt=0, le=1)
@@ -33,16 +46,22 @@ class BacktestConfig(BaseModel):
 
 
 class TelegramConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     notify: bool = True
 
 
 class RiskConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     trailing_stop_enabled: bool = True
     trailing_start_profit_pct: float = Field(default=30.0, ge=0)
     trailing_drawdown_pct: float = Field(default=10.0, ge=0)
 
 
 class MaCrossBacktestConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     market: MarketConfig = Field(default_factory=MarketConfig)
     strategy: StrategyConfig = Field(default_factory=StrategyConfig)
     backtest: BacktestConfig = Field(default_factory=BacktestConfig)
@@ -64,7 +83,48 @@ class MaCrossBacktestConfig(BaseModel):
 
 
 def load_ma_cross_backtest_config(path: Path) -> MaCrossBacktestConfig:
-    raw = tomllib.loads(path.read_text(encoding="utf-8"))
+    # Repeated loads of an unchanged file share the validated model, which is frozen so no
+    # caller can change what the next load returns.
+    stat = path.stat()
+    return _load_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_cached(path_str: str, mtime_ns: int, size: int) -> MaCrossBacktestConfig:
+    with Path(path_str).open("rb") as f:
+        raw = tomllib.load(f)
     cfg = MaCrossBacktestConfig.model_validate(raw)
     cfg.validate_logic()
     return cfg
+
+
+def apply_backtest_overrides(
+    cfg: MaCrossBacktestConfig,
+    overrides: dict[str, dict[str, Any]],
+) -> MaCrossBacktestConfig:
+    """
+    Returns a new config with the non-None `overrides` (section -> field -> value) applied.
+    The merged data is validated in one pass, so every bad field is reported together.
+    """
+    raw = cfg.model_dump()
+    for section, values in overrides.items():
+        raw[section].update({k: v for k, v in values.items() if v is not None})
+    merged = MaCrossBacktestConfig.model_validate(raw)
+    merged.validate_logic()
+    return merged
+
+
+def load_ma_cross_backtest_config_fast(raw: dict[str, Any]) -> MaCrossBacktestConfig:
+    """
+    Build a config from already-trusted data (e.g. a previous `model_dump()`), skipping
+    pydantic field validation. Only the cross-field `validate_logic` checks run.
+    """
+    cfg = MaCrossBacktestConfig.model_construct(
+        market=MarketConfig.model_construct(**raw.get("market", {})),
+        strategy=StrategyConfig.model_construct(**raw.get("strategy", {})),
+        backtest=BacktestConfig.model_construct(**raw.get("backtest", {})),
+        risk=RiskConfig.model_construct(**raw.get("risk", {})),
+        telegram=TelegramConfig.model_construct(**raw.get("telegram", {})),
+    )
+    cfg.validate_logic()
+    return cfg
@@ -1,4 +1,4 @@
-__all__ = ["Trader"]
+__all__ = ["AccountCache", "Trader"]
 
-from money_dahong.engine.trader import Trader
+from money_dahong.engine.trader import AccountCache, Trader
 
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+
+DEFAULT_RULES_CACHE_DIR = Path.home() / ".cache" / "money-dahong" / "rules"
+# Lot size / notional filters change rarely; an order rejected by them forces a refresh.
+RULES_CACHE_TTL_SECONDS = 24 * 60 * 60.0
+
+_RULES_KEYS = ("base_asset", "quote_asset", "step_size", "min_notional")
+
+
+def rules_cache_path(*, cache_dir: Path, symbol: str) -> Path:
+    return cache_dir / f"{symbol.upper()}.json"
+
+
+def read_rules_cache(path: Path, *, max_age_seconds: float) -> dict[str, str] | None:
+    """
+    Returns the cached symbol rules as strings, or None when missing, stale or unreadable.
+    """
+    try:
+        if time.time() - path.stat().st_mtime > max_age_seconds:
+            return None
+        raw = json.loads(path.read_bytes())
+        rules = {key: raw[key] for key in _RULES_KEYS}
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+    if not all(isinstance(v, str) for v in rules.values()):
+        return None
+    return rules
+
+
+def write_rules_cache(path: Path, rules: dict[str, str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(rules, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, path)
@@ -1,14 +1,26 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import random
 import time
+from collections import deque
+from collections.abc import Coroutine, Sequence
 from dataclasses import dataclass
-from decimal import ROUND_DOWN, Decimal
-from typing import Literal, Optional
-
-from money_dahong.exchange import BinanceSpotClient
-from money_dahong.exchange.binance_spot import Kline
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Literal, Optional
+
+from money_dahong.engine.rules_cache import (
+    RULES_CACHE_TTL_SECONDS,
+    read_rules_cache,
+    rules_cache_path,
+    write_rules_cache,
+)
+from money_dahong.exchange import BinanceApiError, BinanceSpotClient
+from money_dahong.exchange.binance_spot import Kline, kline_stream_available
+from money_dahong.math_utils import trailing_stop_hit
 from money_dahong.notifications import TelegramNotifier
 from money_dahong.settings import Settings
 from money_dahong.strategies.base import Strategy, StrategyContext
@@ -17,7 +29,27 @@ from money_dahong.types import OrderRequest, Signal
 logger = logging.getLogger("money_dahong.trader")
 
 _TICK_ERROR_BACKOFF_SECONDS = 5.0
+# Consecutive tick failures double the backoff up to this; rate-limit / IP-ban errors jump to it.
+_TICK_ERROR_BACKOFF_MAX_SECONDS = 300.0
 _ERROR_NOTIFY_COOLDOWN_SECONDS = 300.0
+# Once the closed-kline window is seeded, each tick only fetches the newest few bars
+# (the last closed ones plus the forming candle) instead of the whole lookback.
+_INCREMENTAL_KLINES_LIMIT = 3
+# Binance may publish a candle slightly after its close time; don't poll before this.
+_CLOSE_GRACE_MS = 500
+# Longest wait between ticks, however far away the next candle close is.
+_MAX_POLL_SECONDS = 900.0
+# Reconnect backoff for the kline stream; polling covers the gap meanwhile.
+_STREAM_RETRY_BASE_SECONDS = 1.0
+_STREAM_RETRY_MAX_SECONDS = 60.0
+# Binance weekly candles open on Monday 00:00 UTC, four days after the epoch.
+_WEEK_ORIGIN_MS = 4 * 24 * 60 * 60_000
+# Startup snapshot, position sync and order sizing often read the account back to back.
+_ACCOUNT_CACHE_TTL_SECONDS = 1.0
+
+# Display quanta for status messages: quote amounts / percentages, and base-asset quantities.
+_Q_CENT = Decimal("0.01")
+_Q_SATOSHI = Decimal("0.00000001")
 
 
 @dataclass
@@ -25,9 +57,13 @@ class TraderState:
     in_position: bool = False
     position_qty: Decimal = Decimal("0")
     last_processed_close_time_ms: int = 0
+    # time.monotonic() of the last fill; 0 = none yet.
     last_trade_time_s: float = 0.0
     entry_price: Decimal = Decimal("0")
     peak_price: Decimal = Decimal("0")
+    # Trailing-stop price levels, refreshed when entry/peak change (0 = not set).
+    arm_price: Decimal = Decimal("0")
+    stop_price: Decimal = Decimal("0")
 
 
 @dataclass(frozen=True)
@@ -38,68 +74,94 @@ class SymbolTradingRules:
     min_notional: Decimal
 
 
+_D0 = Decimal("0")
+_D100 = Decimal("100")
+# Step size assumed when exchangeInfo has no LOT_SIZE filter for the symbol.
+_DEFAULT_STEP_SIZE = Decimal("0.0001")
+
+
 def _floor_to_step(quantity: Decimal, step: Decimal) -> Decimal:
     if step <= 0:
         return quantity
-    steps = (quantity / step).to_integral_value(rounding=ROUND_DOWN)
-    return steps * step
-
-
-def _pct(numerator: Decimal, denominator: Decimal) -> Decimal:
-    if denominator == 0:
-        return Decimal("0")
-    return (numerator / denominator) * Decimal("100")
-
-
-def _should_trailing_stop_exit(
-    *,
-    entry_price: Decimal,
-    peak_price: Decimal,
-    price: Decimal,
-    start_profit_pct: Decimal,
-    drawdown_pct: Decimal,
-) -> bool:
-    if entry_price <= 0 or peak_price <= 0 or price <= 0:
-        return False
-    peak_profit_pct = _pct(peak_price - entry_price, entry_price)
-    if peak_profit_pct < start_profit_pct:
-        return False
-    dd_pct = _pct(peak_price - price, peak_price)
-    return dd_pct >= drawdown_pct
-
-
-def _extract_free_balance(*, account: dict[str, object], asset: str) -> Decimal:
-    balances = account.get("balances", [])
-    if not isinstance(balances, list):
-        return Decimal("0")
-    for b in balances:
-        if not isinstance(b, dict):
-            continue
-        if str(b.get("asset", "")).upper() != asset.upper():
-            continue
-        return Decimal(str(b.get("free", "0")))
-    return Decimal("0")
+    # Decimal `//` truncates toward zero, i.e. ROUND_DOWN to a whole number of steps.
+    return (quantity // step) * step
 
 
-def _extract_balance(*, account: dict[str, object], asset: str) -> tuple[Decimal, Decimal]:
+def _balances_by_asset(account: dict[str, object]) -> dict[str, dict[str, object]]:
+    # One pass over the (often several hundred) balances; amounts are parsed on lookup.
     balances = account.get("balances", [])
+    by_asset: dict[str, dict[str, object]] = {}
     if not isinstance(balances, list):
-        return Decimal("0"), Decimal("0")
+        return by_asset
     for b in balances:
-        if not isinstance(b, dict):
-            continue
-        if str(b.get("asset", "")).upper() != asset.upper():
+        if isinstance(b, dict):
+            by_asset.setdefault(str(b.get("asset", "")).upper(), b)
+    return by_asset
+
+
+def _balance(balances: dict[str, dict[str, object]], asset: str) -> tuple[Decimal, Decimal]:
+    b = balances.get(asset.upper())
+    if b is None:
+        return _D0, _D0
+    return Decimal(str(b.get("free", "0"))), Decimal(str(b.get("locked", "0")))
+
+
+def _free_balance(balances: dict[str, dict[str, object]], asset: str) -> Decimal:
+    b = balances.get(asset.upper())
+    return Decimal(str(b.get("free", "0"))) if b is not None else _D0
+
+
+def _avg_fill_price(*, resp: dict[str, object], executed_qty: Decimal) -> Decimal:
+    # MARKET order responses carry the filled quote total, so the average price needs no
+    # walk over `fills`; the per-fill VWAP is only a fallback for responses without it.
+    quote_qty = resp.get("cummulativeQuoteQty")
+    if quote_qty is not None and executed_qty > 0:
+        total_quote = Decimal(str(quote_qty))
+        if total_quote > 0:
+            return total_quote / executed_qty
+
+    fills = resp.get("fills", [])
+    if not isinstance(fills, list) or not fills:
+        return _D0
+    total_qty = _D0
+    total_quote = _D0
+    for f in fills:
+        if not isinstance(f, dict):
             continue
-        free = Decimal(str(b.get("free", "0")))
-        locked = Decimal(str(b.get("locked", "0")))
-        return free, locked
-    return Decimal("0"), Decimal("0")
+        q = Decimal(str(f.get("qty", "0")))
+        total_qty += q
+        total_quote += q * Decimal(str(f.get("price", "0")))
+    if total_qty <= 0:
+        return _D0
+    return total_quote / total_qty
+
+
+def _is_filter_failure(payload: object) -> bool:
+    # -1013: the order failed a symbol filter (LOT_SIZE, NOTIONAL, ...).
+    return isinstance(payload, dict) and payload.get("code") == -1013
+
+
+def _q_cent(value: Decimal) -> str:
+    return str(value.quantize(_Q_CENT))
 
 
-def _q(value: Decimal, pattern: str) -> str:
-    return str(value.quantize(Decimal(pattern)))
+def _q_sat(value: Decimal) -> str:
+    return str(value.quantize(_Q_SATOSHI))
 
 
+def _tick_error_backoff_s(*, streak: int, error: Exception) -> float:
+    # Jittered so traders for several symbols behind one IP don't retry in lockstep.
+    if isinstance(error, BinanceApiError) and error.status_code in (418, 429):
+        delay = _TICK_ERROR_BACKOFF_MAX_SECONDS
+    else:
+        delay = min(
+            _TICK_ERROR_BACKOFF_MAX_SECONDS,
+            _TICK_ERROR_BACKOFF_SECONDS * 2 ** min(streak - 1, 16),
+        )
+    return delay + random.uniform(0, _TICK_ERROR_BACKOFF_SECONDS)
+
+
+@functools.lru_cache(maxsize=64)
 def _interval_ms(interval: str) -> int | None:
     s = interval.strip()
     if len(s) < 2:
@@ -123,6 +185,7 @@ def _interval_ms(interval: str) -> int | None:
     return None
 
 
+@functools.lru_cache(maxsize=64)
 def _poll_cap_seconds(interval: str) -> float:
     ms = _interval_ms(interval)
     if ms is None:
@@ -142,6 +205,38 @@ def _poll_cap_seconds(interval: str) -> float:
     return 600.0
 
 
+class AccountCache:
+    """
+    Short-lived `account()` snapshot, indexed by asset. Traders that share one client can
+    share one cache, so N symbols cost one signed request per TTL window; concurrent
+    readers wait on the same fetch instead of each issuing their own.
+    """
+
+    def __init__(
+        self,
+        client: BinanceSpotClient,
+        *,
+        ttl_seconds: float = _ACCOUNT_CACHE_TTL_SECONDS,
+    ) -> None:
+        self._client = client
+        self._ttl_seconds = ttl_seconds
+        self._lock = asyncio.Lock()
+        self._cached: tuple[float, dict[str, dict[str, object]]] | None = None
+
+    async def balances(self) -> dict[str, dict[str, object]]:
+        async with self._lock:
+            now = time.monotonic()
+            cached = self._cached
+            if cached is not None and now - cached[0] < self._ttl_seconds:
+                return cached[1]
+            balances = _balances_by_asset(await self._client.account())
+            self._cached = (now, balances)
+            return balances
+
+    def invalidate(self) -> None:
+        self._cached = None
+
+
 class Trader:
     def __init__(
         self,
@@ -157,8 +252,12 @@ class Trader:
         trailing_stop_enabled: bool = False,
         trailing_start_profit_pct: Decimal = Decimal("30"),
         trailing_drawdown_pct: Decimal = Decimal("10"),
+        account_cache: AccountCache | None = None,
+        rules_cache_dir: Path | None = None,
     ) -> None:
         self._settings = settings
+        # Fixed for the process lifetime; read on every sizing and order path.
+        self._live = settings.live_trading_enabled()
         self._client = client
         self._strategy = strategy
         self._notifier = notifier
@@ -169,52 +268,95 @@ class Trader:
         self._trailing_stop_enabled = trailing_stop_enabled
         self._trailing_start_profit_pct = trailing_start_profit_pct
         self._trailing_drawdown_pct = trailing_drawdown_pct
+        self._arm_factor = 1 + trailing_start_profit_pct / _D100
+        self._stop_factor = 1 - trailing_drawdown_pct / _D100
         self._state = TraderState()
         self._rules: SymbolTradingRules | None = None
+        # Where exchangeInfo-derived rules persist across restarts; None disables it.
+        self._rules_cache_dir = rules_cache_dir
         self._symbol = ""
         self._interval = ""
+        self._bar_ms: int | None = None
+        # time.monotonic() of the last error notification; 0 = none yet.
         self._last_error_notify_time_s = 0.0
+        self._suppressed_error_notifies = 0
+        self._tick_error_streak = 0
+        self._closed_klines: deque[Kline] = deque()
+        # Close column kept in lockstep with `_closed_klines` and handed to the strategy.
+        self._closed_closes: list[Decimal] = []
+        self._account_cache = account_cache if account_cache is not None else AccountCache(client)
+        self._tick_lock = asyncio.Lock()
+        # Set by `wake()` (the candle-close timer, or any future stream producer); the run
+        # loop waits on it, with the poll delay from `_tick` as the fallback timeout.
+        self._wake = asyncio.Event()
+        # Fill notifications still in flight; drained when `run` exits.
+        self._notify_tasks: set[asyncio.Task[None]] = set()
+        # close_time_ms of the newest candle the kline stream reported closed.
+        self._streamed_close_ms = 0
+        # Shared `extra` for per-candle log lines; filled in once `run` knows the symbol.
+        self._log_extra: dict[str, str] = {}
 
     async def run(self, *, symbol: str | None = None, interval: str | None = None) -> None:
         symbol = symbol if symbol is not None else self._settings.symbol
         interval = interval if interval is not None else self._settings.interval
         self._symbol = symbol
         self._interval = interval
-
-        exchange_info = await self._client.exchange_info(symbol=symbol)
-        self._rules = self._extract_symbol_rules(exchange_info)
+        self._bar_ms = _interval_ms(interval)
+        self._log_extra = {"symbol": symbol, "strategy_id": self._strategy.strategy_id}
 
         logger.info(
             "trader_started",
             extra={"symbol": symbol, "strategy_id": self._strategy.strategy_id},
         )
-        await self._notifier.send(
-            f"Started: {symbol} {self._strategy.strategy_id} mode={self._settings.trading_mode}"
+        # The start message doesn't depend on the trading rules; send it while they load.
+        self._rules, _ = await asyncio.gather(
+            self._load_symbol_rules(symbol=symbol),
+            self._notifier.send(
+                f"Started: {symbol} {self._strategy.strategy_id} "
+                f"mode={self._settings.trading_mode}"
+            ),
         )
 
-        if self._settings.live_trading_enabled() and self._rules is not None:
-            try:
-                await self._sync_position_from_account(
+        if self._rules is not None:
+            # Independent REST reads, so overlap them; both read the account through the
+            # shared cache, which turns that into a single request.
+            startup: dict[str, Coroutine[Any, Any, None]] = {}
+            if self._live:
+                startup["sync_position_failed"] = self._sync_position_from_account(
                     symbol=symbol,
                     base_asset=self._rules.base_asset,
                 )
-            except Exception:
-                logger.exception("sync_position_failed", extra={"symbol": symbol})
-
-        if self._rules is not None:
-            try:
-                await self._send_startup_snapshot(
-                    symbol=symbol,
-                    interval=interval,
-                    rules=self._rules,
+            startup["startup_snapshot_failed"] = self._send_startup_snapshot(
+                symbol=symbol,
+                interval=interval,
+                rules=self._rules,
+            )
+            results = await asyncio.gather(*startup.values(), return_exceptions=True)
+            for event, result in zip(startup, results, strict=True):
+                if isinstance(result, Exception):
+                    logger.error(event, exc_info=result, extra={"symbol": symbol})
+                elif isinstance(result, BaseException):
+                    raise result
+
+        wakers: list[asyncio.Task[None]] = []
+        if self._bar_ms is not None:
+            wakers.append(
+                asyncio.create_task(
+                    self._candle_close_timer(interval=interval, bar_ms=self._bar_ms)
                 )
-            except Exception:
-                logger.exception("startup_snapshot_failed", extra={"symbol": symbol})
-
+            )
+        if self._settings.kline_stream:
+            if kline_stream_available():
+                wakers.append(
+                    asyncio.create_task(self._wake_on_stream(symbol=symbol, interval=interval))
+                )
+            else:
+                logger.warning("kline_stream_unavailable", extra={"symbol": symbol})
         try:
             while True:
                 try:
                     sleep_s = await self._tick(symbol=symbol, interval=interval)
+                    self._tick_error_streak = 0
                 except asyncio.CancelledError:
                     raise
                 except Exception as e:
@@ -223,25 +365,84 @@ class Trader:
                         interval=interval,
                         error=e,
                     )
-                await asyncio.sleep(sleep_s)
+                await self._wait_for_wake(timeout_s=sleep_s)
         except asyncio.CancelledError:
             raise
         except KeyboardInterrupt:
             logger.info("trader_stopped", extra={"symbol": symbol})
         finally:
+            for waker in wakers:
+                waker.cancel()
+            if self._notify_tasks:
+                await asyncio.gather(*self._notify_tasks, return_exceptions=True)
             await self._notifier.send(f"Stopped: {symbol} {self._strategy.strategy_id}")
 
+    def wake(self) -> None:
+        """Run the next tick now instead of waiting out the candle-close timer."""
+        self._wake.set()
+
+    async def _wait_for_wake(self, *, timeout_s: float) -> None:
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=timeout_s)
+        except TimeoutError:
+            pass
+        self._wake.clear()
+
+    async def _candle_close_timer(self, *, interval: str, bar_ms: int) -> None:
+        # Wakes the run loop just after each candle boundary instead of up to a poll cap later.
+        origin_ms = _WEEK_ORIGIN_MS if interval.strip().endswith("w") else 0
+        while True:
+            now_ms = int(time.time() * 1000)
+            next_open_ms = now_ms - (now_ms - origin_ms) % bar_ms + bar_ms
+            await asyncio.sleep((next_open_ms + _CLOSE_GRACE_MS - now_ms) / 1000.0)
+            self.wake()
+
+    async def _wake_on_stream(self, *, symbol: str, interval: str) -> None:
+        # The stream only triggers ticks; the tick still reads the kline window over REST, so
+        # a dropped connection costs latency (timer and polling take over), never data.
+        retry_s = _STREAM_RETRY_BASE_SECONDS
+        while True:
+            try:
+                async for kline in self._client.closed_klines(symbol=symbol, interval=interval):
+                    retry_s = _STREAM_RETRY_BASE_SECONDS
+                    self._streamed_close_ms = max(self._streamed_close_ms, kline.close_time_ms)
+                    self.wake()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("kline_stream_disconnected", extra={"symbol": symbol}, exc_info=True)
+            await asyncio.sleep(retry_s)
+            retry_s = min(retry_s * 2, _STREAM_RETRY_MAX_SECONDS)
+
     async def _tick(self, *, symbol: str, interval: str) -> float:
+        # Ticks read and mutate `_state` across awaits; never let two of them interleave.
+        async with self._tick_lock:
+            return await self._tick_locked(symbol=symbol, interval=interval)
+
+    async def _tick_locked(self, *, symbol: str, interval: str) -> float:
         if self._rules is None:
             return 3.0
 
+        # Until the next candle can have closed there is nothing new to fetch; the poll cap
+        # then only costs a clock read instead of a REST round-trip.
+        last_processed_ms = self._state.last_processed_close_time_ms
+        if last_processed_ms and self._bar_ms is not None:
+            next_close_ms = last_processed_ms + self._bar_ms
+            # A stream close event means the candle is published; no need to wait the grace.
+            streamed = self._streamed_close_ms >= next_close_ms
+            if not streamed and int(time.time() * 1000) < next_close_ms + _CLOSE_GRACE_MS:
+                return self._sleep_until_next_close_s(last_closed_close_ms=last_processed_ms)
+
         lookback_bars = 200
         if hasattr(self._strategy, "lookback_bars"):
             lookback_bars = max(lookback_bars, int(self._strategy.lookback_bars))
         lookback_bars = min(1000, lookback_bars)
 
-        klines = await self._client.klines(symbol=symbol, interval=interval, limit=lookback_bars)
-        closed_klines = self._closed_only(klines)
+        closed_klines, closes = await self._fetch_closed_klines(
+            symbol=symbol,
+            interval=interval,
+            lookback_bars=lookback_bars,
+        )
         if len(closed_klines) < 3:
             return _poll_cap_seconds(interval)
 
@@ -255,18 +456,17 @@ class Trader:
         # Exit protection: trailing stop has higher priority than the strategy signal.
         if self._state.in_position and self._trailing_stop_enabled:
             if self._state.peak_price <= 0:
-                self._state.peak_price = (
+                self._set_peak(
                     self._state.entry_price if self._state.entry_price > 0 else last_price
                 )
             if last_price > self._state.peak_price:
-                self._state.peak_price = last_price
+                self._set_peak(last_price)
 
-            if _should_trailing_stop_exit(
-                entry_price=self._state.entry_price,
+            if trailing_stop_hit(
+                arm_price=self._state.arm_price,
+                stop_price=self._state.stop_price,
                 peak_price=self._state.peak_price,
                 price=last_price,
-                start_profit_pct=self._trailing_start_profit_pct,
-                drawdown_pct=self._trailing_drawdown_pct,
             ):
                 trailing_signal = Signal(side="SELL", reason="trailing_stop")
                 order = await self._build_order(
@@ -284,30 +484,27 @@ class Trader:
             symbol=symbol,
             in_position=self._state.in_position,
             position_qty=self._state.position_qty,
+            closes=closes,
         )
-        signal = self._strategy.generate_signal(klines=closed_klines, ctx=ctx)
-        if not signal:
-            logger.info(
-                "no_signal",
-                extra={"symbol": symbol, "strategy_id": self._strategy.strategy_id},
+        if self._strategy.cpu_bound:
+            # Ticks are serialized by `_tick_lock`, so signals still come out in bar order.
+            signal = await asyncio.to_thread(
+                self._strategy.generate_signal, klines=closed_klines, ctx=ctx
             )
+        else:
+            signal = self._strategy.generate_signal(klines=closed_klines, ctx=ctx)
+        if not signal:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("no_signal", extra=self._log_extra)
             return self._sleep_until_next_close_s(last_closed_close_ms=last_closed.close_time_ms)
 
-        if signal.side == "BUY" and (
-            time.time() - self._state.last_trade_time_s < self._settings.cooldown_seconds
-        ):
-            logger.warning(
-                "signal_blocked_cooldown",
-                extra={"symbol": symbol, "strategy_id": self._strategy.strategy_id},
-            )
+        if signal.side == "BUY" and self._in_trade_cooldown():
+            logger.warning("signal_blocked_cooldown", extra=self._log_extra)
             return self._sleep_until_next_close_s(last_closed_close_ms=last_closed.close_time_ms)
 
         order = await self._build_order(signal=signal, last_price=last_price, rules=self._rules)
         if not order:
-            logger.warning(
-                "signal_blocked_no_order",
-                extra={"symbol": symbol, "strategy_id": self._strategy.strategy_id},
-            )
+            logger.warning("signal_blocked_no_order", extra=self._log_extra)
             return self._sleep_until_next_close_s(last_closed_close_ms=last_closed.close_time_ms)
 
         await self._execute(order=order, signal=signal, last_price=last_price)
@@ -323,9 +520,12 @@ class Trader:
         if not self._notifier.enabled():
             return
 
+        # The price lookup doesn't need the account; fetch both at once.
+        price_task = asyncio.create_task(self._last_price(symbol=symbol))
         try:
-            account = await self._client.account()
+            balances = await self._account_balances()
         except Exception as e:
+            price_task.cancel()
             header = (
                 f"{symbol} | {interval} | {self._strategy.strategy_id} | "
                 f"mode={self._settings.trading_mode}"
@@ -341,25 +541,25 @@ class Trader:
             )
             return
 
-        quote_free, quote_locked = _extract_balance(account=account, asset=rules.quote_asset)
-        base_free, base_locked = _extract_balance(account=account, asset=rules.base_asset)
+        quote_free, quote_locked = _balance(balances, rules.quote_asset)
+        base_free, base_locked = _balance(balances, rules.base_asset)
         quote_total = quote_free + quote_locked
         base_total = base_free + base_locked
 
-        last_price = await self._last_price(symbol=symbol, interval=interval)
-        equity = quote_total + (base_total * last_price) if last_price > 0 else Decimal("0")
+        last_price = await price_task
+        equity = quote_total + (base_total * last_price) if last_price > 0 else _D0
 
         if self._position_sizing == "cash_fraction":
-            sizing = f"复利 {_q(self._cash_fraction * Decimal('100'), '0.01')}% 现金"
+            sizing = f"复利 {_q_cent(self._cash_fraction * _D100)}% 现金"
         else:
-            sizing = f"固定名义 {_q(self._order_notional_usdt, '0.01')} {rules.quote_asset}"
+            sizing = f"固定名义 {_q_cent(self._order_notional_usdt)} {rules.quote_asset}"
 
         trail = (
             "关闭"
             if not self._trailing_stop_enabled
             else (
-                f"start={_q(self._trailing_start_profit_pct, '0.01')}% "
-                f"dd={_q(self._trailing_drawdown_pct, '0.01')}%"
+                f"start={_q_cent(self._trailing_start_profit_pct)}% "
+                f"dd={_q_cent(self._trailing_drawdown_pct)}%"
             )
         )
 
@@ -368,15 +568,15 @@ class Trader:
             f"mode={self._settings.trading_mode}"
         )
         quote_line = (
-            f"余额: {rules.quote_asset} free={_q(quote_free, '0.01')} "
-            f"locked={_q(quote_locked, '0.01')}"
+            f"余额: {rules.quote_asset} free={_q_cent(quote_free)} "
+            f"locked={_q_cent(quote_locked)}"
         )
         base_line = (
-            f"持仓: {rules.base_asset} free={_q(base_free, '0.00000001')} "
-            f"locked={_q(base_locked, '0.00000001')}"
+            f"持仓: {rules.base_asset} free={_q_sat(base_free)} "
+            f"locked={_q_sat(base_locked)}"
         )
         sizing_line = (
-            f"仓位: {sizing} (cap={_q(self._max_order_notional_usdt, '0.01')} {rules.quote_asset})"
+            f"仓位: {sizing} (cap={_q_cent(self._max_order_notional_usdt)} {rules.quote_asset})"
         )
         await self._notifier.send(
             "\n".join(
@@ -385,32 +585,74 @@ class Trader:
                     header,
                     quote_line,
                     base_line,
-                    f"价格: {symbol} ≈ {_q(last_price, '0.01')} {rules.quote_asset}",
-                    f"权益: ≈ {_q(equity, '0.01')} {rules.quote_asset}",
+                    f"价格: {symbol} ≈ {_q_cent(last_price)} {rules.quote_asset}",
+                    f"权益: ≈ {_q_cent(equity)} {rules.quote_asset}",
                     sizing_line,
                     f"离场保护: {trail}",
                 ]
             )
         )
 
-    async def _last_price(self, *, symbol: str, interval: str) -> Decimal:
+    async def _account_balances(self) -> dict[str, dict[str, object]]:
+        return await self._account_cache.balances()
+
+    async def _last_price(self, *, symbol: str) -> Decimal:
         try:
-            klines = await self._client.klines(symbol=symbol, interval=interval, limit=1)
+            return await self._client.ticker_price(symbol=symbol)
         except Exception:
-            return Decimal("0")
-        if not klines:
-            return Decimal("0")
-        return klines[-1].close
+            return _D0
 
     def _sleep_until_next_close_s(self, *, last_closed_close_ms: int) -> float:
-        cap = _poll_cap_seconds(self._interval)
-        ms = _interval_ms(self._interval)
+        ms = self._bar_ms
         if ms is None:
-            return cap
-        now_ms = int(time.time() * 1000)
-        next_close_ms = last_closed_close_ms + ms
-        seconds = max(3.0, (next_close_ms - now_ms) / 1000.0 + 1.0)
-        return min(cap, seconds)
+            return _poll_cap_seconds(self._interval)
+        remaining_ms = last_closed_close_ms + ms - int(time.time() * 1000)
+        # Sleep through most of the candle and only poll tightly around its close (including
+        # just after it, while Binance publishes). The candle-close timer wakes the loop at
+        # the boundary anyway; the upper bound is only a safety net.
+        if remaining_ms > 10_000:
+            return min(_MAX_POLL_SECONDS, (remaining_ms - 5_000) / 1000.0)
+        if remaining_ms > 3_000:
+            return 2.0
+        return 0.5
+
+    async def _fetch_closed_klines(
+        self,
+        *,
+        symbol: str,
+        interval: str,
+        lookback_bars: int,
+    ) -> tuple[Sequence[Kline], list[Decimal]]:
+        """
+        Returns the closed-kline window and its close prices (the strategy's close column).
+        The window is only valid until the next fetch, which updates it in place.
+        """
+        # REST `/klines` with limit=N returns N-1 closed bars plus the forming one.
+        window_len = max(1, lookback_bars - 1)
+        window = self._closed_klines
+        step_ms = _interval_ms(interval)
+        if window and step_ms is not None and window.maxlen == window_len:
+            recent = await self._client.klines(
+                symbol=symbol,
+                interval=interval,
+                limit=_INCREMENTAL_KLINES_LIMIT,
+            )
+            last_open_ms = window[-1].open_time_ms
+            new = [k for k in self._closed_only(recent) if k.open_time_ms > last_open_ms]
+            # Contiguous with the window (or nothing new yet): extend in place. A gap means we
+            # missed bars (e.g. a long error backoff), so fall through and reseed.
+            if not new or new[0].open_time_ms == last_open_ms + step_ms:
+                window.extend(new)
+                closes = self._closed_closes
+                closes.extend(k.close for k in new)
+                del closes[: len(closes) - len(window)]
+                return window, closes
+
+        klines = await self._client.klines(symbol=symbol, interval=interval, limit=lookback_bars)
+        closed = self._closed_only(klines)
+        self._closed_klines = deque(closed, maxlen=window_len)
+        self._closed_closes = [k.close for k in closed]
+        return closed, self._closed_closes
 
     def _closed_only(self, klines: list[Kline]) -> list[Kline]:
         # Binance REST `/klines` includes the currently-forming candle as the last item.
@@ -441,11 +683,11 @@ class Trader:
         return None
 
     async def _buy_quote_notional_usdt(self, *, rules: SymbolTradingRules) -> Decimal:
-        desired = Decimal("0")
+        desired = _D0
         if self._position_sizing == "cash_fraction":
-            if self._settings.live_trading_enabled():
-                account = await self._client.account()
-                free_quote = _extract_free_balance(account=account, asset=rules.quote_asset)
+            if self._live:
+                balances = await self._account_balances()
+                free_quote = _free_balance(balances, rules.quote_asset)
                 desired = free_quote * self._cash_fraction
             else:
                 desired = self._max_order_notional_usdt
@@ -453,16 +695,16 @@ class Trader:
             desired = self._order_notional_usdt
 
         if desired <= 0:
-            return Decimal("0")
+            return _D0
         return min(desired, self._max_order_notional_usdt)
 
     async def _sell_quantity(self, *, rules: SymbolTradingRules) -> Decimal:
         qty = self._state.position_qty
-        if self._settings.live_trading_enabled():
-            account = await self._client.account()
-            qty = _extract_free_balance(account=account, asset=rules.base_asset)
+        if self._live:
+            balances = await self._account_balances()
+            qty = _free_balance(balances, rules.base_asset)
         qty = _floor_to_step(qty, rules.step_size)
-        return qty if qty > 0 else Decimal("0")
+        return qty if qty > 0 else _D0
 
     async def _execute(self, *, order: OrderRequest, signal: Signal, last_price: Decimal) -> None:
         symbol = order.symbol
@@ -475,7 +717,7 @@ class Trader:
             },
         )
 
-        if not self._settings.live_trading_enabled():
+        if not self._live:
             quote_asset = self._rules.quote_asset if self._rules else "USDT"
             qty_hint = (
                 f"qty={order.quantity}"
@@ -483,8 +725,8 @@ class Trader:
                 else f"quote≈{order.quote_order_qty} {quote_asset}"
             )
             self._apply_fill_locally(order=order, last_price=last_price)
-            self._state.last_trade_time_s = time.time()
-            await self._safe_notify(
+            self._state.last_trade_time_s = time.monotonic()
+            self._notify_in_background(
                 message=(
                     f"[DRY_RUN] {symbol} {signal.side} {qty_hint} "
                     f"price≈{last_price} reason={signal.reason}"
@@ -493,12 +735,29 @@ class Trader:
             )
             return
 
-        resp = await self._client.new_order_market(
-            symbol=order.symbol,
-            side=order.side,
-            quantity=order.quantity,
-            quote_order_qty=order.quote_order_qty,
-        )
+        try:
+            resp = await self._client.new_order_market(
+                symbol=order.symbol,
+                side=order.side,
+                quantity=order.quantity,
+                quote_order_qty=order.quote_order_qty,
+            )
+        except BinanceApiError as e:
+            if _is_filter_failure(e.payload):
+                # Lot size / notional rules may have changed since they were cached.
+                self._rules = await self._load_symbol_rules(symbol=symbol, refresh=True)
+            raise
+        except asyncio.CancelledError:
+            # Local state is only touched after the response, so there is nothing to roll
+            # back; but the exchange may have filled the order. The next start resyncs the
+            # position from the account.
+            logger.warning(
+                "order_cancelled_in_flight",
+                extra={"symbol": symbol, "strategy_id": self._strategy.strategy_id},
+            )
+            raise
+        # The fill moved balances; the next sizing call must read the account again.
+        self._account_cache.invalidate()
         order_id = str(resp.get("orderId", ""))
         logger.info(
             "order_placed",
@@ -515,8 +774,8 @@ class Trader:
             else f"quote={order.quote_order_qty} {quote_asset}"
         )
         self._apply_fill_locally(order=order, last_price=last_price, resp=resp)
-        self._state.last_trade_time_s = time.time()
-        await self._safe_notify(
+        self._state.last_trade_time_s = time.monotonic()
+        self._notify_in_background(
             message=(
                 f"[LIVE] {symbol} {order.side} {qty_hint} "
                 f"order_id={order_id} reason={signal.reason}"
@@ -524,6 +783,12 @@ class Trader:
             symbol=symbol,
         )
 
+    def _notify_in_background(self, *, message: str, symbol: str) -> None:
+        # Nothing after a fill waits on Telegram; let `_execute` return right away.
+        task = asyncio.create_task(self._safe_notify(message=message, symbol=symbol))
+        self._notify_tasks.add(task)
+        task.add_done_callback(self._notify_tasks.discard)
+
     async def _safe_notify(self, *, message: str, symbol: str) -> None:
         try:
             await self._notifier.send(message)
@@ -548,17 +813,25 @@ class Trader:
                 "strategy_id": self._strategy.strategy_id,
             },
         )
-        now_s = time.time()
-        if now_s - self._last_error_notify_time_s >= _ERROR_NOTIFY_COOLDOWN_SECONDS:
-            self._last_error_notify_time_s = now_s
-            await self._safe_notify(
-                message=(
+        # A disabled notifier would drop the message anyway; don't build it.
+        if self._notifier.enabled():
+            now_s = time.monotonic()
+            last_s = self._last_error_notify_time_s
+            if last_s == 0 or now_s - last_s >= _ERROR_NOTIFY_COOLDOWN_SECONDS:
+                self._last_error_notify_time_s = now_s
+                message = (
                     f"[ERROR] {symbol} {interval} {self._strategy.strategy_id} "
                     f"tick_failed={type(error).__name__}: {error}"
-                ),
-                symbol=symbol,
-            )
-        return _TICK_ERROR_BACKOFF_SECONDS
+                )
+                # Errors dropped during the cooldown are counted onto the next message.
+                if self._suppressed_error_notifies:
+                    message += f" (+{self._suppressed_error_notifies} suppressed)"
+                    self._suppressed_error_notifies = 0
+                await self._safe_notify(message=message, symbol=symbol)
+            else:
+                self._suppressed_error_notifies += 1
+        self._tick_error_streak += 1
+        return _tick_error_backoff_s(streak=self._tick_error_streak, error=error)
 
     def _apply_fill_locally(
         self,
@@ -567,24 +840,12 @@ class Trader:
         last_price: Decimal,
         resp: dict[str, object] | None = None,
     ) -> None:
-        executed_qty = Decimal("0")
-        avg_price = Decimal("0")
+        executed_qty = _D0
+        avg_price = _D0
 
         if resp is not None:
             executed_qty = Decimal(str(resp.get("executedQty", "0")))
-            fills = resp.get("fills", [])
-            if isinstance(fills, list) and fills:
-                total_qty = Decimal("0")
-                total_quote = Decimal("0")
-                for f in fills:
-                    if not isinstance(f, dict):
-                        continue
-                    q = Decimal(str(f.get("qty", "0")))
-                    p = Decimal(str(f.get("price", "0")))
-                    total_qty += q
-                    total_quote += q * p
-                if total_qty > 0:
-                    avg_price = total_quote / total_qty
+            avg_price = _avg_fill_price(resp=resp, executed_qty=executed_qty)
 
         if order.side == "BUY":
             self._state.in_position = True
@@ -601,42 +862,94 @@ class Trader:
                 self._state.position_qty = self._state.position_qty + executed_qty
             if self._state.entry_price <= 0:
                 self._state.entry_price = avg_price if avg_price > 0 else last_price
+                self._state.arm_price = self._state.entry_price * self._arm_factor
             if self._state.peak_price <= 0:
-                self._state.peak_price = self._state.entry_price
+                self._set_peak(self._state.entry_price)
         else:
             self._state.in_position = False
-            self._state.position_qty = Decimal("0")
-            self._state.entry_price = Decimal("0")
-            self._state.peak_price = Decimal("0")
+            self._state.position_qty = _D0
+            self._state.entry_price = _D0
+            self._state.peak_price = _D0
+            self._state.arm_price = _D0
+            self._state.stop_price = _D0
+
+    def _in_trade_cooldown(self) -> bool:
+        # Monotonic clock, so NTP steps can neither extend nor skip the cooldown.
+        last = self._state.last_trade_time_s
+        return last > 0 and time.monotonic() - last < self._settings.cooldown_seconds
+
+    def _set_peak(self, price: Decimal) -> None:
+        self._state.peak_price = price
+        self._state.stop_price = price * self._stop_factor
 
     async def _sync_position_from_account(self, *, symbol: str, base_asset: str) -> None:
-        account = await self._client.account()
-        qty = _extract_free_balance(account=account, asset=base_asset)
+        balances = await self._account_balances()
+        qty = _free_balance(balances, base_asset)
         if qty > 0:
             self._state.in_position = True
             self._state.position_qty = qty
             logger.info("position_synced", extra={"symbol": symbol, "qty": str(qty)})
         else:
             self._state.in_position = False
-            self._state.position_qty = Decimal("0")
+            self._state.position_qty = _D0
             logger.info("position_synced", extra={"symbol": symbol, "qty": "0"})
 
+    async def _load_symbol_rules(
+        self,
+        *,
+        symbol: str,
+        refresh: bool = False,
+    ) -> SymbolTradingRules:
+        path = (
+            rules_cache_path(cache_dir=self._rules_cache_dir, symbol=symbol)
+            if self._rules_cache_dir is not None
+            else None
+        )
+        if path is not None and not refresh:
+            cached = read_rules_cache(path, max_age_seconds=RULES_CACHE_TTL_SECONDS)
+            if cached is not None:
+                try:
+                    return SymbolTradingRules(
+                        base_asset=cached["base_asset"],
+                        quote_asset=cached["quote_asset"],
+                        step_size=Decimal(cached["step_size"]),
+                        min_notional=Decimal(cached["min_notional"]),
+                    )
+                except ArithmeticError:
+                    pass
+
+        rules = self._extract_symbol_rules(await self._client.exchange_info(symbol=symbol))
+        if path is not None and rules.base_asset:
+            try:
+                write_rules_cache(
+                    path,
+                    {
+                        "base_asset": rules.base_asset,
+                        "quote_asset": rules.quote_asset,
+                        "step_size": str(rules.step_size),
+                        "min_notional": str(rules.min_notional),
+                    },
+                )
+            except OSError:
+                logger.warning("rules_cache_write_failed", extra={"symbol": symbol})
+        return rules
+
     def _extract_symbol_rules(self, exchange_info: dict[str, object]) -> SymbolTradingRules:
         symbols = exchange_info.get("symbols", [])
         if not isinstance(symbols, list) or not symbols:
             return SymbolTradingRules(
                 base_asset="",
                 quote_asset="",
-                step_size=Decimal("0.0001"),
-                min_notional=Decimal("0"),
+                step_size=_DEFAULT_STEP_SIZE,
+                min_notional=_D0,
             )
         first = symbols[0]
         if not isinstance(first, dict):
             return SymbolTradingRules(
                 base_asset="",
                 quote_asset="",
-                step_size=Decimal("0.0001"),
-                min_notional=Decimal("0"),
+                step_size=_DEFAULT_STEP_SIZE,
+                min_notional=_D0,
             )
 
         base_asset = str(first.get("baseAsset", ""))
@@ -646,12 +959,12 @@ class Trader:
             return SymbolTradingRules(
                 base_asset=base_asset,
                 quote_asset=quote_asset,
-                step_size=Decimal("0.0001"),
-                min_notional=Decimal("0"),
+                step_size=_DEFAULT_STEP_SIZE,
+                min_notional=_D0,
             )
 
-        step_size = Decimal("0.0001")
-        min_notional = Decimal("0")
+        step_size = _DEFAULT_STEP_SIZE
+        min_notional = _D0
         for f in filters:
             if isinstance(f, dict) and f.get("filterType") == "LOT_SIZE":
                 step_size = Decimal(str(f.get("stepSize", "0.0001")))
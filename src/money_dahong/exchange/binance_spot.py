@@ -2,21 +2,33 @@ from __future__ import annotations
 
 import asyncio
 import hmac
+import importlib
 import time
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from decimal import Decimal
 from hashlib import sha256
+from types import ModuleType
 from typing import Any, cast
 from urllib.parse import urlencode
 
 import httpx
 
+from money_dahong.json_utils import loads
 from money_dahong.types import Side
 
+try:
+    _websockets: ModuleType | None = importlib.import_module("websockets")
+except ImportError:  # kline streaming, installed with the `stream` extra
+    _websockets = None
+
 _DEFAULT_RECV_WINDOW_MS = 5_000
 _DEFAULT_MAX_RETRIES = 3
 _DEFAULT_RETRY_BASE_SECONDS = 0.5
 _DEFAULT_RETRY_MAX_SECONDS = 8.0
+# httpx drops idle pooled connections after 5s by default, which is shorter than most
+# trader sleeps, so every tick would pay a fresh TLS handshake. Keep them around longer.
+_POOL_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=10, keepalive_expiry=75.0)
 
 
 class BinanceApiError(RuntimeError):
@@ -33,17 +45,18 @@ def _normalize_value(value: Any) -> str:
 
 
 def build_query_string(params: dict[str, Any]) -> str:
-    items: list[tuple[str, str]] = []
-    for key in sorted(params.keys()):
-        value = params[key]
-        if value is None:
-            continue
-        items.append((key, _normalize_value(value)))
-    return urlencode(items)
+    # Binance verifies the signature against the query exactly as sent, in any order; the
+    # client sends this very string, so insertion order is kept rather than sorting.
+    return urlencode([(k, _normalize_value(v)) for k, v in params.items() if v is not None])
+
 
+def kline_stream_available() -> bool:
+    return _websockets is not None
 
-def _compact_params(params: dict[str, Any]) -> dict[str, Any]:
-    return {k: v for k, v in params.items() if v is not None}
+
+def _now_ms() -> int:
+    # Integer clock: no float multiply/truncate that can land the timestamp a ms off.
+    return time.time_ns() // 1_000_000
 
 
 def sign_query_string(query_string: str, api_secret: str) -> str:
@@ -51,7 +64,8 @@ def sign_query_string(query_string: str, api_secret: str) -> str:
     return mac.hexdigest()
 
 
-@dataclass(frozen=True)
+# Backtests hold thousands of these; slots drop the per-instance __dict__.
+@dataclass(frozen=True, slots=True)
 class Kline:
     open_time_ms: int
     open: Decimal
@@ -69,6 +83,7 @@ class BinanceSpotClient:
         api_key: str,
         api_secret: str,
         base_url: str = "https://api.binance.com",
+        stream_url: str = "wss://stream.binance.com:9443",
         timeout_seconds: float = 10.0,
         recv_window_ms: int = _DEFAULT_RECV_WINDOW_MS,
         max_retries: int = _DEFAULT_MAX_RETRIES,
@@ -79,21 +94,31 @@ class BinanceSpotClient:
         self._api_key = api_key
         self._api_secret = api_secret
         self._base_url = base_url.rstrip("/")
+        self._stream_url = stream_url.rstrip("/")
         self._recv_window_ms = int(max(1, recv_window_ms))
         self._max_retries = int(max(0, max_retries))
         self._retry_base_seconds = float(max(0.0, retry_base_seconds))
         self._retry_max_seconds = float(max(self._retry_base_seconds, retry_max_seconds))
         self._time_offset_ms = 0
+        # Keyed once; each signature copies it instead of re-running the HMAC key schedule.
+        self._hmac = hmac.new(api_secret.encode("utf-8"), digestmod=sha256) if api_secret else None
         self._client = httpx.AsyncClient(
             base_url=self._base_url,
             timeout=httpx.Timeout(timeout_seconds),
             headers={"X-MBX-APIKEY": api_key} if api_key else {},
+            limits=_POOL_LIMITS,
             transport=transport,
         )
 
     async def aclose(self) -> None:
         await self._client.aclose()
 
+    async def __aenter__(self) -> BinanceSpotClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
     async def ping(self) -> None:
         await self._request("GET", "/api/v3/ping", signed=False, params={})
 
@@ -110,6 +135,15 @@ class BinanceSpotClient:
         )
         return cast(dict[str, Any], data)
 
+    async def ticker_price(self, *, symbol: str) -> Decimal:
+        data = await self._request(
+            "GET",
+            "/api/v3/ticker/price",
+            signed=False,
+            params={"symbol": symbol},
+        )
+        return Decimal(data["price"])
+
     async def klines(
         self,
         *,
@@ -131,20 +165,41 @@ class BinanceSpotClient:
                 "endTime": end_time_ms,
             },
         )
-        klines: list[Kline] = []
-        for row in raw:
-            klines.append(
-                Kline(
-                    open_time_ms=int(row[0]),
-                    open=Decimal(row[1]),
-                    high=Decimal(row[2]),
-                    low=Decimal(row[3]),
-                    close=Decimal(row[4]),
-                    volume=Decimal(row[5]),
-                    close_time_ms=int(row[6]),
-                )
+        return [
+            Kline(
+                open_time_ms=int(row[0]),
+                open=Decimal(row[1]),
+                high=Decimal(row[2]),
+                low=Decimal(row[3]),
+                close=Decimal(row[4]),
+                volume=Decimal(row[5]),
+                close_time_ms=int(row[6]),
             )
-        return klines
+            for row in raw
+        ]
+
+    async def closed_klines(self, *, symbol: str, interval: str) -> AsyncIterator[Kline]:
+        """
+        Yield each kline from the `<symbol>@kline_<interval>` stream once Binance marks it
+        closed. Runs until the connection drops; reconnecting is up to the caller.
+        """
+        if _websockets is None:
+            raise RuntimeError("kline streaming needs the `stream` extra (websockets)")
+        url = f"{self._stream_url}/ws/{symbol.lower()}@kline_{interval}"
+        async with _websockets.connect(url) as ws:
+            async for message in ws:
+                k = loads(message).get("k")
+                if not k or not k.get("x"):
+                    continue
+                yield Kline(
+                    open_time_ms=int(k["t"]),
+                    open=Decimal(k["o"]),
+                    high=Decimal(k["h"]),
+                    low=Decimal(k["l"]),
+                    close=Decimal(k["c"]),
+                    volume=Decimal(k["v"]),
+                    close_time_ms=int(k["T"]),
+                )
 
     async def account(self) -> dict[str, Any]:
         data = await self._request("GET", "/api/v3/account", signed=True, params={})
@@ -182,21 +237,24 @@ class BinanceSpotClient:
     ) -> Any:
         attempt = 0
         while True:
-            request_params = _compact_params(dict(params))
+            # build_query_string drops None values while encoding, and the request carries that
+            # exact string, so a signature always covers the bytes Binance receives.
             if signed:
-                if not self._api_secret:
+                if self._hmac is None:
                     raise RuntimeError("BINANCE_API_SECRET is required for signed endpoints")
-                request_params.setdefault("recvWindow", self._recv_window_ms)
-                request_params.setdefault(
-                    "timestamp",
-                    int(time.time() * 1000) + self._time_offset_ms,
-                )
-                query_string = build_query_string(request_params)
-                signature = sign_query_string(query_string, self._api_secret)
-                request_params["signature"] = signature
+                signed_params = dict(params)
+                signed_params.setdefault("recvWindow", self._recv_window_ms)
+                signed_params.setdefault("timestamp", _now_ms() + self._time_offset_ms)
+                query_string = build_query_string(signed_params)
+                mac = self._hmac.copy()
+                mac.update(query_string.encode("utf-8"))
+                query_string = f"{query_string}&signature={mac.hexdigest()}"
+            else:
+                query_string = build_query_string(params)
+            url = f"{path}?{query_string}" if query_string else path
 
             try:
-                response = await self._client.request(method, path, params=request_params)
+                response = await self._client.request(method, url)
             except (httpx.TimeoutException, httpx.TransportError):
                 if attempt >= self._max_retries:
                     raise
@@ -232,18 +290,18 @@ class BinanceSpotClient:
 
                 raise BinanceApiError(status_code=response.status_code, payload=payload)
 
-            return response.json()
+            # Decode straight from the bytes; account payloads carry hundreds of balances.
+            return loads(response.content)
 
     async def _sync_time_offset_ms(self) -> bool:
         try:
             response = await self._client.request("GET", "/api/v3/time", params={})
             if response.status_code >= 400:
                 return False
-            data = response.json()
-            server_ms = int(data["serverTime"])
+            server_ms = int(loads(response.content)["serverTime"])
         except Exception:
             return False
-        self._time_offset_ms = server_ms - int(time.time() * 1000)
+        self._time_offset_ms = server_ms - _now_ms()
         return True
 
     def _retry_delay_seconds(
@@ -266,12 +324,8 @@ class BinanceSpotClient:
 
 
 def _is_timestamp_error(payload: Any) -> bool:
-    if not isinstance(payload, dict):
-        return False
-    try:
-        return int(payload.get("code", 0)) == -1021
-    except (TypeError, ValueError):
-        return False
+    # Binance error codes are JSON integers, so no int() coercion (and its except path).
+    return isinstance(payload, dict) and payload.get("code") == -1021
 
 
 def _should_retry_http_error(*, status_code: int) -> bool:
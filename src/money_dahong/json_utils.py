@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import importlib
+import json
+from types import ModuleType
+from typing import Any
+
+# import_module keeps one declaration that type-checks whether or not the extra is installed.
+try:
+    _orjson: ModuleType | None = importlib.import_module("orjson")
+except ImportError:  # optional speedup, installed with the `fast` extra
+    _orjson = None
+
+
+def loads(content: bytes | str) -> Any:
+    if _orjson is not None:
+        return _orjson.loads(content)
+    return json.loads(content)
+
+
+def dumps_line(payload: dict[str, Any]) -> str:
+    """
+    Compact single-line JSON; the text is the same whether or not orjson is installed.
+    """
+    if _orjson is not None:
+        data: bytes = _orjson.dumps(payload)
+        return data.decode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-import json
 import logging
 import sys
 from typing import Any
 
+from money_dahong.json_utils import dumps_line
+
+# `extra=` fields copied into the JSON payload when a record carries them.
+_EXTRA_KEYS = ("symbol", "interval", "strategy_id", "order_id", "trace_id", "qty")
+
 
 class JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
@@ -14,12 +18,14 @@ class JsonFormatter(logging.Formatter):
             "logger": record.name,
             "msg": record.getMessage(),
         }
-        for key in ("symbol", "interval", "strategy_id", "order_id", "trace_id", "qty"):
-            if hasattr(record, key):
-                payload[key] = getattr(record, key)
+        record_vars = vars(record)
+        for key in _EXTRA_KEYS:
+            if key in record_vars:
+                payload[key] = record_vars[key]
         if record.exc_info:
             payload["exc"] = self.formatException(record.exc_info)
-        return json.dumps(payload, ensure_ascii=False)
+        # One record per tick and per order; orjson (when installed) keeps this off the hot path.
+        return dumps_line(payload)
 
 
 def configure_logging(level: str) -> None:
@@ -1,6 +1,14 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from decimal import Decimal
+from itertools import islice
+
+
+def _ema_factors(period: int) -> tuple[Decimal, Decimal]:
+    # (k, 1 - k): `value * k + prev * (1 - k)` with the constant factor built once.
+    k = Decimal(2) / Decimal(period + 1)
+    return k, Decimal(1) - k
 
 
 def ema_series(values: list[Decimal], period: int) -> list[Decimal]:
@@ -8,16 +16,83 @@ def ema_series(values: list[Decimal], period: int) -> list[Decimal]:
         raise ValueError("period must be > 0")
     if not values:
         return []
-    k = Decimal(2) / Decimal(period + 1)
-    ema: list[Decimal] = [values[0]]
-    for value in values[1:]:
-        ema.append((value * k) + (ema[-1] * (Decimal(1) - k)))
+    k, one_minus_k = _ema_factors(period)
+    prev = values[0]
+    ema: list[Decimal] = [prev]
+    append = ema.append
+    for value in islice(values, 1, None):
+        prev = (value * k) + (prev * one_minus_k)
+        append(prev)
     return ema
 
 
-def sma(values: list[Decimal], period: int) -> Decimal:
-    if period <= 0:
-        raise ValueError("period must be > 0")
-    if len(values) < period:
-        raise ValueError("not enough values")
-    return sum(values[-period:]) / Decimal(period)
+@dataclass(frozen=True)
+class CrossState:
+    """
+    Fast and slow moving averages at the last two bars of a window, tagged with the last bar's
+    close time and close so the next call can tell whether the window has moved on since.
+    """
+
+    close_time_ms: int
+    close: Decimal
+    fast_prev: Decimal
+    fast_now: Decimal
+    slow_prev: Decimal
+    slow_now: Decimal
+
+    def is_at(self, *, close_time_ms: int, close: Decimal) -> bool:
+        return self.close_time_ms == close_time_ms and self.close == close
+
+
+class EmaPair:
+    """
+    Fast/slow EMAs for the cross strategies: `seed` runs `ema_series` over a window, `step`
+    applies one bar of the same recurrence, so stepping matches a recompute exactly.
+    """
+
+    def __init__(self, *, fast_period: int, slow_period: int) -> None:
+        self._fast_period = fast_period
+        self._slow_period = slow_period
+        self._fast_k, self._fast_keep = _ema_factors(fast_period)
+        self._slow_k, self._slow_keep = _ema_factors(slow_period)
+
+    def seed(self, *, closes: list[Decimal], close_time_ms: int) -> CrossState:
+        fast = ema_series(closes, self._fast_period)
+        slow = ema_series(closes, self._slow_period)
+        return CrossState(
+            close_time_ms=close_time_ms,
+            close=closes[-1],
+            fast_prev=fast[-2],
+            fast_now=fast[-1],
+            slow_prev=slow[-2],
+            slow_now=slow[-1],
+        )
+
+    def step(self, state: CrossState, *, close_time_ms: int, close: Decimal) -> CrossState:
+        return CrossState(
+            close_time_ms=close_time_ms,
+            close=close,
+            fast_prev=state.fast_now,
+            fast_now=(close * self._fast_k) + (state.fast_now * self._fast_keep),
+            slow_prev=state.slow_now,
+            slow_now=(close * self._slow_k) + (state.slow_now * self._slow_keep),
+        )
+
+
+def trailing_stop_hit(
+    *,
+    arm_price: Decimal,
+    stop_price: Decimal,
+    peak_price: Decimal,
+    price: Decimal,
+) -> bool:
+    """
+    Trailing-stop exit test shared by the trader and the backtester.
+
+    arm_price = entry * (1 + start%) and stop_price = peak * (1 - drawdown%) are kept by the
+    caller as entry/peak change, so the per-bar check is two comparisons. An unknown entry
+    (arm_price == 0) never arms the stop.
+    """
+    if arm_price <= 0 or price <= 0:
+        return False
+    return peak_price >= arm_price and price <= stop_price
@@ -1,25 +1,133 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+
 import httpx
 
+from money_dahong.json_utils import dumps_line
+
+logger = logging.getLogger("money_dahong.telegram")
+
+# Telegram rejects sendMessage texts longer than this.
+_MAX_MESSAGE_CHARS = 4096
+# Batched mode: oldest messages are dropped beyond this backlog (e.g. a long 429 spell).
+_MAX_QUEUED_MESSAGES = 256
+_MAX_RATE_LIMIT_RETRIES = 3
+_DEFAULT_RETRY_AFTER_SECONDS = 1.0
+
 
 class TelegramNotifier:
-    def __init__(self, *, bot_token: str, chat_id: str, timeout_seconds: float = 10.0) -> None:
+    def __init__(
+        self,
+        *,
+        bot_token: str,
+        chat_id: str,
+        timeout_seconds: float = 10.0,
+        batch_window_seconds: float = 0.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """
+        batch_window_seconds > 0 makes `send` enqueue and return immediately; a background
+        task joins whatever arrives within the window into one sendMessage call, waits out
+        Telegram's 429 retry_after, and `aclose` drains it. Send errors are then logged
+        instead of raised.
+        """
         self._bot_token = bot_token.strip()
         self._chat_id = chat_id.strip()
-        self._client = httpx.AsyncClient(timeout=httpx.Timeout(timeout_seconds))
+        self._send_url = f"https://api.telegram.org/bot{self._bot_token}/sendMessage"
+        self._timeout_seconds = timeout_seconds
+        self._batch_window_seconds = batch_window_seconds
+        self._transport = transport
+        # Created on first send, so a disabled notifier never builds an httpx client.
+        self._client: httpx.AsyncClient | None = None
+        self._queue: asyncio.Queue[str] | None = None
+        self._flusher: asyncio.Task[None] | None = None
 
     def enabled(self) -> bool:
         return bool(self._bot_token and self._chat_id)
 
     async def aclose(self) -> None:
+        if self._flusher is not None and self._queue is not None:
+            try:
+                await asyncio.wait_for(
+                    self._queue.join(),
+                    timeout=self._batch_window_seconds + self._timeout_seconds,
+                )
+            except TimeoutError:
+                logger.warning("telegram_drain_timeout")
+            self._flusher.cancel()
+            self._flusher = None
+            self._queue = None
+        if self._client is None:
+            return
         await self._client.aclose()
+        self._client = None
 
     async def send(self, text: str) -> None:
         if not self.enabled():
             return
-        url = f"https://api.telegram.org/bot{self._bot_token}/sendMessage"
+        if self._batch_window_seconds <= 0:
+            await self._post(text)
+            return
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._flusher = asyncio.create_task(self._flush_batches(self._queue))
+        if self._queue.qsize() >= _MAX_QUEUED_MESSAGES:
+            self._queue.get_nowait()
+            self._queue.task_done()
+            logger.warning("telegram_queue_full_dropped_oldest")
+        self._queue.put_nowait(text)
+
+    async def _flush_batches(self, queue: asyncio.Queue[str]) -> None:
+        carry: str | None = None
+        while True:
+            batch = [carry if carry is not None else await queue.get()]
+            carry = None
+            await asyncio.sleep(self._batch_window_seconds)
+            size = len(batch[0])
+            while not queue.empty():
+                text = queue.get_nowait()
+                size += len(text) + 2
+                if size > _MAX_MESSAGE_CHARS:
+                    carry = text
+                    break
+                batch.append(text)
+            try:
+                await self._post_rate_limited("\n\n".join(batch))
+            except Exception:
+                logger.exception("telegram_send_failed")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _post_rate_limited(self, text: str) -> None:
+        for _ in range(_MAX_RATE_LIMIT_RETRIES):
+            try:
+                await self._post(text)
+                return
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 429:
+                    raise
+                await asyncio.sleep(_retry_after_seconds(e.response))
+        await self._post(text)
+
+    async def _post(self, text: str) -> None:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self._timeout_seconds),
+                headers={"Content-Type": "application/json"},
+                transport=self._transport,
+            )
         payload = {"chat_id": self._chat_id, "text": text, "disable_web_page_preview": True}
-        resp = await self._client.post(url, json=payload)
+        resp = await self._client.post(self._send_url, content=dumps_line(payload))
         resp.raise_for_status()
 
+
+def _retry_after_seconds(response: httpx.Response) -> float:
+    # Telegram puts the wait in the JSON body (`parameters.retry_after`), not a header.
+    try:
+        value = float(response.json()["parameters"]["retry_after"])
+    except Exception:
+        return _DEFAULT_RETRY_AFTER_SECONDS
+    return value if value > 0 else _DEFAULT_RETRY_AFTER_SECONDS
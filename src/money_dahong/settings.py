@@ -26,6 +26,9 @@ class Settings(BaseSettings):
     max_order_notional_usdt: float = Field(default=25.0, validation_alias="MAX_ORDER_NOTIONAL_USDT")
     cooldown_seconds: int = Field(default=60, validation_alias="COOLDOWN_SECONDS")
 
+    # Market data: wake on the kline WebSocket stream (needs the `stream` extra).
+    kline_stream: bool = Field(default=False, validation_alias="KLINE_STREAM")
+
     # Telegram
     telegram_bot_token: str = Field(default="", validation_alias="TELEGRAM_BOT_TOKEN")
     telegram_chat_id: str = Field(default="", validation_alias="TELEGRAM_CHAT_ID")
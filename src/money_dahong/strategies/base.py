@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Optional
@@ -14,11 +15,17 @@ class StrategyContext:
     symbol: str
     in_position: bool
     position_qty: Decimal
+    # Close prices aligned with `klines`, for callers that already keep them as a column.
+    # Strategies fall back to reading `k.close` off the klines when this is None.
+    closes: Optional[list[Decimal]] = None
 
 
 class Strategy(ABC):
     strategy_id: str
+    # Set on strategies whose signal computation is heavy enough to stall the trader's event
+    # loop; the trader then runs `generate_signal` in a worker thread.
+    cpu_bound: bool = False
 
     @abstractmethod
-    def generate_signal(self, *, klines: list[Kline], ctx: StrategyContext) -> Optional[Signal]:
+    def generate_signal(self, *, klines: Sequence[Kline], ctx: StrategyContext) -> Optional[Signal]:
         raise NotImplementedError
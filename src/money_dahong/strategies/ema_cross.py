@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
+from decimal import Decimal
 from typing import Optional
 
 from money_dahong.exchange.binance_spot import Kline
-from money_dahong.math_utils import ema_series
+from money_dahong.math_utils import CrossState, EmaPair
 from money_dahong.strategies.base import Strategy, StrategyContext
 from money_dahong.types import Signal
 
+# Signal is frozen, so every cross hands out the same instance.
+_BUY_SIGNAL = Signal(side="BUY", reason="ema_cross_up")
+_SELL_SIGNAL = Signal(side="SELL", reason="ema_cross_down")
+
 
 @dataclass(frozen=True)
 class EmaCrossParams:
@@ -22,23 +28,41 @@ class EmaCrossStrategy(Strategy):
         if params.fast_period >= params.slow_period:
             raise ValueError("fast_period must be < slow_period")
         self._params = params
+        self._emas = EmaPair(fast_period=params.fast_period, slow_period=params.slow_period)
+        self._state: CrossState | None = None
 
-    def generate_signal(self, *, klines: list[Kline], ctx: StrategyContext) -> Optional[Signal]:
+    def generate_signal(self, *, klines: Sequence[Kline], ctx: StrategyContext) -> Optional[Signal]:
         if len(klines) < self._params.slow_period + 2:
             return None
 
-        closes = [k.close for k in klines]
-        fast = ema_series(closes, self._params.fast_period)
-        slow = ema_series(closes, self._params.slow_period)
+        closes = ctx.closes if ctx.closes is not None else [k.close for k in klines]
+        state = self._advance(klines=klines, closes=closes)
+        fast_prev, fast_now = state.fast_prev, state.fast_now
+        slow_prev, slow_now = state.slow_prev, state.slow_now
 
-        fast_prev, fast_now = fast[-2], fast[-1]
-        slow_prev, slow_now = slow[-2], slow[-1]
+        # Only the cross that could produce a signal in the current position is checked.
+        if ctx.in_position:
+            if fast_prev >= slow_prev and fast_now < slow_now:
+                return _SELL_SIGNAL
+        elif fast_prev <= slow_prev and fast_now > slow_now:
+            return _BUY_SIGNAL
+        return None
 
-        crossed_up = fast_prev <= slow_prev and fast_now > slow_now
-        crossed_down = fast_prev >= slow_prev and fast_now < slow_now
+    def _advance(self, *, klines: Sequence[Kline], closes: list[Decimal]) -> CrossState:
+        """
+        Returns the EMAs at the last two bars. When the window moved on by exactly one bar
+        since the previous call, both EMAs take a single recurrence step; anything else
+        (first call, gap, replaced history) recomputes them over the whole window.
+        """
+        last, state = klines[-1], self._state
+        if state is not None and state.is_at(close_time_ms=last.close_time_ms, close=closes[-1]):
+            return state
 
-        if not ctx.in_position and crossed_up:
-            return Signal(side="BUY", reason="ema_cross_up")
-        if ctx.in_position and crossed_down:
-            return Signal(side="SELL", reason="ema_cross_down")
-        return None
+        if state is not None and state.is_at(
+            close_time_ms=klines[-2].close_time_ms, close=closes[-2]
+        ):
+            state = self._emas.step(state, close_time_ms=last.close_time_ms, close=closes[-1])
+        else:
+            state = self._emas.seed(closes=closes, close_time_ms=last.close_time_ms)
+        self._state = state
+        return state
@@ -1,35 +1,35 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Literal, Optional
+from itertools import islice
+from typing import Optional
 
 from money_dahong.exchange.binance_spot import Kline
-from money_dahong.math_utils import ema_series, sma
+from money_dahong.math_utils import CrossState, EmaPair
 from money_dahong.strategies.base import Strategy, StrategyContext
-from money_dahong.types import Signal
-
-MaType = Literal["sma", "ema"]
+from money_dahong.types import MaType, Signal
 
 
 @dataclass(frozen=True)
 class MaCrossParams:
     fast_period: int = 20
     slow_period: int = 60
-    ma_type: MaType = "sma"
-
+    ma_type: MaType = MaType.SMA
 
-def _ma_prev_now(closes: list[Decimal], *, period: int, ma_type: MaType) -> tuple[Decimal, Decimal]:
-    if len(closes) < period + 1:
-        raise ValueError("not enough closes for prev/now")
+    def __post_init__(self) -> None:
+        # Accept plain "sma"/"ema" strings so the per-bar dispatch can be an identity check.
+        object.__setattr__(self, "ma_type", MaType(self.ma_type))
 
-    if ma_type == "sma":
-        prev = sma(closes[:-1], period)
-        now = sma(closes, period)
-        return prev, now
 
-    ema = ema_series(closes, period)
-    return ema[-2], ema[-1]
+def _tail_closes(
+    klines: Sequence[Kline], closes: Optional[list[Decimal]], n: int
+) -> list[Decimal]:
+    if closes is not None:
+        return closes[-n:]
+    # `klines` may be the trader's deque, which doesn't slice.
+    return [k.close for k in islice(klines, len(klines) - n, None)]
 
 
 class MaCrossStrategy(Strategy):
@@ -41,34 +41,138 @@ class MaCrossStrategy(Strategy):
         if params.fast_period >= params.slow_period:
             raise ValueError("fast_period must be < slow_period")
         self._params = params
+        # Need two bars to detect cross, plus slow period lookback.
+        self._lookback_bars = params.slow_period + 2
+        self._fast_div = Decimal(params.fast_period)
+        self._slow_div = Decimal(params.slow_period)
+        self._emas = EmaPair(fast_period=params.fast_period, slow_period=params.slow_period)
+        # SMA: window sums (divided by the period on use). EMA: the averages themselves.
+        self._state: CrossState | None = None
+        # The MA type is fixed per instance, so pick the step once instead of branching per bar.
+        self._step = self._step_sma if params.ma_type is MaType.SMA else self._step_ema
+        # Signal is frozen, so each cross direction can hand out one shared instance.
+        self._buy_signal = Signal(side="BUY", reason=f"{params.ma_type}_cross_up")
+        self._sell_signal = Signal(side="SELL", reason=f"{params.ma_type}_cross_down")
 
     @property
     def lookback_bars(self) -> int:
-        # Need two bars to detect cross, plus slow period lookback.
-        return self._params.slow_period + 2
+        return self._lookback_bars
 
-    def generate_signal(self, *, klines: list[Kline], ctx: StrategyContext) -> Optional[Signal]:
-        if len(klines) < self.lookback_bars:
+    def generate_signal(self, *, klines: Sequence[Kline], ctx: StrategyContext) -> Optional[Signal]:
+        if len(klines) < self._lookback_bars:
             return None
 
-        closes = [k.close for k in klines]
-        fast_prev, fast_now = _ma_prev_now(
-            closes,
-            period=self._params.fast_period,
-            ma_type=self._params.ma_type,
-        )
-        slow_prev, slow_now = _ma_prev_now(
-            closes,
-            period=self._params.slow_period,
-            ma_type=self._params.ma_type,
-        )
-
-        crossed_up = fast_prev <= slow_prev and fast_now > slow_now
-        crossed_down = fast_prev >= slow_prev and fast_now < slow_now
-
-        if not ctx.in_position and crossed_up:
-            return Signal(side="BUY", reason=f"{self._params.ma_type}_cross_up")
-        if ctx.in_position and crossed_down:
-            return Signal(side="SELL", reason=f"{self._params.ma_type}_cross_down")
+        state = self._advance(klines=klines, closes=ctx.closes)
+        if self._params.ma_type is MaType.SMA:
+            fast_prev, fast_now = state.fast_prev / self._fast_div, state.fast_now / self._fast_div
+            slow_prev, slow_now = state.slow_prev / self._slow_div, state.slow_now / self._slow_div
+        else:
+            fast_prev, fast_now = state.fast_prev, state.fast_now
+            slow_prev, slow_now = state.slow_prev, state.slow_now
+
+        # Only the cross that could produce a signal in the current position is checked.
+        if ctx.in_position:
+            if fast_prev >= slow_prev and fast_now < slow_now:
+                return self._sell_signal
+        elif fast_prev <= slow_prev and fast_now > slow_now:
+            return self._buy_signal
         return None
 
+    def _advance(self, *, klines: Sequence[Kline], closes: Optional[list[Decimal]]) -> CrossState:
+        """
+        Moving-average state at the last two bars. When the state's bar is still in the window
+        a few bars back (the backtester skips the strategy on a trailing-stop exit bar), each
+        average catches up one O(1) step per bar: SMA sums add the new close and drop the one
+        leaving the window (exact in Decimal, so they match a re-sum), EMAs apply the
+        recurrence. Anything else (first call, replaced history) rebuilds from the window.
+        """
+        last, state = klines[-1], self._state
+        close = closes[-1] if closes is not None else last.close
+        if state is not None and state.is_at(close_time_ms=last.close_time_ms, close=close):
+            return state
+
+        behind = 0
+        if state is not None:
+            behind = self._bars_behind(state=state, klines=klines, closes=closes)
+            for back in range(behind, 0, -1):
+                state = self._step(state=state, klines=klines, closes=closes, back=back)
+        if state is None or not behind:
+            state = self._rebuild(klines=klines, closes=closes, close=close)
+        self._state = state
+        return state
+
+    def _bars_behind(
+        self, *, state: CrossState, klines: Sequence[Kline], closes: Optional[list[Decimal]]
+    ) -> int:
+        """Bars the window moved on since `state`, or 0 when its bar isn't in catch-up reach."""
+        slow_n = self._params.slow_period
+        # Stepping to the bar `back` from the end drops the close `slow_n` bars before it.
+        for back in range(1, min(slow_n, len(klines) - slow_n) + 1):
+            bar = klines[-back - 1]
+            if bar.close_time_ms > state.close_time_ms:
+                continue
+            bar_close = closes[-back - 1] if closes is not None else bar.close
+            if state.is_at(close_time_ms=bar.close_time_ms, close=bar_close):
+                return back
+            return 0
+        return 0
+
+    def _step_sma(
+        self,
+        *,
+        state: CrossState,
+        klines: Sequence[Kline],
+        closes: Optional[list[Decimal]],
+        back: int,
+    ) -> CrossState:
+        """Advances the SMA window sums to the bar `back` positions from the end of the window."""
+        fast_n, slow_n = self._params.fast_period, self._params.slow_period
+        bar = klines[-back]
+        if closes is not None:
+            close = closes[-back]
+            fast_out, slow_out = closes[-back - fast_n], closes[-back - slow_n]
+        else:
+            close = bar.close
+            fast_out, slow_out = klines[-back - fast_n].close, klines[-back - slow_n].close
+        return CrossState(
+            close_time_ms=bar.close_time_ms,
+            close=close,
+            fast_prev=state.fast_now,
+            fast_now=state.fast_now + close - fast_out,
+            slow_prev=state.slow_now,
+            slow_now=state.slow_now + close - slow_out,
+        )
+
+    def _step_ema(
+        self,
+        *,
+        state: CrossState,
+        klines: Sequence[Kline],
+        closes: Optional[list[Decimal]],
+        back: int,
+    ) -> CrossState:
+        """Advances the EMAs to the bar `back` positions from the end of the window."""
+        bar = klines[-back]
+        close = closes[-back] if closes is not None else bar.close
+        return self._emas.step(state, close_time_ms=bar.close_time_ms, close=close)
+
+    def _rebuild(
+        self,
+        *,
+        klines: Sequence[Kline],
+        closes: Optional[list[Decimal]],
+        close: Decimal,
+    ) -> CrossState:
+        if self._params.ma_type is not MaType.SMA:
+            values = closes if closes is not None else [k.close for k in klines]
+            return self._emas.seed(closes=values, close_time_ms=klines[-1].close_time_ms)
+        fast_n, slow_n = self._params.fast_period, self._params.slow_period
+        tail = _tail_closes(klines, closes, slow_n + 1)
+        return CrossState(
+            close_time_ms=klines[-1].close_time_ms,
+            close=close,
+            fast_prev=sum(tail[-fast_n - 1 : -1], Decimal(0)),
+            fast_now=sum(tail[-fast_n:], Decimal(0)),
+            slow_prev=sum(tail[:-1], Decimal(0)),
+            slow_now=sum(tail[1:], Decimal(0)),
+        )
@@ -2,11 +2,17 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from decimal import Decimal
+from enum import StrEnum
 from typing import Literal
 
 Side = Literal["BUY", "SELL"]
 
 
+class MaType(StrEnum):
+    SMA = "sma"
+    EMA = "ema"
+
+
 @dataclass(frozen=True)
 class Signal:
     side: Side
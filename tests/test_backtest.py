@@ -92,3 +92,42 @@ def test_backtest_slippage_reduces_pnl() -> None:
     assert bt_no_slip.trades
     assert bt_slip.trades
     assert bt_slip.trades[0].pnl_usdt < bt_no_slip.trades[0].pnl_usdt
+
+
+def test_backtest_without_trade_records_keeps_counts() -> None:
+    strategy = MaCrossStrategy(MaCrossParams(fast_period=2, slow_period=3, ma_type="sma"))
+    bt = Backtester(
+        symbol="ETHUSDT",
+        interval="1m",
+        strategy=strategy,
+        initial_cash_usdt=Decimal("1000"),
+        position_sizing="fixed_notional",
+        cash_fraction=Decimal("0.8"),
+        order_notional_usdt=Decimal("100"),
+        fee_rate=Decimal("0"),
+        slippage_bps=Decimal("0"),
+        lookback_bars=strategy.lookback_bars,
+        trailing_stop_enabled=False,
+        trailing_start_profit_pct=Decimal("30"),
+        trailing_drawdown_pct=Decimal("10"),
+    )
+    klines = [
+        _k("1", 0),
+        _k("1", 1000),
+        _k("1", 2000),
+        _k("1", 3000),
+        _k("3", 4000),  # BUY
+        _k("3", 5000),
+        _k("3", 6000),
+        _k("3", 7000),
+        _k("1", 8000),  # SELL at a loss
+        _k("1", 9000),
+    ]
+
+    recorded = bt.run(klines=klines)
+    counted = bt.run(klines=klines, record_trades=False)
+
+    assert bt.trades == []
+    assert counted == recorded
+    assert counted.trades == 1
+    assert counted.winning_trades == 0
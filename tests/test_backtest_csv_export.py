@@ -2,7 +2,7 @@ from decimal import Decimal
 from pathlib import Path
 
 from money_dahong.backtest.engine import Trade
-from money_dahong.cli import _write_trades_csv
+from money_dahong.cli import _summarize_trades, _write_trades_csv
 
 
 def test_write_trades_csv(tmp_path: Path) -> None:
@@ -27,3 +27,83 @@ def test_write_trades_csv(tmp_path: Path) -> None:
     assert lines[0].startswith("entry_time_ms,entry_time_utc,exit_time_ms,exit_time_utc")
     assert "cross_down" in lines[1]
     assert "0.5" in lines[1]
+
+
+def test_summarize_trades_single_pass_stats() -> None:
+    def _trade(*, pnl: str, reason: str, runup: str) -> Trade:
+        return Trade(
+            entry_time_ms=0,
+            exit_time_ms=60_000,
+            side="LONG",
+            exit_reason=reason,
+            entry_price=Decimal("100"),
+            exit_price=Decimal("100"),
+            quantity=Decimal("1"),
+            pnl_usdt=Decimal(pnl),
+            max_runup_pct=Decimal(runup),
+        )
+
+    stats = _summarize_trades(
+        [
+            _trade(pnl="5", reason="trailing_stop", runup="40"),
+            _trade(pnl="-1", reason="cross_down", runup="2"),
+            _trade(pnl="2", reason="cross_down", runup="6"),
+        ]
+    )
+
+    assert stats.trades == 3
+    assert stats.wins == 2
+    assert stats.trailing_exits == 1
+    assert stats.cross_exits == 2
+    assert stats.avg_runup_pct == Decimal("16")
+    assert stats.max_runup_pct == Decimal("40")
+    assert _summarize_trades([]).win_rate_pct == Decimal("0")
+
+
+def test_run_backtest_sync_without_event_loop(tmp_path: Path) -> None:
+    from money_dahong.cli import _run_backtest_sync
+    from money_dahong.config.ma_cross import (
+        apply_backtest_overrides,
+        load_ma_cross_backtest_config,
+    )
+    from money_dahong.exchange.binance_spot import Kline
+
+    config = Path(__file__).resolve().parents[1] / "configs" / "ma_cross.toml"
+    csv_path = tmp_path / "trades.csv"
+    cfg = apply_backtest_overrides(
+        load_ma_cross_backtest_config(config),
+        {
+            "strategy": {"fast_period": 2, "slow_period": 3},
+            "backtest": {"trades_csv": str(csv_path)},
+        },
+    )
+    closes = [10, 9, 8, 9, 11, 13, 12, 10, 8, 7, 9, 12, 14]
+    klines = [
+        Kline(
+            open_time_ms=i * 60_000,
+            open=Decimal(c),
+            high=Decimal(c),
+            low=Decimal(c),
+            close=Decimal(c),
+            volume=Decimal("1"),
+            close_time_ms=(i + 1) * 60_000 - 1,
+        )
+        for i, c in enumerate(closes)
+    ]
+
+    payload, telegram_text = _run_backtest_sync(
+        cfg=cfg,
+        config=config,
+        symbol="ETHUSDT",
+        interval="1m",
+        klines=klines,
+        requested_start_utc=None,
+        requested_end_utc=None,
+    )
+
+    assert payload["symbol"] == "ETHUSDT"
+    assert payload["fast"] == 2 and payload["slow"] == 3
+    assert payload["bars"] == len(klines) - 1  # last bar is treated as still forming
+    assert payload["trades_csv"] == str(csv_path)
+    assert csv_path.exists()
+    assert "ETHUSDT" in telegram_text
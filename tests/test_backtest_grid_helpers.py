@@ -1,3 +1,4 @@
+import asyncio
 from decimal import Decimal
 from pathlib import Path
 
@@ -6,10 +7,16 @@ import pytest
 from money_dahong.cli import (
     GridResultRow,
     _build_period_pairs,
+    _GridBacktestSpec,
     _parse_period_list,
+    _parse_symbol_list,
     _rank_grid_rows,
+    _run_grid_pairs,
+    _win_rate_pct,
     _write_grid_results_csv,
 )
+from money_dahong.exchange.binance_spot import Kline
+from money_dahong.types import MaType
 
 
 def test_parse_period_list_uses_fallback_when_empty() -> None:
@@ -27,6 +34,16 @@ def test_parse_period_list_rejects_invalid() -> None:
         _parse_period_list(value="10,a", option_name="--fast-values", fallback=12)
 
 
+def test_parse_symbol_list_normalizes_and_dedupes() -> None:
+    assert _parse_symbol_list(value=None, fallback="ETHUSDT") == ["ETHUSDT"]
+    assert _parse_symbol_list(value="ethusdt, BTCUSDT,ETHUSDT", fallback="X") == [
+        "ETHUSDT",
+        "BTCUSDT",
+    ]
+    with pytest.raises(ValueError):
+        _parse_symbol_list(value=" , ", fallback="ETHUSDT")
+
+
 def test_build_period_pairs_filters_fast_lt_slow() -> None:
     pairs = _build_period_pairs(fast_values=[10, 20], slow_values=[15, 20, 30])
     assert pairs == [(10, 15), (10, 20), (10, 30), (20, 30)]
@@ -83,3 +100,46 @@ def test_write_grid_results_csv(tmp_path: Path) -> None:
     text = out.read_text(encoding="utf-8")
     assert "rank,fast,slow,trades,win_rate_pct,return_pct,max_drawdown_pct,end_equity_usdt" in text
     assert "1,10,30,5,40,10,5,1100" in text
+
+
+def test_win_rate_pct_handles_zero_trades() -> None:
+    assert _win_rate_pct(wins=0, trades=0) == Decimal("0")
+    assert _win_rate_pct(wins=1, trades=4) == Decimal("25")
+
+
+def test_run_grid_pairs_matches_across_worker_processes() -> None:
+    closes = [1, 1, 1, 1, 3, 3, 3, 3, 1, 1, 2, 4, 4, 2, 1, 1, 5, 5, 5, 2, 1]
+    klines = [
+        Kline(
+            open_time_ms=i * 1000,
+            open=Decimal(c),
+            high=Decimal(c),
+            low=Decimal(c),
+            close=Decimal(c),
+            volume=Decimal("0"),
+            close_time_ms=i * 1000 + 1,
+        )
+        for i, c in enumerate(closes)
+    ]
+    spec = _GridBacktestSpec(
+        symbol="ETHUSDT",
+        interval="1m",
+        ma_type=MaType.SMA,
+        initial_cash_usdt=Decimal("1000"),
+        position_sizing="fixed_notional",
+        cash_fraction=Decimal("0.8"),
+        order_notional_usdt=Decimal("100"),
+        fee_rate=Decimal("0.001"),
+        slippage_bps=Decimal("0"),
+        trailing_stop_enabled=False,
+        trailing_start_profit_pct=Decimal("30"),
+        trailing_drawdown_pct=Decimal("10"),
+    )
+    pairs = _build_period_pairs(fast_values=[2, 3], slow_values=[3, 4, 5])
+
+    in_process = asyncio.run(_run_grid_pairs(spec=spec, klines=klines, pairs=pairs, workers=1))
+    pooled = asyncio.run(_run_grid_pairs(spec=spec, klines=klines, pairs=pairs, workers=2))
+
+    assert [(row.fast, row.slow) for row in in_process] == pairs
+    assert pooled == in_process
+    assert any(row.trades for row in in_process)
@@ -97,3 +97,79 @@ def test_load_backtest_klines_paginates_when_start_set() -> None:
     assert client.calls[0]["start_time_ms"] == 100
     assert client.calls[1]["limit"] == 2
     assert client.calls[1]["start_time_ms"] == 1100
+
+
+class _MinuteBarsClient:
+    def __init__(self, *, total_bars: int) -> None:
+        self.total_bars = total_bars
+        self.starts: list[int | None] = []
+
+    async def klines(
+        self,
+        *,
+        symbol: str,
+        interval: str,
+        limit: int = 200,
+        start_time_ms: int | None = None,
+        end_time_ms: int | None = None,
+    ) -> list[Kline]:
+        self.starts.append(start_time_ms)
+        assert start_time_ms is not None
+        first = -(-start_time_ms // 60_000)
+        last = min(first + limit, self.total_bars)
+        return [_k(i * 60_000) for i in range(first, last)]
+
+
+def test_load_backtest_klines_fetches_later_pages_by_derived_start() -> None:
+    client = _MinuteBarsClient(total_bars=10_000)
+    klines = asyncio.run(
+        _load_backtest_klines(
+            client=client,  # type: ignore[arg-type]
+            symbol="ETHUSDT",
+            interval="1m",
+            limit=2500,
+            start_time_ms=0,
+            end_time_ms=None,
+        )
+    )
+    opens = [k.open_time_ms for k in klines]
+    assert opens == [i * 60_000 for i in range(2500)]
+    assert client.starts == [0, 999 * 60_000 + 1, 1999 * 60_000 + 1]
+
+
+class _GappedMinuteBarsClient(_MinuteBarsClient):
+    def __init__(self, *, total_bars: int, gap: range) -> None:
+        super().__init__(total_bars=total_bars)
+        self.gap = gap
+
+    async def klines(
+        self,
+        *,
+        symbol: str,
+        interval: str,
+        limit: int = 200,
+        start_time_ms: int | None = None,
+        end_time_ms: int | None = None,
+    ) -> list[Kline]:
+        self.starts.append(start_time_ms)
+        assert start_time_ms is not None
+        first = -(-start_time_ms // 60_000)
+        bars = [i for i in range(first, self.total_bars) if i not in self.gap]
+        return [_k(i * 60_000) for i in bars[:limit]]
+
+
+def test_load_backtest_klines_fills_shortfall_after_history_gap() -> None:
+    gap = range(1500, 1520)
+    client = _GappedMinuteBarsClient(total_bars=5000, gap=gap)
+    klines = asyncio.run(
+        _load_backtest_klines(
+            client=client,  # type: ignore[arg-type]
+            symbol="ETHUSDT",
+            interval="1m",
+            limit=3500,
+            start_time_ms=0,
+            end_time_ms=None,
+        )
+    )
+    expected = [i * 60_000 for i in range(5000) if i not in gap][:3500]
+    assert [k.open_time_ms for k in klines] == expected
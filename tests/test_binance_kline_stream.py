@@ -0,0 +1,92 @@
+import asyncio
+import json
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+import money_dahong.exchange.binance_spot as binance_spot
+from money_dahong.exchange.binance_spot import BinanceSpotClient
+
+
+def _message(*, open_time_ms: int, closed: bool) -> str:
+    return json.dumps(
+        {
+            "e": "kline",
+            "k": {
+                "t": open_time_ms,
+                "T": open_time_ms + 59_999,
+                "o": "100.0",
+                "h": "101.5",
+                "l": "99.5",
+                "c": "101.0",
+                "v": "12.5",
+                "x": closed,
+            },
+        }
+    )
+
+
+class _FakeConnection:
+    def __init__(self, messages: list[str]) -> None:
+        self._messages = messages
+
+    async def __aenter__(self) -> "_FakeConnection":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    def __aiter__(self) -> Any:
+        return self._iter()
+
+    async def _iter(self) -> Any:
+        for message in self._messages:
+            yield message
+
+
+def test_closed_klines_yields_only_closed_candles(monkeypatch: pytest.MonkeyPatch) -> None:
+    urls: list[str] = []
+    messages = [
+        _message(open_time_ms=0, closed=False),
+        _message(open_time_ms=0, closed=True),
+        json.dumps({"result": None, "id": 1}),
+        _message(open_time_ms=60_000, closed=False),
+    ]
+
+    def connect(url: str) -> _FakeConnection:
+        urls.append(url)
+        return _FakeConnection(messages)
+
+    monkeypatch.setattr(binance_spot, "_websockets", SimpleNamespace(connect=connect))
+    client = BinanceSpotClient(api_key="", api_secret="")
+
+    async def _collect() -> list[binance_spot.Kline]:
+        try:
+            return [k async for k in client.closed_klines(symbol="ETHUSDT", interval="1m")]
+        finally:
+            await client.aclose()
+
+    klines = asyncio.run(_collect())
+
+    assert urls == ["wss://stream.binance.com:9443/ws/ethusdt@kline_1m"]
+    assert len(klines) == 1
+    assert klines[0].open_time_ms == 0
+    assert klines[0].close_time_ms == 59_999
+    assert klines[0].close == Decimal("101.0")
+
+
+def test_closed_klines_requires_stream_extra(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(binance_spot, "_websockets", None)
+    client = BinanceSpotClient(api_key="", api_secret="")
+
+    async def _first() -> None:
+        try:
+            await anext(client.closed_klines(symbol="ETHUSDT", interval="1m"))
+        finally:
+            await client.aclose()
+
+    assert not binance_spot.kline_stream_available()
+    with pytest.raises(RuntimeError):
+        asyncio.run(_first())
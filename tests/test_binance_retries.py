@@ -1,9 +1,10 @@
 import asyncio
 import time
+from decimal import Decimal
 
 import httpx
 
-from money_dahong.exchange.binance_spot import BinanceSpotClient
+from money_dahong.exchange.binance_spot import BinanceSpotClient, sign_query_string
 
 
 def test_request_retries_on_timeout_then_succeeds() -> None:
@@ -151,3 +152,69 @@ def test_klines_omits_empty_time_window_params() -> None:
 
     assert captured["has_start_time"] is False
     assert captured["has_end_time"] is False
+
+
+def test_signed_order_sends_the_exact_signed_query_string() -> None:
+    captured: dict[str, str] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured["query"] = request.url.query.decode("ascii")
+        return httpx.Response(200, json={"orderId": 1})
+
+    client = BinanceSpotClient(
+        api_key="k",
+        api_secret="s",
+        transport=httpx.MockTransport(handler),
+    )
+    try:
+        asyncio.run(
+            client.new_order_market(symbol="ETHUSDT", side="BUY", quote_order_qty=Decimal("1E+1"))
+        )
+    finally:
+        asyncio.run(client.aclose())
+
+    signed, _, signature = captured["query"].rpartition("&signature=")
+    assert signed.startswith(
+        "symbol=ETHUSDT&side=BUY&type=MARKET&quoteOrderQty=10&recvWindow=5000&"
+    )
+    assert signature == sign_query_string(signed, "s")
+
+
+def test_ticker_price_reads_price_endpoint() -> None:
+    captured: dict[str, str] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured["path"] = request.url.path
+        captured["symbol"] = request.url.params.get("symbol", "")
+        return httpx.Response(200, json={"symbol": "ETHUSDT", "price": "2012.34000000"})
+
+    client = BinanceSpotClient(
+        api_key="",
+        api_secret="",
+        transport=httpx.MockTransport(handler),
+    )
+    try:
+        price = asyncio.run(client.ticker_price(symbol="ETHUSDT"))
+    finally:
+        asyncio.run(client.aclose())
+
+    assert price == Decimal("2012.34")
+    assert captured == {"path": "/api/v3/ticker/price", "symbol": "ETHUSDT"}
+
+
+def test_client_context_manager_closes_pool() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={})
+
+    async def _run() -> BinanceSpotClient:
+        async with BinanceSpotClient(
+            api_key="",
+            api_secret="",
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            await client.ping()
+        return client
+
+    client = asyncio.run(_run())
+
+    assert client._client.is_closed
@@ -1,11 +1,37 @@
 import hmac
+from decimal import Decimal
 from hashlib import sha256
 
 from money_dahong.exchange.binance_spot import build_query_string, sign_query_string
 
 
-def test_build_query_string_sorts_keys() -> None:
-    assert build_query_string({"b": 2, "a": 1}) == "a=1&b=2"
+def test_build_query_string_keeps_insertion_order() -> None:
+    assert build_query_string({"b": 2, "a": 1, "c": None}) == "b=2&a=1"
+
+
+def test_signature_of_built_order_query_matches_fixture() -> None:
+    # Binance's documented HMAC example, rebuilt from params in the order they are sent.
+    params = {
+        "symbol": "LTCBTC",
+        "side": "BUY",
+        "type": "LIMIT",
+        "timeInForce": "GTC",
+        "quantity": 1,
+        "price": Decimal("0.1"),
+        "recvWindow": 5000,
+        "timestamp": 1499827319559,
+    }
+    secret = "NhqPtmdSJYdKjVHjA7PZj4Mge3R5YNiP1e3UZjInClVN65XAbvqqM6A7H5fATj0j"
+
+    qs = build_query_string(params)
+
+    assert qs == (
+        "symbol=LTCBTC&side=BUY&type=LIMIT&timeInForce=GTC&quantity=1&price=0.1&"
+        "recvWindow=5000&timestamp=1499827319559"
+    )
+    assert sign_query_string(qs, secret) == (
+        "c8db56825ae71d6d79447849e617115f4a920fa2acdcab2b053c4b2838bd6b71"
+    )
 
 
 def test_sign_query_string_matches_known_example() -> None:
@@ -0,0 +1,29 @@
+import pytest
+
+import money_dahong.cli as cli
+import money_dahong.json_utils as json_utils
+
+
+def test_emit_matches_between_orjson_and_stdlib_json(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    orjson = pytest.importorskip("orjson")
+    payload = {
+        "ok": True,
+        "symbol": "ETHUSDT",
+        "n": 3,
+        "x": None,
+        "note": "多头",
+        "nested": [1, "a"],
+    }
+
+    monkeypatch.setattr(json_utils, "_orjson", orjson)
+    cli._emit(payload)
+    fast = capsys.readouterr().out
+
+    monkeypatch.setattr(json_utils, "_orjson", None)
+    cli._emit(payload)
+    stdlib = capsys.readouterr().out
+
+    assert fast == stdlib
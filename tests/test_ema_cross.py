@@ -1,6 +1,7 @@
 from decimal import Decimal
 
 from money_dahong.exchange.binance_spot import Kline
+from money_dahong.math_utils import ema_series
 from money_dahong.strategies.base import StrategyContext
 from money_dahong.strategies.ema_cross import EmaCrossParams, EmaCrossStrategy
 
@@ -39,3 +40,34 @@ def test_ema_cross_buy_then_sell() -> None:
         if sell and sell.side == "SELL":
             break
     assert sell is not None and sell.side == "SELL"
+
+
+def test_ema_cross_steps_incrementally_on_a_growing_history() -> None:
+    s = EmaCrossStrategy(EmaCrossParams(fast_period=2, slow_period=3))
+    ctx = StrategyContext(symbol="ETHUSDT", in_position=False, position_qty=Decimal("0"))
+    values = [10, 11, 9, 12, 13, 12, 15, 14, 16, 11]
+    history = [_k(str(v), i * 1000) for i, v in enumerate(values)]
+
+    for i in range(5, len(history) + 1):
+        s.generate_signal(klines=history[:i], ctx=ctx)
+        closes = [k.close for k in history[:i]]
+        state = s._state
+        assert state is not None
+        # Stepping one bar at a time matches a full recompute over the same history.
+        assert (state.fast_prev, state.fast_now) == tuple(ema_series(closes, 2)[-2:])
+        assert (state.slow_prev, state.slow_now) == tuple(ema_series(closes, 3)[-2:])
+
+
+def test_ema_cross_recomputes_when_history_is_replaced() -> None:
+    s = EmaCrossStrategy(EmaCrossParams(fast_period=2, slow_period=3))
+    ctx = StrategyContext(symbol="ETHUSDT", in_position=False, position_qty=Decimal("0"))
+    first = [_k(str(v), i * 1000) for i, v in enumerate([10, 11, 9, 12, 13])]
+    s.generate_signal(klines=first, ctx=ctx)
+
+    # Same timestamps, different prices: the cached EMAs must not be reused.
+    second = [_k(str(v), i * 1000) for i, v in enumerate([20, 21, 19, 22, 23, 30])]
+    s.generate_signal(klines=second, ctx=ctx)
+
+    closes = [k.close for k in second]
+    assert s._state is not None
+    assert s._state.fast_now == ema_series(closes, 2)[-1]
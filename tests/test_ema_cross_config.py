@@ -1,6 +1,7 @@
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from money_dahong.config.ema_cross import load_ema_cross_run_config
 
@@ -38,3 +39,14 @@ slow_period = 20
     )
     with pytest.raises(ValueError):
         load_ema_cross_run_config(p)
+
+
+def test_cached_ema_cross_config_cannot_be_mutated(tmp_path: Path) -> None:
+    p = tmp_path / "ema_cross.toml"
+    p.write_text("[strategy]\nfast_period = 9\nslow_period = 21\n", encoding="utf-8")
+
+    cfg = load_ema_cross_run_config(p)
+    with pytest.raises(ValidationError):
+        cfg.strategy.fast_period = 50
+
+    assert load_ema_cross_run_config(p).strategy.fast_period == 9
@@ -0,0 +1,24 @@
+import pytest
+
+import money_dahong.json_utils as json_utils
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_loads_decodes_response_bytes(monkeypatch: pytest.MonkeyPatch, fast: bool) -> None:
+    if fast:
+        monkeypatch.setattr(json_utils, "_orjson", pytest.importorskip("orjson"))
+    else:
+        monkeypatch.setattr(json_utils, "_orjson", None)
+
+    raw = b'{"balances":[{"asset":"ETH","free":"1.50000000"}],"serverTime":1700000000000}'
+
+    assert json_utils.loads(raw) == {
+        "balances": [{"asset": "ETH", "free": "1.50000000"}],
+        "serverTime": 1700000000000,
+    }
+
+
+def test_loads_rejects_invalid_json_without_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(json_utils, "_orjson", None)
+    with pytest.raises(ValueError):
+        json_utils.loads(b"<html>")
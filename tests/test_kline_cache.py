@@ -0,0 +1,51 @@
+import os
+from decimal import Decimal
+from pathlib import Path
+
+from money_dahong.backtest.kline_cache import (
+    kline_cache_path,
+    read_kline_cache,
+    write_kline_cache,
+)
+from money_dahong.exchange.binance_spot import Kline
+
+
+def _k(open_time_ms: int, close: str) -> Kline:
+    return Kline(
+        open_time_ms=open_time_ms,
+        open=Decimal("1.5"),
+        high=Decimal("2.25"),
+        low=Decimal("1"),
+        close=Decimal(close),
+        volume=Decimal("10.125"),
+        close_time_ms=open_time_ms + 59_999,
+    )
+
+
+def test_kline_cache_round_trip(tmp_path: Path) -> None:
+    path = kline_cache_path(
+        cache_dir=tmp_path,
+        symbol="ethusdt",
+        interval="1h",
+        limit=2,
+        start_time_ms=None,
+        end_time_ms=1_700_000_000_000,
+    )
+    klines = [_k(0, "1.75"), _k(60_000, "1.80")]
+
+    write_kline_cache(path, klines)
+
+    assert path.name == "ETHUSDT_1h_2_-_1700000000000.json"
+    assert read_kline_cache(path, max_age_seconds=None) == klines
+
+
+def test_kline_cache_expires_and_tolerates_missing(tmp_path: Path) -> None:
+    path = tmp_path / "klines.json"
+    assert read_kline_cache(path, max_age_seconds=60) is None
+
+    write_kline_cache(path, [_k(0, "1")])
+    old = path.stat().st_mtime - 120
+    os.utime(path, (old, old))
+
+    assert read_kline_cache(path, max_age_seconds=60) is None
+    assert read_kline_cache(path, max_age_seconds=None) is not None
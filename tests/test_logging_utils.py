@@ -0,0 +1,35 @@
+import json
+import logging
+
+import pytest
+
+import money_dahong.json_utils as json_utils
+from money_dahong.logging_utils import JsonFormatter
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_json_formatter_emits_one_json_line(monkeypatch: pytest.MonkeyPatch, fast: bool) -> None:
+    if fast:
+        monkeypatch.setattr(json_utils, "_orjson", pytest.importorskip("orjson"))
+    else:
+        monkeypatch.setattr(json_utils, "_orjson", None)
+
+    record = logging.LogRecord(
+        name="money_dahong.trader",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=1,
+        msg="position_synced",
+        args=(),
+        exc_info=None,
+    )
+    record.symbol = "ETHUSDT"
+    record.qty = "0.5"
+
+    line = JsonFormatter().format(record)
+
+    assert "\n" not in line
+    payload = json.loads(line)
+    assert payload["msg"] == "position_synced"
+    assert payload["level"] == "INFO"
+    assert (payload["symbol"], payload["qty"]) == ("ETHUSDT", "0.5")
@@ -1,6 +1,7 @@
 from decimal import Decimal
 
 from money_dahong.exchange.binance_spot import Kline
+from money_dahong.math_utils import ema_series
 from money_dahong.strategies.base import StrategyContext
 from money_dahong.strategies.ma_cross import MaCrossParams, MaCrossStrategy
 
@@ -30,3 +31,67 @@ def test_ma_cross_sma_buy_then_sell() -> None:
     sig_sell = s.generate_signal(klines=down, ctx=ctx_in)
     assert sig_sell is not None and sig_sell.side == "SELL"
 
+
+
+def test_ma_cross_sma_sums_roll_with_the_window() -> None:
+    s = MaCrossStrategy(MaCrossParams(fast_period=2, slow_period=3, ma_type="sma"))
+    ctx = StrategyContext(symbol="ETHUSDT", in_position=False, position_qty=Decimal("0"))
+    values = ["10", "11.5", "9.25", "12", "13", "12.75", "15", "14", "16.5", "11"]
+    history = [_k(v, i * 1000) for i, v in enumerate(values)]
+
+    for end in range(s.lookback_bars, len(history) + 1):
+        # Fixed-length sliding window, as the backtester hands it over.
+        window = history[max(0, end - s.lookback_bars) : end]
+        s.generate_signal(klines=window, ctx=ctx)
+        closes = [k.close for k in window]
+        state = s._state
+        assert state is not None
+        # Carried sums equal a fresh re-sum of each window.
+        assert [state.fast_prev, state.fast_now] == [sum(closes[-3:-1]), sum(closes[-2:])]
+        assert [state.slow_prev, state.slow_now] == [sum(closes[-4:-1]), sum(closes[-3:])]
+
+
+def test_ma_cross_sma_resums_when_history_is_replaced() -> None:
+    s = MaCrossStrategy(MaCrossParams(fast_period=2, slow_period=3, ma_type="sma"))
+    ctx = StrategyContext(symbol="ETHUSDT", in_position=False, position_qty=Decimal("0"))
+    s.generate_signal(klines=[_k(v, i * 1000) for i, v in enumerate("12345")], ctx=ctx)
+
+    # Same timestamps, different prices: the carried sums must not be reused.
+    replaced = [_k(v, i * 1000) for i, v in enumerate("876543")]
+    s.generate_signal(klines=replaced, ctx=ctx)
+
+    assert s._state is not None
+    assert s._state.slow_now == Decimal("12")
+
+
+def test_ma_cross_ema_steps_match_a_full_history_recompute() -> None:
+    s = MaCrossStrategy(MaCrossParams(fast_period=2, slow_period=3, ma_type="ema"))
+    ctx = StrategyContext(symbol="ETHUSDT", in_position=False, position_qty=Decimal("0"))
+    values = ["10", "11.5", "9.25", "12", "13", "12.75", "15", "14", "16.5", "11"]
+    history = [_k(v, i * 1000) for i, v in enumerate(values)]
+
+    for end in range(s.lookback_bars, len(history) + 1):
+        s.generate_signal(klines=history[:end], ctx=ctx)
+        closes = [k.close for k in history[:end]]
+        state = s._state
+        assert state is not None
+        assert [state.fast_prev, state.fast_now] == ema_series(closes, 2)[-2:]
+        assert [state.slow_prev, state.slow_now] == ema_series(closes, 3)[-2:]
+
+
+def test_ma_cross_catches_up_over_a_skipped_bar() -> None:
+    values = ["10", "11.5", "9.25", "12", "13", "12.75", "15", "14", "16.5", "11"]
+    history = [_k(v, i * 1000) for i, v in enumerate(values)]
+    ctx = StrategyContext(symbol="ETHUSDT", in_position=False, position_qty=Decimal("0"))
+
+    for ma_type in ("sma", "ema"):
+        stepped = MaCrossStrategy(MaCrossParams(fast_period=2, slow_period=3, ma_type=ma_type))
+        skipped = MaCrossStrategy(MaCrossParams(fast_period=2, slow_period=3, ma_type=ma_type))
+        for end in range(5, len(history) + 1):
+            window = history[end - 5 : end]
+            stepped.generate_signal(klines=window, ctx=ctx)
+            # Like the backtester on a trailing-stop exit bar: the strategy isn't asked.
+            if end != 7:
+                skipped.generate_signal(klines=window, ctx=ctx)
+            if end > 7:
+                assert skipped._state == stepped._state
@@ -1,8 +1,14 @@
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
-from money_dahong.config.ma_cross import load_ma_cross_backtest_config
+from money_dahong.config.ma_cross import (
+    apply_backtest_overrides,
+    load_ma_cross_backtest_config,
+    load_ma_cross_backtest_config_fast,
+)
+from money_dahong.types import MaType
 
 
 def test_load_ma_cross_config(tmp_path: Path) -> None:
@@ -65,3 +71,67 @@ slow_period = 20
     )
     with pytest.raises(ValueError):
         load_ma_cross_backtest_config(p)
+
+
+def test_load_ma_cross_config_reuses_unchanged_file(tmp_path: Path) -> None:
+    p = tmp_path / "ma_cross.toml"
+    p.write_text("[strategy]\nfast_period = 5\nslow_period = 20\n", encoding="utf-8")
+
+    first = load_ma_cross_backtest_config(p)
+    assert load_ma_cross_backtest_config(p) is first
+
+    p.write_text("[strategy]\nfast_period = 7\nslow_period = 200\n", encoding="utf-8")
+    reloaded = load_ma_cross_backtest_config(p)
+    assert reloaded.strategy.fast_period == 7
+    assert reloaded.strategy.slow_period == 200
+
+
+def test_cached_ma_cross_config_cannot_be_mutated(tmp_path: Path) -> None:
+    p = tmp_path / "ma_cross.toml"
+    p.write_text("[strategy]\nfast_period = 5\nslow_period = 20\n", encoding="utf-8")
+
+    cfg = load_ma_cross_backtest_config(p)
+    with pytest.raises(ValidationError):
+        cfg.strategy.fast_period = 50
+
+    assert load_ma_cross_backtest_config(p).strategy.fast_period == 5
+
+
+def test_load_ma_cross_config_fast_matches_validated_dump(tmp_path: Path) -> None:
+    p = tmp_path / "ma_cross.toml"
+    p.write_text("[strategy]\nma_type = \"ema\"\nfast_period = 8\nslow_period = 40\n", "utf-8")
+    validated = load_ma_cross_backtest_config(p)
+
+    fast = load_ma_cross_backtest_config_fast(validated.model_dump())
+
+    assert fast == validated
+    with pytest.raises(ValueError):
+        load_ma_cross_backtest_config_fast({"strategy": {"fast_period": 50, "slow_period": 20}})
+
+
+def test_ma_type_is_normalized_to_enum(tmp_path: Path) -> None:
+    p = tmp_path / "ma_cross.toml"
+    p.write_text("[strategy]\nma_type = \" EMA \"\n", encoding="utf-8")
+
+    cfg = load_ma_cross_backtest_config(p)
+
+    assert cfg.strategy.ma_type is MaType.EMA
+
+
+def test_apply_backtest_overrides_skips_none_and_revalidates(tmp_path: Path) -> None:
+    p = tmp_path / "ma_cross.toml"
+    p.write_text("[strategy]\nfast_period = 5\nslow_period = 20\n", encoding="utf-8")
+    cfg = load_ma_cross_backtest_config(p)
+
+    merged = apply_backtest_overrides(
+        cfg, {"strategy": {"fast_period": 7, "slow_period": None}, "market": {"limit": 50}}
+    )
+    assert merged.strategy.fast_period == 7
+    assert merged.strategy.slow_period == 20
+    assert merged.market.limit == 50
+    assert cfg.strategy.fast_period == 5
+
+    with pytest.raises(ValueError):
+        apply_backtest_overrides(cfg, {"strategy": {"fast_period": 30}})
+    with pytest.raises(ValueError):
+        apply_backtest_overrides(cfg, {"market": {"limit": 0}})
@@ -0,0 +1,51 @@
+from decimal import Decimal
+
+from money_dahong.math_utils import EmaPair, ema_series, trailing_stop_hit
+
+
+def test_ema_pair_step_matches_reseeding_the_longer_window() -> None:
+    closes = [Decimal(v) for v in ("10", "11.5", "9.75", "12", "12.25", "8")]
+    emas = EmaPair(fast_period=2, slow_period=4)
+
+    seeded = emas.seed(closes=closes[:-1], close_time_ms=4)
+    stepped = emas.step(seeded, close_time_ms=5, close=closes[-1])
+
+    assert stepped == emas.seed(closes=closes, close_time_ms=5)
+    assert stepped.is_at(close_time_ms=5, close=Decimal("8"))
+
+
+def test_ema_series_matches_recurrence() -> None:
+    values = [Decimal(v) for v in ("10", "11.5", "9.75", "12", "12.25", "8")]
+    period = 3
+    k = Decimal(2) / Decimal(period + 1)
+
+    expected = [values[0]]
+    for value in values[1:]:
+        expected.append((value * k) + (expected[-1] * (Decimal(1) - k)))
+
+    assert ema_series(values, period) == expected
+    assert ema_series([], period) == []
+
+
+def test_trailing_stop_hit_matches_percentage_formula() -> None:
+    def _pct(num: Decimal, den: Decimal) -> Decimal:
+        return (num / den) * Decimal("100")
+
+    entry = Decimal("100")
+    for start_pct, dd_pct in ((Decimal("30"), Decimal("10")), (Decimal("0.5"), Decimal("0.3"))):
+        arm = entry * (1 + start_pct / Decimal("100"))
+        for peak in (Decimal("100"), arm - Decimal("0.01"), arm, Decimal("150")):
+            stop = peak * (1 - dd_pct / Decimal("100"))
+            for price in (peak, stop + Decimal("0.01"), stop, stop - Decimal("0.01")):
+                expected = (
+                    _pct(peak - entry, entry) >= start_pct
+                    and _pct(peak - price, peak) >= dd_pct
+                )
+                assert (
+                    trailing_stop_hit(arm_price=arm, stop_price=stop, peak_price=peak, price=price)
+                    is expected
+                ), (start_pct, dd_pct, peak, price)
+
+    assert not trailing_stop_hit(
+        arm_price=Decimal("0"), stop_price=Decimal("1"), peak_price=Decimal("5"), price=Decimal("1")
+    )
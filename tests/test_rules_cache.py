@@ -0,0 +1,102 @@
+import asyncio
+import os
+from decimal import Decimal
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from money_dahong.engine.rules_cache import read_rules_cache, rules_cache_path
+from money_dahong.engine.trader import Trader
+from money_dahong.exchange import BinanceApiError
+from money_dahong.exchange.binance_spot import Kline
+from money_dahong.settings import Settings
+from money_dahong.strategies.base import Strategy, StrategyContext
+from money_dahong.types import OrderRequest, Signal
+
+
+class _NoopStrategy(Strategy):
+    strategy_id = "noop"
+
+    def generate_signal(
+        self,
+        *,
+        klines: list[Kline],
+        ctx: StrategyContext,
+    ) -> Optional[Signal]:
+        return None
+
+
+class _RulesClient:
+    def __init__(self) -> None:
+        self.exchange_info_calls = 0
+        self.step_size = "0.001"
+
+    async def exchange_info(self, *, symbol: str) -> dict[str, object]:
+        self.exchange_info_calls += 1
+        return {
+            "symbols": [
+                {
+                    "baseAsset": "ETH",
+                    "quoteAsset": "USDT",
+                    "filters": [
+                        {"filterType": "LOT_SIZE", "stepSize": self.step_size},
+                        {"filterType": "NOTIONAL", "minNotional": "5"},
+                    ],
+                }
+            ]
+        }
+
+    async def new_order_market(self, **kwargs: object) -> dict[str, object]:
+        raise BinanceApiError(status_code=400, payload={"code": -1013, "msg": "Filter failure"})
+
+
+def _trader(client: _RulesClient, cache_dir: Path) -> Trader:
+    return Trader(
+        settings=Settings(TRADING_MODE="live", CONFIRM_LIVE_TRADING="YES"),
+        client=client,  # type: ignore[arg-type]
+        strategy=_NoopStrategy(),
+        notifier=None,  # type: ignore[arg-type]
+        rules_cache_dir=cache_dir,
+    )
+
+
+def test_symbol_rules_are_reused_across_restarts(tmp_path: Path) -> None:
+    client = _RulesClient()
+
+    first = asyncio.run(_trader(client, tmp_path)._load_symbol_rules(symbol="ETHUSDT"))
+    second = asyncio.run(_trader(client, tmp_path)._load_symbol_rules(symbol="ethusdt"))
+
+    assert client.exchange_info_calls == 1
+    assert second == first
+    assert second.step_size == Decimal("0.001")
+    assert second.min_notional == Decimal("5")
+
+
+def test_stale_rules_cache_is_ignored(tmp_path: Path) -> None:
+    asyncio.run(_trader(_RulesClient(), tmp_path)._load_symbol_rules(symbol="ETHUSDT"))
+    path = rules_cache_path(cache_dir=tmp_path, symbol="ETHUSDT")
+    os.utime(path, (1, 1))
+
+    assert read_rules_cache(path, max_age_seconds=60) is None
+
+
+def test_filter_failure_refreshes_cached_rules(tmp_path: Path) -> None:
+    client = _RulesClient()
+    trader = _trader(client, tmp_path)
+    trader._rules = asyncio.run(trader._load_symbol_rules(symbol="ETHUSDT"))
+    client.step_size = "0.01"
+    order = OrderRequest(symbol="ETHUSDT", side="BUY", quote_order_qty=Decimal("25"))
+
+    signal = Signal(side="BUY", reason="t")
+
+    with pytest.raises(BinanceApiError):
+        asyncio.run(trader._execute(order=order, signal=signal, last_price=Decimal(1)))
+
+    assert client.exchange_info_calls == 2
+    assert trader._rules is not None
+    assert trader._rules.step_size == Decimal("0.01")
+    cached = read_rules_cache(
+        rules_cache_path(cache_dir=tmp_path, symbol="ETHUSDT"), max_age_seconds=60
+    )
+    assert cached is not None and cached["step_size"] == "0.01"
@@ -0,0 +1,129 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+import money_dahong.notifications.telegram as telegram
+from money_dahong.notifications.telegram import TelegramNotifier
+
+
+def test_disabled_notifier_never_opens_http_client() -> None:
+    notifier = TelegramNotifier(bot_token=" ", chat_id="")
+
+    async def _run() -> None:
+        await notifier.send("hello")
+        await notifier.aclose()
+
+    asyncio.run(_run())
+
+    assert not notifier.enabled()
+    assert notifier._client is None
+
+
+def test_send_posts_json_payload_to_bot_endpoint() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    notifier = TelegramNotifier(
+        bot_token="token",
+        chat_id="chat",
+        transport=httpx.MockTransport(handler),
+    )
+
+    async def _run() -> None:
+        await notifier.send("启动 ok")
+        await notifier.aclose()
+
+    asyncio.run(_run())
+
+    (request,) = requests
+    assert str(request.url) == "https://api.telegram.org/bottoken/sendMessage"
+    assert request.headers["content-type"] == "application/json"
+    assert json.loads(request.content) == {
+        "chat_id": "chat",
+        "text": "启动 ok",
+        "disable_web_page_preview": True,
+    }
+
+
+def test_batched_notifier_coalesces_messages_into_one_post() -> None:
+    notifier = TelegramNotifier(bot_token="token", chat_id="chat", batch_window_seconds=0.01)
+    posted: list[str] = []
+
+    async def fake_post(text: str) -> None:
+        posted.append(text)
+
+    notifier._post = fake_post  # type: ignore[method-assign]
+
+    async def _run() -> None:
+        await notifier.send("fill")
+        await notifier.send("error")
+        assert posted == []
+        await notifier.aclose()
+
+    asyncio.run(_run())
+
+    assert posted == ["fill\n\nerror"]
+
+
+def test_batched_notifier_waits_out_rate_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    responses = [
+        httpx.Response(429, json={"ok": False, "parameters": {"retry_after": 7}}),
+        httpx.Response(200, json={"ok": True}),
+    ]
+    texts: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        texts.append(json.loads(request.content)["text"])
+        return responses.pop(0)
+
+    notifier = TelegramNotifier(
+        bot_token="token",
+        chat_id="chat",
+        batch_window_seconds=0.01,
+        transport=httpx.MockTransport(handler),
+    )
+    waits: list[float] = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(seconds: float) -> None:
+        if seconds == 7:
+            waits.append(seconds)
+            return
+        await real_sleep(seconds)
+
+    monkeypatch.setattr(telegram.asyncio, "sleep", fake_sleep)
+
+    async def _run() -> None:
+        await notifier.send("fill")
+        await notifier.aclose()
+
+    asyncio.run(_run())
+
+    assert waits == [7]
+    assert texts == ["fill", "fill"]
+
+
+def test_batched_notifier_drops_oldest_when_backlog_is_full() -> None:
+    notifier = TelegramNotifier(bot_token="token", chat_id="chat", batch_window_seconds=0.01)
+    posted: list[str] = []
+
+    async def fake_post(text: str) -> None:
+        posted.append(text)
+
+    notifier._post = fake_post  # type: ignore[method-assign]
+
+    async def _run() -> None:
+        for i in range(telegram._MAX_QUEUED_MESSAGES + 2):
+            await notifier.send(f"m{i}")
+        await notifier.aclose()
+
+    asyncio.run(_run())
+
+    sent = "\n\n".join(posted).split("\n\n")
+    assert sent[0] == "m2"
+    assert len(sent) == telegram._MAX_QUEUED_MESSAGES
@@ -1,23 +1,104 @@
+import asyncio
 from decimal import Decimal
 
-from money_dahong.engine.trader import _extract_balance
+import pytest
 
+from money_dahong.engine.trader import (
+    _ACCOUNT_CACHE_TTL_SECONDS,
+    AccountCache,
+    Trader,
+    _avg_fill_price,
+    _balance,
+    _balances_by_asset,
+    _free_balance,
+)
+from money_dahong.settings import Settings
 
-def test_extract_balance_returns_free_and_locked() -> None:
+
+def test_balance_returns_free_and_locked() -> None:
     account = {
         "balances": [
             {"asset": "USDT", "free": "12.34", "locked": "5"},
             {"asset": "ETH", "free": "0.5", "locked": "0.1"},
         ]
     }
-    free, locked = _extract_balance(account=account, asset="USDT")
+    free, locked = _balance(_balances_by_asset(account), "USDT")
     assert free == Decimal("12.34")
     assert locked == Decimal("5")
 
 
-def test_extract_balance_missing_asset_returns_zeroes() -> None:
+def test_balance_missing_asset_returns_zeroes() -> None:
     account = {"balances": [{"asset": "BTC", "free": "1", "locked": "0"}]}
-    free, locked = _extract_balance(account=account, asset="USDT")
+    free, locked = _balance(_balances_by_asset(account), "USDT")
     assert free == Decimal("0")
     assert locked == Decimal("0")
 
+
+
+class _AccountClient:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def account(self) -> dict[str, object]:
+        self.calls += 1
+        return {"balances": [{"asset": "ETH", "free": str(self.calls), "locked": "0"}]}
+
+
+def test_account_balances_reuses_recent_response(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _AccountClient()
+    trader = Trader(
+        settings=Settings(TRADING_MODE="dry_run", CONFIRM_LIVE_TRADING=""),
+        client=client,  # type: ignore[arg-type]
+        strategy=None,  # type: ignore[arg-type]
+        notifier=None,  # type: ignore[arg-type]
+    )
+    clock = {"now": 100.0}
+    monkeypatch.setattr("money_dahong.engine.trader.time.monotonic", lambda: clock["now"])
+
+    first = asyncio.run(trader._account_balances())
+    clock["now"] += _ACCOUNT_CACHE_TTL_SECONDS / 2
+    assert asyncio.run(trader._account_balances()) is first
+
+    clock["now"] += _ACCOUNT_CACHE_TTL_SECONDS
+    refreshed = asyncio.run(trader._account_balances())
+    assert _balance(refreshed, "eth") == (Decimal("2"), Decimal("0"))
+    assert _free_balance(refreshed, "ETH") == Decimal("2")
+    assert _free_balance(refreshed, "USDT") == Decimal("0")
+    assert client.calls == 2
+
+
+def test_avg_fill_price_prefers_cumulative_quote() -> None:
+    fills = [{"qty": "1", "price": "10"}, {"qty": "3", "price": "12"}]
+    assert _avg_fill_price(
+        resp={"cummulativeQuoteQty": "46", "fills": fills}, executed_qty=Decimal("4")
+    ) == Decimal("11.5")
+    assert _avg_fill_price(resp={"fills": fills}, executed_qty=Decimal("4")) == Decimal("11.5")
+    assert _avg_fill_price(resp={}, executed_qty=Decimal("0")) == Decimal("0")
+
+
+class _SlowAccountClient(_AccountClient):
+    async def account(self) -> dict[str, object]:
+        await asyncio.sleep(0.01)
+        return await super().account()
+
+
+def test_shared_account_cache_coalesces_concurrent_traders() -> None:
+    client = _SlowAccountClient()
+    cache = AccountCache(client)  # type: ignore[arg-type]
+    traders = [
+        Trader(
+            settings=Settings(TRADING_MODE="dry_run", CONFIRM_LIVE_TRADING=""),
+            client=client,  # type: ignore[arg-type]
+            strategy=None,  # type: ignore[arg-type]
+            notifier=None,  # type: ignore[arg-type]
+            account_cache=cache,
+        )
+        for _ in range(3)
+    ]
+
+    async def _read_all() -> list[dict[str, dict[str, object]]]:
+        return await asyncio.gather(*(t._account_balances() for t in traders))
+
+    results = asyncio.run(_read_all())
+    assert client.calls == 1
+    assert all(r is results[0] for r in results)
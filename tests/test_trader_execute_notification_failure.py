@@ -2,6 +2,8 @@ import asyncio
 from decimal import Decimal
 from typing import Optional
 
+import pytest
+
 from money_dahong.engine.trader import Trader
 from money_dahong.exchange.binance_spot import Kline
 from money_dahong.settings import Settings
@@ -92,3 +94,62 @@ def test_execute_live_keeps_state_when_notification_fails() -> None:
     assert trader._state.position_qty == Decimal("1.2")
     assert trader._state.entry_price == Decimal("11")
     assert trader._state.last_trade_time_s > 0
+
+
+def test_buy_cooldown_uses_monotonic_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    settings = Settings(TRADING_MODE="dry_run", CONFIRM_LIVE_TRADING="", COOLDOWN_SECONDS=60)
+    trader = Trader(
+        settings=settings,
+        client=_FakeClient(order_response={}),
+        strategy=_NoopStrategy(),
+        notifier=_RaisingNotifier(),
+    )
+    clock = {"mono": 5000.0}
+    monkeypatch.setattr("money_dahong.engine.trader.time.monotonic", lambda: clock["mono"])
+    assert trader._in_trade_cooldown() is False
+
+    order = OrderRequest(symbol="ETHUSDT", side="BUY", quote_order_qty=Decimal("25"))
+    asyncio.run(
+        trader._execute(order=order, signal=Signal(side="BUY", reason="t"), last_price=Decimal(10))
+    )
+    # A wall-clock jump must not matter; only monotonic time elapsed does.
+    monkeypatch.setattr("money_dahong.engine.trader.time.time", lambda: 0.0)
+    clock["mono"] += 59
+    assert trader._in_trade_cooldown() is True
+    clock["mono"] += 2
+    assert trader._in_trade_cooldown() is False
+
+
+def test_execute_returns_before_fill_notification_is_sent() -> None:
+    class _SlowNotifier:
+        def __init__(self) -> None:
+            self.messages: list[str] = []
+
+        async def send(self, text: str) -> None:
+            await asyncio.sleep(0.01)
+            self.messages.append(text)
+
+        def enabled(self) -> bool:
+            return True
+
+    notifier = _SlowNotifier()
+    trader = Trader(
+        settings=Settings(TRADING_MODE="dry_run", CONFIRM_LIVE_TRADING=""),
+        client=_FakeClient(order_response={}),
+        strategy=_NoopStrategy(),
+        notifier=notifier,  # type: ignore[arg-type]
+    )
+    order = OrderRequest(symbol="ETHUSDT", side="BUY", quote_order_qty=Decimal("25"))
+
+    async def _run() -> None:
+        signal = Signal(side="BUY", reason="t")
+        await trader._execute(order=order, signal=signal, last_price=Decimal(10))
+        assert notifier.messages == []
+        assert len(trader._notify_tasks) == 1
+        await asyncio.gather(*trader._notify_tasks)
+
+    asyncio.run(_run())
+
+    assert len(notifier.messages) == 1
+    assert notifier.messages[0].startswith("[DRY_RUN] ETHUSDT BUY")
+    assert not trader._notify_tasks
@@ -0,0 +1,254 @@
+import asyncio
+import threading
+from decimal import Decimal
+from typing import Any, Optional
+
+import pytest
+
+import money_dahong.engine.trader as trader_module
+from money_dahong.engine.trader import SymbolTradingRules, Trader
+from money_dahong.exchange.binance_spot import Kline
+from money_dahong.settings import Settings
+from money_dahong.strategies.base import Strategy, StrategyContext
+from money_dahong.types import Signal
+
+_MINUTE_MS = 60_000
+
+
+class _NoopStrategy(Strategy):
+    strategy_id = "noop"
+
+    def generate_signal(
+        self,
+        *,
+        klines: list[Kline],
+        ctx: StrategyContext,
+    ) -> Optional[Signal]:
+        return None
+
+
+def _bar(i: int) -> Kline:
+    c = Decimal(100 + i)
+    return Kline(
+        open_time_ms=i * _MINUTE_MS,
+        open=c,
+        high=c,
+        low=c,
+        close=c,
+        volume=Decimal("1"),
+        close_time_ms=(i + 1) * _MINUTE_MS - 1,
+    )
+
+
+class _MinuteClient:
+    def __init__(self) -> None:
+        self.forming = 10
+        self.limits: list[int] = []
+
+    async def klines(
+        self,
+        *,
+        symbol: str,
+        interval: str,
+        limit: int = 200,
+        start_time_ms: int | None = None,
+        end_time_ms: int | None = None,
+    ) -> list[Kline]:
+        self.limits.append(limit)
+        first = max(0, self.forming - limit + 1)
+        return [_bar(i) for i in range(first, self.forming + 1)]
+
+
+def test_fetch_closed_klines_extends_window_incrementally() -> None:
+    client = _MinuteClient()
+    trader = Trader(
+        settings=Settings(TRADING_MODE="dry_run", CONFIRM_LIVE_TRADING=""),
+        client=client,  # type: ignore[arg-type]
+        strategy=_NoopStrategy(),
+        notifier=None,  # type: ignore[arg-type]
+    )
+
+    async def _fetch() -> list[int]:
+        klines, closes = await trader._fetch_closed_klines(
+            symbol="ETHUSDT", interval="1m", lookback_bars=6
+        )
+        assert closes == [k.close for k in klines]
+        return [k.open_time_ms // _MINUTE_MS for k in klines]
+
+    assert asyncio.run(_fetch()) == [5, 6, 7, 8, 9]
+    window = trader._closed_klines
+
+    client.forming = 12
+    assert asyncio.run(_fetch()) == [7, 8, 9, 10, 11]
+    # Incremental ticks update the window in place rather than copying it.
+    assert trader._closed_klines is window
+
+    # A gap larger than the incremental page forces a full reseed.
+    client.forming = 20
+    assert asyncio.run(_fetch()) == [15, 16, 17, 18, 19]
+    assert client.limits == [6, 3, 3, 6]
+
+
+def test_tick_skips_rest_until_next_candle_can_close(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _MinuteClient()
+    trader = Trader(
+        settings=Settings(TRADING_MODE="dry_run", CONFIRM_LIVE_TRADING=""),
+        client=client,  # type: ignore[arg-type]
+        strategy=_NoopStrategy(),
+        notifier=None,  # type: ignore[arg-type]
+    )
+    trader._rules = SymbolTradingRules(
+        base_asset="ETH", quote_asset="USDT", step_size=Decimal("0.001"), min_notional=Decimal(0)
+    )
+    trader._interval = "1m"
+    trader._bar_ms = _MINUTE_MS
+    trader._state.last_processed_close_time_ms = 10 * _MINUTE_MS - 1
+    monkeypatch.setattr("money_dahong.engine.trader.time.time", lambda: 10 * 60 + 20.0)
+
+    sleep_s = asyncio.run(trader._tick(symbol="ETHUSDT", interval="1m"))
+
+    assert client.limits == []
+    # 40s to the close: sleep until 5s before it.
+    assert sleep_s == pytest.approx(34.999)
+
+
+@pytest.mark.parametrize(
+    ("now_s", "expected"),
+    [(660.0, 54.999), (712.0, 2.0), (718.0, 0.5), (721.0, 0.5)],
+)
+def test_poll_delay_tightens_near_the_close(
+    now_s: float, expected: float, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    trader = Trader(
+        settings=Settings(TRADING_MODE="dry_run", CONFIRM_LIVE_TRADING=""),
+        client=_MinuteClient(),  # type: ignore[arg-type]
+        strategy=_NoopStrategy(),
+        notifier=None,  # type: ignore[arg-type]
+    )
+    trader._interval = "1m"
+    trader._bar_ms = _MINUTE_MS
+    # Candle 10 closed at 659.999s, so candle 11 closes at 719.999s.
+    monkeypatch.setattr(trader_module.time, "time", lambda: now_s)
+
+    assert trader._sleep_until_next_close_s(
+        last_closed_close_ms=_bar(10).close_time_ms
+    ) == pytest.approx(expected)
+
+
+def test_cpu_bound_strategy_runs_off_the_event_loop_thread() -> None:
+    threads: list[int] = []
+
+    class _HeavyStrategy(_NoopStrategy):
+        cpu_bound = True
+
+        def generate_signal(
+            self,
+            *,
+            klines: list[Kline],
+            ctx: StrategyContext,
+        ) -> Optional[Signal]:
+            threads.append(threading.get_ident())
+            return None
+
+    trader = Trader(
+        settings=Settings(TRADING_MODE="dry_run", CONFIRM_LIVE_TRADING=""),
+        client=_MinuteClient(),  # type: ignore[arg-type]
+        strategy=_HeavyStrategy(),
+        notifier=None,  # type: ignore[arg-type]
+    )
+    trader._rules = SymbolTradingRules(
+        base_asset="ETH", quote_asset="USDT", step_size=Decimal("0.001"), min_notional=Decimal(0)
+    )
+    trader._interval = "1m"
+
+    asyncio.run(trader._tick(symbol="ETHUSDT", interval="1m"))
+
+    assert len(threads) == 1
+    assert threads[0] != threading.get_ident()
+
+
+def test_wake_cuts_the_wait_short() -> None:
+    trader = Trader(
+        settings=Settings(TRADING_MODE="dry_run", CONFIRM_LIVE_TRADING=""),
+        client=_MinuteClient(),  # type: ignore[arg-type]
+        strategy=_NoopStrategy(),
+        notifier=None,  # type: ignore[arg-type]
+    )
+
+    async def _run() -> None:
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.01, trader.wake)
+        started = loop.time()
+        await trader._wait_for_wake(timeout_s=30.0)
+        assert loop.time() - started < 5.0
+        assert not trader._wake.is_set()
+
+    asyncio.run(_run())
+
+
+def test_candle_close_timer_wakes_after_the_boundary(monkeypatch: pytest.MonkeyPatch) -> None:
+    trader = Trader(
+        settings=Settings(TRADING_MODE="dry_run", CONFIRM_LIVE_TRADING=""),
+        client=_MinuteClient(),  # type: ignore[arg-type]
+        strategy=_NoopStrategy(),
+        notifier=None,  # type: ignore[arg-type]
+    )
+    monkeypatch.setattr(trader_module.time, "time", lambda: 125.0)
+    sleeps: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        if len(sleeps) >= 2:
+            raise asyncio.CancelledError()
+
+    monkeypatch.setattr(trader_module.asyncio, "sleep", fake_sleep)
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(trader._candle_close_timer(interval="1m", bar_ms=_MINUTE_MS))
+
+    assert sleeps[0] == pytest.approx(55.0 + trader_module._CLOSE_GRACE_MS / 1000)
+    assert trader._wake.is_set()
+
+
+def test_stream_close_event_wakes_and_skips_the_grace(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _MinuteClient()
+    retries: list[float] = []
+
+    async def closed_klines(*, symbol: str, interval: str) -> Any:
+        yield _bar(10)
+
+    async def fake_sleep(seconds: float) -> None:
+        retries.append(seconds)
+        raise asyncio.CancelledError()
+
+    client.closed_klines = closed_klines  # type: ignore[attr-defined]
+    trader = Trader(
+        settings=Settings(TRADING_MODE="dry_run", CONFIRM_LIVE_TRADING=""),
+        client=client,  # type: ignore[arg-type]
+        strategy=_NoopStrategy(),
+        notifier=None,  # type: ignore[arg-type]
+    )
+    monkeypatch.setattr(trader_module.asyncio, "sleep", fake_sleep)
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(trader._wake_on_stream(symbol="ETHUSDT", interval="1m"))
+    monkeypatch.undo()
+
+    assert trader._wake.is_set()
+    assert trader._streamed_close_ms == _bar(10).close_time_ms
+    assert retries == [trader_module._STREAM_RETRY_BASE_SECONDS]
+
+    # Candle 10 closed per the stream: tick now even though the close grace hasn't passed.
+    trader._rules = SymbolTradingRules(
+        base_asset="ETH", quote_asset="USDT", step_size=Decimal("0.001"), min_notional=Decimal(0)
+    )
+    trader._interval = "1m"
+    trader._bar_ms = _MINUTE_MS
+    trader._state.last_processed_close_time_ms = _bar(9).close_time_ms
+    monkeypatch.setattr(trader_module.time, "time", lambda: 11 * 60 + 0.05)
+    client.forming = 11
+
+    asyncio.run(trader._tick(symbol="ETHUSDT", interval="1m"))
+
+    assert client.limits
+    assert trader._state.last_processed_close_time_ms == _bar(10).close_time_ms
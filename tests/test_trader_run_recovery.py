@@ -1,4 +1,5 @@
 import asyncio
+from decimal import Decimal
 from typing import Optional
 
 import pytest
@@ -53,9 +54,14 @@ class _Notifier:
         return
 
 
+class _EnabledNotifier(_Notifier):
+    def enabled(self) -> bool:
+        return True
+
+
 def test_run_recovers_from_tick_exception(monkeypatch: pytest.MonkeyPatch) -> None:
     settings = Settings(TRADING_MODE="dry_run", CONFIRM_LIVE_TRADING="")
-    notifier = _Notifier()
+    notifier = _EnabledNotifier()
     trader = Trader(
         settings=settings,
         client=_RunClient(),
@@ -74,13 +80,14 @@ def test_run_recovers_from_tick_exception(monkeypatch: pytest.MonkeyPatch) -> No
 
     sleep_calls: list[float] = []
 
-    async def fake_sleep(seconds: float) -> None:
-        sleep_calls.append(seconds)
+    async def fake_wait(*, timeout_s: float) -> None:
+        sleep_calls.append(timeout_s)
         if len(sleep_calls) >= 2:
             raise asyncio.CancelledError()
 
     monkeypatch.setattr(trader, "_tick", fake_tick)
-    monkeypatch.setattr(trader_module.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(trader, "_wait_for_wake", fake_wait)
+    monkeypatch.setattr("money_dahong.engine.trader.random.uniform", lambda a, b: 0.0)
 
     with pytest.raises(asyncio.CancelledError):
         asyncio.run(trader.run(symbol="ETHUSDT", interval="1m"))
@@ -92,7 +99,7 @@ def test_run_recovers_from_tick_exception(monkeypatch: pytest.MonkeyPatch) -> No
 
 def test_run_recovers_even_when_error_notification_fails(monkeypatch: pytest.MonkeyPatch) -> None:
     settings = Settings(TRADING_MODE="dry_run", CONFIRM_LIVE_TRADING="")
-    notifier = _Notifier(fail_error_message=True)
+    notifier = _EnabledNotifier(fail_error_message=True)
     trader = Trader(
         settings=settings,
         client=_RunClient(),
@@ -111,13 +118,14 @@ def test_run_recovers_even_when_error_notification_fails(monkeypatch: pytest.Mon
 
     sleep_calls: list[float] = []
 
-    async def fake_sleep(seconds: float) -> None:
-        sleep_calls.append(seconds)
+    async def fake_wait(*, timeout_s: float) -> None:
+        sleep_calls.append(timeout_s)
         if len(sleep_calls) >= 2:
             raise asyncio.CancelledError()
 
     monkeypatch.setattr(trader, "_tick", fake_tick)
-    monkeypatch.setattr(trader_module.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(trader, "_wait_for_wake", fake_wait)
+    monkeypatch.setattr("money_dahong.engine.trader.random.uniform", lambda a, b: 0.0)
 
     with pytest.raises(asyncio.CancelledError):
         asyncio.run(trader.run(symbol="ETHUSDT", interval="1m"))
@@ -125,3 +133,92 @@ def test_run_recovers_even_when_error_notification_fails(monkeypatch: pytest.Mon
     assert tick_calls == 2
     assert sleep_calls[0] == trader_module._TICK_ERROR_BACKOFF_SECONDS
     assert sleep_calls[1] == 0.01
+
+
+class _StartupClient(_RunClient):
+    def __init__(self) -> None:
+        self.account_calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _round_trip(self) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+    async def account(self) -> dict[str, object]:
+        self.account_calls += 1
+        await self._round_trip()
+        return {"balances": [{"asset": "ETH", "free": "0.5", "locked": "0"}]}
+
+    async def ticker_price(self, *, symbol: str) -> Decimal:
+        await self._round_trip()
+        return Decimal("2000")
+
+
+def test_run_startup_overlaps_requests_and_reads_account_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = _StartupClient()
+    notifier = _EnabledNotifier()
+    trader = Trader(
+        settings=Settings(TRADING_MODE="live", CONFIRM_LIVE_TRADING="YES"),
+        client=client,  # type: ignore[arg-type]
+        strategy=_NoopStrategy(),
+        notifier=notifier,  # type: ignore[arg-type]
+    )
+
+    async def stop_tick(*, symbol: str, interval: str) -> float:
+        raise asyncio.CancelledError()
+
+    monkeypatch.setattr(trader, "_tick", stop_tick)
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(trader.run(symbol="ETHUSDT", interval="1m"))
+
+    assert client.account_calls == 1
+    assert client.max_in_flight == 2
+    assert trader._state.position_qty == Decimal("0.5")
+    snapshot = next(msg for msg in notifier.messages if msg.startswith("启动快照"))
+    assert "ETHUSDT ≈ 2000.00" in snapshot
+
+
+class _SlowRulesClient(_RunClient):
+    def __init__(self) -> None:
+        self.loading_rules = False
+
+    async def exchange_info(self, *, symbol: str) -> dict[str, object]:
+        self.loading_rules = True
+        await asyncio.sleep(0.01)
+        self.loading_rules = False
+        return await super().exchange_info(symbol=symbol)
+
+
+def test_run_sends_start_message_while_rules_load(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _SlowRulesClient()
+    sent_during_load: list[bool] = []
+
+    class _ProbeNotifier(_Notifier):
+        async def send(self, text: str) -> None:
+            if text.startswith("Started:"):
+                sent_during_load.append(client.loading_rules)
+            await super().send(text)
+
+    trader = Trader(
+        settings=Settings(TRADING_MODE="dry_run", CONFIRM_LIVE_TRADING=""),
+        client=client,  # type: ignore[arg-type]
+        strategy=_NoopStrategy(),
+        notifier=_ProbeNotifier(),  # type: ignore[arg-type]
+    )
+
+    async def stop_tick(*, symbol: str, interval: str) -> float:
+        raise asyncio.CancelledError()
+
+    monkeypatch.setattr(trader, "_tick", stop_tick)
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(trader.run(symbol="ETHUSDT", interval="1m"))
+
+    assert sent_during_load == [True]
+    assert trader._rules is not None
@@ -1,11 +1,15 @@
 import asyncio
 from typing import Optional
 
+import pytest
+
 from money_dahong.engine.trader import (
     _ERROR_NOTIFY_COOLDOWN_SECONDS,
+    _TICK_ERROR_BACKOFF_MAX_SECONDS,
     _TICK_ERROR_BACKOFF_SECONDS,
     Trader,
 )
+from money_dahong.exchange import BinanceApiError
 from money_dahong.exchange.binance_spot import Kline
 from money_dahong.settings import Settings
 from money_dahong.strategies.base import Strategy, StrategyContext
@@ -52,8 +56,10 @@ def test_handle_tick_exception_respects_notify_cooldown(monkeypatch: object) ->
         notifier=notifier,  # type: ignore[arg-type]
     )
 
-    clock = {"now": 1000.0}
-    monkeypatch.setattr("money_dahong.engine.trader.time.time", lambda: clock["now"])
+    # Shortly after boot the monotonic clock is still below the cooldown.
+    clock = {"now": 10.0}
+    monkeypatch.setattr("money_dahong.engine.trader.time.monotonic", lambda: clock["now"])
+    monkeypatch.setattr("money_dahong.engine.trader.random.uniform", lambda a, b: 0.0)
 
     backoff_1 = asyncio.run(
         trader._handle_tick_exception(symbol="ETHUSDT", interval="1m", error=RuntimeError("boom1"))
@@ -68,8 +74,88 @@ def test_handle_tick_exception_respects_notify_cooldown(monkeypatch: object) ->
     )
 
     assert backoff_1 == _TICK_ERROR_BACKOFF_SECONDS
-    assert backoff_2 == _TICK_ERROR_BACKOFF_SECONDS
-    assert backoff_3 == _TICK_ERROR_BACKOFF_SECONDS
+    assert backoff_2 == _TICK_ERROR_BACKOFF_SECONDS * 2
+    assert backoff_3 == _TICK_ERROR_BACKOFF_SECONDS * 4
     assert len(notifier.messages) == 2
     assert "boom1" in notifier.messages[0]
+    assert "suppressed" not in notifier.messages[0]
     assert "boom3" in notifier.messages[1]
+    assert "(+1 suppressed)" in notifier.messages[1]
+
+
+def test_concurrent_ticks_do_not_overlap(monkeypatch: object) -> None:
+    settings = Settings(TRADING_MODE="dry_run", CONFIRM_LIVE_TRADING="")
+    trader = Trader(
+        settings=settings,
+        client=_NoopClient(),  # type: ignore[arg-type]
+        strategy=_NoopStrategy(),
+        notifier=_CollectingNotifier(),  # type: ignore[arg-type]
+    )
+    active = 0
+    max_active = 0
+
+    async def slow_tick(*, symbol: str, interval: str) -> float:
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        await asyncio.sleep(0)
+        active -= 1
+        return 1.0
+
+    monkeypatch.setattr(trader, "_tick_locked", slow_tick)  # type: ignore[attr-defined]
+
+    async def _run() -> None:
+        await asyncio.gather(*(trader._tick(symbol="ETHUSDT", interval="1m") for _ in range(3)))
+
+    asyncio.run(_run())
+
+    assert max_active == 1
+
+
+def test_tick_error_backoff_grows_is_capped_and_jittered(monkeypatch: pytest.MonkeyPatch) -> None:
+    trader = Trader(
+        settings=Settings(TRADING_MODE="dry_run", CONFIRM_LIVE_TRADING=""),
+        client=_NoopClient(),  # type: ignore[arg-type]
+        strategy=_NoopStrategy(),
+        notifier=_CollectingNotifier(),  # type: ignore[arg-type]
+    )
+    jitter = {"value": 0.0}
+    monkeypatch.setattr("money_dahong.engine.trader.random.uniform", lambda a, b: jitter["value"])
+
+    def _fail(error: Exception) -> float:
+        return asyncio.run(
+            trader._handle_tick_exception(symbol="ETHUSDT", interval="1m", error=error)
+        )
+
+    delays = [_fail(RuntimeError("down")) for _ in range(8)]
+    assert delays[:3] == [5.0, 10.0, 20.0]
+    assert delays[-1] == _TICK_ERROR_BACKOFF_MAX_SECONDS
+
+    # A rate-limit response goes straight to the cap, whatever the streak.
+    trader._tick_error_streak = 0
+    jitter["value"] = 1.5
+    rate_limited = _fail(BinanceApiError(status_code=429, payload={"code": -1003}))
+    assert rate_limited == _TICK_ERROR_BACKOFF_MAX_SECONDS + 1.5
+
+
+class _DisabledNotifier(_CollectingNotifier):
+    def enabled(self) -> bool:
+        return False
+
+
+def test_handle_tick_exception_skips_disabled_notifier(monkeypatch: pytest.MonkeyPatch) -> None:
+    notifier = _DisabledNotifier()
+    trader = Trader(
+        settings=Settings(TRADING_MODE="dry_run", CONFIRM_LIVE_TRADING=""),
+        client=_NoopClient(),  # type: ignore[arg-type]
+        strategy=_NoopStrategy(),
+        notifier=notifier,  # type: ignore[arg-type]
+    )
+    monkeypatch.setattr("money_dahong.engine.trader.random.uniform", lambda a, b: 0.0)
+
+    backoff = asyncio.run(
+        trader._handle_tick_exception(symbol="ETHUSDT", interval="1m", error=RuntimeError("boom"))
+    )
+
+    assert backoff == _TICK_ERROR_BACKOFF_SECONDS
+    assert notifier.messages == []
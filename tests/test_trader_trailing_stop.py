@@ -0,0 +1,59 @@
+from decimal import Decimal
+
+from money_dahong.engine.trader import Trader, _floor_to_step
+from money_dahong.math_utils import trailing_stop_hit
+from money_dahong.settings import Settings
+from money_dahong.types import OrderRequest
+
+
+def test_floor_to_step_rounds_down_to_whole_steps() -> None:
+    assert _floor_to_step(Decimal("1.23456"), Decimal("0.001")) == Decimal("1.234")
+    assert _floor_to_step(Decimal("0.0009"), Decimal("0.001")) == Decimal("0")
+    assert _floor_to_step(Decimal("5"), Decimal("0")) == Decimal("5")
+
+
+def test_trailing_stop_levels_follow_entry_and_peak() -> None:
+    trader = Trader(
+        settings=Settings(TRADING_MODE="dry_run", CONFIRM_LIVE_TRADING=""),
+        client=None,  # type: ignore[arg-type]
+        strategy=None,  # type: ignore[arg-type]
+        notifier=None,  # type: ignore[arg-type]
+        trailing_stop_enabled=True,
+        trailing_start_profit_pct=Decimal("30"),
+        trailing_drawdown_pct=Decimal("10"),
+    )
+    buy = OrderRequest(symbol="ETHUSDT", side="BUY", quote_order_qty=Decimal("25"))
+    trader._apply_fill_locally(order=buy, last_price=Decimal("100"))
+    trader._set_peak(Decimal("130"))
+    state = trader._state
+
+    assert state.arm_price == Decimal("130")
+    assert state.stop_price == Decimal("117")
+
+    def hit(price: str) -> bool:
+        return trailing_stop_hit(
+            arm_price=state.arm_price,
+            stop_price=state.stop_price,
+            peak_price=state.peak_price,
+            price=Decimal(price),
+        )
+
+    # Peak +30% arms the stop; a 10% pullback from the peak triggers it.
+    assert hit("117")
+    assert not hit("117.01")
+    assert not trailing_stop_hit(
+        arm_price=state.arm_price,
+        stop_price=Decimal("116.991"),
+        peak_price=Decimal("129.99"),
+        price=Decimal("100"),
+    )
+    assert not trailing_stop_hit(
+        arm_price=Decimal("0"),
+        stop_price=state.stop_price,
+        peak_price=state.peak_price,
+        price=Decimal("100"),
+    )
+
+    sell = OrderRequest(symbol="ETHUSDT", side="SELL", quantity=Decimal("0.25"))
+    trader._apply_fill_locally(order=sell, last_price=Decimal("117"))
+    assert state.arm_price == 0 and state.stop_price == 0